@@ -5,14 +5,19 @@ AI分析模块
 支持多种AI服务对提交记录进行多维度分析
 采用策略模式，支持可扩展的AI服务接入
 """
+import hashlib
 import json
 import logging
+import os
+import shutil
 import threading
+import time
 import queue
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any
 
 from config import AIConfig
+from utils.file_utils import atomic_write_text
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +38,16 @@ _SERVICE_LOADERS: Dict[str, tuple[str, str]] = {
 }
 
 
+# 各提供商实际使用的 SDK 模块（预热用）
+_SERVICE_SDK_MODULES: Dict[str, str] = {
+    "openai": "openai",
+    "anthropic": "anthropic",
+    "gemini": "google.genai",
+    "doubao": "openai",
+    "deepseek": "openai",
+}
+
+
 def register_ai_service(name: str, service_class: type):
     """注册AI服务类"""
     AI_SERVICES[name.lower()] = service_class
@@ -55,6 +70,25 @@ def get_ai_service(name: str):
     return AI_SERVICES[key]
 
 
+def prewarm_ai_service(name: str) -> None:
+    """
+    预先导入提供商模块及其 SDK（供后台线程调用）
+
+    之后的连接测试 / 分析直接命中 sys.modules；未安装 SDK 时静默跳过，
+    真正使用时再按原逻辑报错。
+    """
+    import importlib
+
+    key = name.lower()
+    try:
+        get_ai_service(key)
+        sdk_module = _SERVICE_SDK_MODULES.get(key)
+        if sdk_module:
+            importlib.import_module(sdk_module)
+    except (ImportError, ValueError):
+        logger.debug(f"预加载AI服务失败: {name}")
+
+
 # ============================================================================
 # 基类：BaseAIService
 # ============================================================================
@@ -518,6 +552,59 @@ def analyze_with_ai(commits_data: Dict[str, Any], ai_config: Dict[str, Any], tim
     return service.analyze(commits_data)
 
 
+# ============================================================================
+# 报告文件分析结果缓存
+# ============================================================================
+
+def _report_cache_path(report_content: str, ai_config: Dict[str, Any]) -> str:
+    """按 服务 + 模型 + base_url + 报告内容 的 sha256 计算缓存文件路径
+
+    model 为 None 时（未选模型，走默认模型）按空串参与计算；
+    base_url 参与计算，同名模型的不同 OpenAI 兼容端点不共用缓存。
+    """
+    digest = hashlib.sha256()
+    for part in (
+        (ai_config.get('service') or 'openai').lower(),
+        ai_config.get('model') or '',
+        (ai_config.get('base_url') or '').strip(),
+    ):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    digest.update(report_content.encode('utf-8'))
+    return os.path.join(AIConfig.RESULT_CACHE_DIR, f"{digest.hexdigest()}.json")
+
+
+def load_cached_report_analysis(report_content: str, ai_config: Dict[str, Any],
+                                ttl: int = AIConfig.RESULT_CACHE_TTL) -> Optional[Dict[str, Any]]:
+    """读取未过期的报告分析缓存；不存在、过期或损坏时返回 None"""
+    path = _report_cache_path(report_content, ai_config)
+    try:
+        if time.time() - os.path.getmtime(path) >= ttl:
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_cached_report_analysis(report_content: str, ai_config: Dict[str, Any],
+                                result: Dict[str, Any]) -> None:
+    """写入报告分析缓存；解析失败的结果不缓存，写入失败只记录日志"""
+    if 'error' in result or 'parse_error' in result:
+        return
+    path = _report_cache_path(report_content, ai_config)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        atomic_write_text(path, json.dumps(result, ensure_ascii=False))
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"写入AI分析缓存失败: {str(e)}")
+
+
+def clear_report_analysis_cache() -> None:
+    """删除全部报告分析缓存"""
+    shutil.rmtree(AIConfig.RESULT_CACHE_DIR, ignore_errors=True)
+
+
 def analyze_report_file(report_content: str, ai_config: Dict[str, Any], timeout: int = 120) -> Dict[str, Any]:
     """
     直接基于报告文件内容进行AI分析（不需要GitLab数据）
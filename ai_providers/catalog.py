@@ -4,7 +4,8 @@
 
 from __future__ import annotations
 
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 
 # service 键与 ai_analysis._SERVICE_LOADERS 一致
 PROVIDER_MODELS: Dict[str, List[str]] = {
@@ -70,6 +71,19 @@ PROVIDER_DEFAULT_MODEL: Dict[str, str] = {
 }
 
 
+# service -> (默认模型, 可选模型元组)；模块加载时构建一次，只读共享，GUI 切换厂商时直接取用
+_PROVIDER_CATALOG: Mapping[str, Tuple[str, Tuple[str, ...]]] = MappingProxyType({
+    key: (PROVIDER_DEFAULT_MODEL[key], tuple(models))
+    for key, models in PROVIDER_MODELS.items()
+})
+
+
+def get_provider_catalog(service: str) -> Tuple[str, Tuple[str, ...]]:
+    """返回 (默认模型, 可选模型元组)，未知厂商回退到 openai；结果为共享只读对象。"""
+    key = (service or "openai").lower()
+    return _PROVIDER_CATALOG.get(key, _PROVIDER_CATALOG["openai"])
+
+
 def get_provider_models(service: str) -> List[str]:
     key = (service or "openai").lower()
     return list(PROVIDER_MODELS.get(key, PROVIDER_MODELS["openai"]))
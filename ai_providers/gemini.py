@@ -84,12 +84,13 @@ class GeminiService(BaseAIService):
                     f"错误详情: {combined_msg}"
                 )
 
+        error_lower = error_msg.lower()
         if (
             "401" in error_msg
-            or "unauthorized" in error_msg.lower()
-            or "invalid" in error_msg.lower()
+            or "unauthorized" in error_lower
+            or "invalid" in error_lower
             or "API key" in error_msg
-            or "authentication" in error_msg.lower()
+            or "authentication" in error_lower
         ):
             return ValueError(
                 "API密钥无效或已过期。请检查您的 Google Gemini API Key 是否正确。"
@@ -99,14 +100,14 @@ class GeminiService(BaseAIService):
         is_network_error = (
             "RetryError" in error_type_name
             or "503" in error_msg
-            or "service unavailable" in error_msg.lower()
-            or "failed to connect" in error_msg.lower()
-            or "connection" in error_msg.lower()
-            or "network" in error_msg.lower()
-            or "timeout" in error_msg.lower()
-            or "unavailable" in error_msg.lower()
-            or "unreachable" in error_msg.lower()
-            or "getsockopt" in error_msg.lower()
+            or "service unavailable" in error_lower
+            or "failed to connect" in error_lower
+            or "connection" in error_lower
+            or "network" in error_lower
+            or "timeout" in error_lower
+            or "unavailable" in error_lower
+            or "unreachable" in error_lower
+            or "getsockopt" in error_lower
         )
 
         if is_network_error:
@@ -116,11 +117,11 @@ class GeminiService(BaseAIService):
             )
 
         if (
-            "quota" in error_msg.lower()
-            or "rate limit" in error_msg.lower()
+            "quota" in error_lower
+            or "rate limit" in error_lower
             or "配额" in error_msg
-            or "quota exceeded" in error_msg.lower()
-            or "resource_exhausted" in error_msg.lower()
+            or "quota exceeded" in error_lower
+            or "resource_exhausted" in error_lower
         ):
             suggestion = ""
             if "pro" in self.model.lower():
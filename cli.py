@@ -9,6 +9,8 @@ from datetime import datetime
 
 from gitlab_client import extract_gitlab_url, group_commits_by_date
 from report_generator import generate_markdown_log
+from utils.file_utils import atomic_write_text
+from utils.log_utils import setup_logging
 
 logger = logging.getLogger(__name__)
 
@@ -107,8 +109,7 @@ def run_single_repo_legacy(args, token: str) -> None:
 
     report_type = 'daily_report' if args.daily_report else 'commits'
     output_file = resolve_output_path(args.output, report_type, args.branch)
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(markdown_content)
+    atomic_write_text(output_file, markdown_content)
     logger.info(f"日志已保存到: {output_file}")
 
 
@@ -210,10 +211,7 @@ def run_cli(args: argparse.Namespace) -> None:
 
 
 def main(argv=None) -> None:
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-    )
+    setup_logging(logging.INFO)
     parser = build_argument_parser()
     args = parser.parse_args(argv)
     try:
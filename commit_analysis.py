@@ -18,29 +18,62 @@ logger = logging.getLogger(__name__)
 
 _commit_details_cache = {}
 _commit_stats_cache = {}
+_detailed_commit_cache = {}
 
 
 def clear_commit_cache():
-    """清空提交详情和统计缓存，在新一轮查询前调用"""
+    """清空提交详情、统计与分类缓存，在新一轮查询前调用"""
     _commit_details_cache.clear()
     _commit_stats_cache.clear()
+    _detailed_commit_cache.clear()
+    is_merge_commit.cache_clear()
+    analyze_commit_type.cache_clear()
 
 
+def _get_detailed_commit(project, commit):
+    """获取单个提交的完整对象；日报详情与代码行数统计共用同一次 API 调用"""
+    cache_key = (getattr(project, 'id', id(project)), commit.id)
+    detailed_commit = _detailed_commit_cache.get(cache_key)
+    if detailed_commit is None:
+        detailed_commit = project.commits.get(commit.id)
+        _detailed_commit_cache[cache_key] = detailed_commit
+    return detailed_commit
+
+
+@functools.lru_cache(maxsize=4096)
 def is_merge_commit(commit_message):
     """判断是否为 Merge / 分支同步类提交（不计入日报有效工作量）。"""
     msg = (commit_message or '').strip().lower()
-    if not msg:
-        return False
-    if msg.startswith('merge '):
-        return True
-    if msg.startswith('merge pull request') or msg.startswith('merge remote-tracking'):
-        return True
-    return 'merge branch' in msg
+    # 'merge ' 前缀已覆盖 merge pull request / merge remote-tracking
+    return msg.startswith('merge ') or 'merge branch' in msg
 
 
+# 约定式前缀 → 分类（各组前缀互不重叠，分支顺序不影响结果）
+_TYPE_PREFIX_RE = re.compile(
+    r'(?P<fix>fix|修复)|(?P<feat>feat|新增|添加)|(?P<refactor>refactor|重构)'
+    r'|(?P<chore>chore|删除|清理)|(?P<docs>docs|文档)|(?P<style>style|样式)'
+    r'|(?P<perf>perf|性能)|(?P<test>test|测试)'
+)
+_TYPE_PREFIX_HEAD = 16
+_FEAT_PREFIX_RE = re.compile(r'^feat(?:\([^)]*\))?:\s*')
+_COMMIT_TYPES = {
+    'fix': ('Bug修复', '🐛'),
+    'feat': ('功能开发', '✨'),
+    'refactor': ('代码重构', '♻️'),
+    'chore': ('代码维护', '🔧'),
+    'docs': ('文档更新', '📝'),
+    'style': ('样式调整', '💄'),
+    'perf': ('性能优化', '⚡'),
+    'test': ('测试相关', '✅'),
+}
+
+
+@functools.lru_cache(maxsize=4096)
 def analyze_commit_type(commit_message):
     """
     分析提交类型
+
+    结果只取决于提交信息，按信息缓存：日报与工时报告会对同一批提交重复分类。
     
     Args:
         commit_message: 提交信息
@@ -48,31 +81,20 @@ def analyze_commit_type(commit_message):
     Returns:
         tuple: (类型, emoji)
     """
-    message_lower = commit_message.lower()
-    
-    # 优先检查前缀（更准确）
-    if message_lower.startswith('fix') or message_lower.startswith('修复'):
-        return ('Bug修复', '🐛')
-    elif message_lower.startswith('feat') or message_lower.startswith('新增') or message_lower.startswith('添加'):
-        # feat:修复... 实际是修 bug，纠偏为 Bug修复
-        subject = re.sub(r'^feat(?:\([^)]*\))?:\s*', '', commit_message, count=1, flags=re.I).lstrip()
-        if subject.startswith('修复') or subject.lower().startswith('fix'):
-            return ('Bug修复', '🐛')
-        return ('功能开发', '✨')
-    elif message_lower.startswith('refactor') or message_lower.startswith('重构'):
-        return ('代码重构', '♻️')
-    elif message_lower.startswith('chore') or message_lower.startswith('删除') or message_lower.startswith('清理'):
-        return ('代码维护', '🔧')
-    elif message_lower.startswith('docs') or message_lower.startswith('文档'):
-        return ('文档更新', '📝')
-    elif message_lower.startswith('style') or message_lower.startswith('样式'):
-        return ('样式调整', '💄')
-    elif message_lower.startswith('perf') or message_lower.startswith('性能'):
-        return ('性能优化', '⚡')
-    elif message_lower.startswith('test') or message_lower.startswith('测试'):
-        return ('测试相关', '✅')
+    # 优先检查前缀（更准确）：一次锚定匹配代替逐个 startswith；
+    # 前缀最长 8 个字符，只对开头一小段小写，长提交信息无需整体 lower()
+    prefix = _TYPE_PREFIX_RE.match(commit_message[:_TYPE_PREFIX_HEAD].lower())
+    if prefix:
+        category = prefix.lastgroup
+        if category == 'feat':
+            # feat:修复... 实际是修 bug，纠偏为 Bug修复
+            subject = _FEAT_PREFIX_RE.sub('', commit_message.lower(), count=1).lstrip()
+            if subject.startswith(('修复', 'fix')):
+                category = 'fix'
+        return _COMMIT_TYPES[category]
     # 然后检查关键词
-    elif '修复' in commit_message or '解决' in commit_message or 'bug' in message_lower:
+    message_lower = commit_message.lower()
+    if '修复' in commit_message or '解决' in commit_message or 'bug' in message_lower:
         return ('Bug修复', '🐛')
     elif '新增' in commit_message or '添加' in commit_message:
         return ('功能开发', '✨')
@@ -115,7 +137,7 @@ def get_commit_details(project, commit, timeout=GitLabConfig.COMMIT_DETAIL_TIMEO
     
     details = {
         'full_message': full_message,
-        'short_message': full_message.split('\n')[0] if full_message else '',
+        'short_message': full_message.partition('\n')[0] if full_message else '',
         'changed_files': [],
         'stats': None,
         'author': getattr(commit, 'author_name', ''),
@@ -135,7 +157,7 @@ def get_commit_details(project, commit, timeout=GitLabConfig.COMMIT_DETAIL_TIMEO
         
         try:
             # 尝试获取详细的commit信息
-            detailed_commit = project.commits.get(commit.id)
+            detailed_commit = _get_detailed_commit(project, commit)
             
             # 获取文件变更列表（限制数量和大小）
             try:
@@ -249,7 +271,7 @@ def _get_commit_stats_uncached(project, commit):
                 }
 
         try:
-            detailed_commit = project.commits.get(commit.id)
+            detailed_commit = _get_detailed_commit(project, commit)
             if hasattr(detailed_commit, 'stats') and detailed_commit.stats:
                 stats = detailed_commit.stats
                 if isinstance(stats, dict):
@@ -361,7 +383,7 @@ def get_commit_display_info(project, commit):
         logger.debug(f"获取commit详情失败: {str(e)}")
         message = commit.message or ''
         return {
-            'short_message': message.split('\n')[0],
+            'short_message': message.partition('\n')[0],
             'full_message': message,
             'stats': None,
             'changed_files': [],
@@ -6,6 +6,7 @@
 所有散落在各模块中的硬编码常量统一在此管理，
 方便调整和维护，避免魔法数字。
 """
+import os
 
 
 class GitLabConfig:
@@ -16,6 +17,9 @@ class GitLabConfig:
     MAX_MESSAGE_LENGTH = 5000
     CHROME_SCREENSHOT_TIMEOUT = 60
     SUBPROCESS_TIMEOUT = 30
+    BRANCH_QUERY_WORKERS = 4      # 单项目未指定分支时并发查询分支的线程数
+    PROJECT_LIST_CACHE_TTL = 600  # 全量扫描时项目列表的会话内缓存时长（秒）
+    HTTP_POOL_MAXSIZE = 16        # 每个 GitLab 主机保持的 keep-alive 连接数上限（≥ 并发线程数）
 
 
 class ReportConfig:
@@ -36,6 +40,8 @@ class AIConfig:
     TEMPERATURE = 0.3
     TOP_P = 0.95
     CONNECTION_TEST_TIMEOUT = 10
+    RESULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".git2logs", "ai_cache")
+    RESULT_CACHE_TTL = 24 * 3600  # 报告文件 AI 分析结果的磁盘缓存时长（秒）
 
 
 class GUIConfig:
@@ -45,6 +51,7 @@ class GUIConfig:
     LOG_POLL_INTERVAL_MS = 80
     LOG_FLUSH_DELAY_MS = 150
     LOG_BATCH_MAX = 80
+    LOG_HISTORY_LIMIT = 5000     # 内存中保留的日志条数，面板被裁剪后可“加载历史日志”回看
     WINDOW_MIN_WIDTH = 760
     WINDOW_MIN_HEIGHT = 700
     WINDOW_DEFAULT_WIDTH = 900
@@ -54,6 +61,10 @@ class GUIConfig:
     WRAPLENGTH_SYNC_DELAY_MS = 120
     SIDEBAR_FRAME_WIDTH = 208
     HEADER_HEIGHT = 48
+    # 内容区滚动单位（像素），沿用 CTkScrollableFrame 的各平台取值
+    SCROLL_INCREMENT_WIN = 1     # Windows：每格滚轮 delta/6 个单位（120 → 20px）
+    SCROLL_INCREMENT_MAC = 8     # macOS：每个 delta 单位
+    SCROLL_INCREMENT_X11 = 30    # Linux：每格 Button-4/5
 
 
 class ImageConfig:
@@ -62,4 +73,8 @@ class ImageConfig:
     CHROME_VIRTUAL_TIME_BUDGET = 3000
     CHROME_WINDOW_HEIGHT = 6000
     CHROME_SCREENSHOT_TIMEOUT = 60
-    PLAYWRIGHT_WAIT_MS = 1000
+    PLAYWRIGHT_READY_TIMEOUT_MS = 5000  # 等待字体与图片加载完成的上限
+    JPEG_QUALITY = 85
+    RENDER_WORKERS = 4           # 批量转图片时 Chrome 子进程的并发上限
+    RENDER_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".git2logs", "image_cache")  # HTML→图片渲染结果缓存
+    RENDER_CACHE_TTL = 7 * 24 * 3600  # 渲染缓存超过该时长未被使用即清理（秒）
@@ -437,6 +437,7 @@ def parse_work_hours_md(content: str) -> dict:
 
     date_pattern = re.compile(r"\*\*统计日期\*\*[：:]\s*(\d{4}-\d{2}-\d{2})")
     total_hours_pattern = re.compile(r"\*\*标准工时\*\*[：:]\s*([\d.]+)")
+    project_cell_pattern = re.compile(r"\*\*(.+?)\*\*\s*\(([\d.]+)h\)")
 
     date_matches = list(date_pattern.finditer(content))
     if not date_matches:
@@ -485,7 +486,7 @@ def parse_work_hours_md(content: str) -> dict:
 
             # 判断是否有新项目名
             if project_cell:
-                proj_match = re.match(r"\*\*(.+?)\*\*\s*\(([\d.]+)h\)", project_cell)
+                proj_match = project_cell_pattern.match(project_cell)
                 if proj_match:
                     current_project = proj_match.group(1)
                     project_total = float(proj_match.group(2))
@@ -11,7 +11,7 @@ import traceback
 from datetime import datetime
 from pathlib import Path
 
-from image_converter import convert_html_to_image
+from image_converter import convert_html_files_to_images
 from report_html import find_markdown_files, generate_html_report, parse_daily_report
 
 __all__ = [
@@ -49,6 +49,7 @@ if __name__ == "__main__":
             print("  python3 generate_report_image.py <markdown文件或目录>")
         sys.exit(1)
 
+    render_jobs = []
     for md_file in md_files:
         print(f"\n处理文件: {md_file}")
         print("=" * 60)
@@ -58,14 +59,19 @@ if __name__ == "__main__":
             html_file = md_file.parent / f"{base_name}.html"
             png_file = md_file.parent / f"{base_name}.png"
             generate_html_report(data, str(html_file))
-            print("\n正在将 HTML 转换为图片...")
-            if convert_html_to_image(str(html_file), str(png_file)):
-                print(f"✓ 图片已生成: {png_file}")
-            else:
-                print(f"⚠ HTML 转图片失败，HTML 已生成: {html_file}")
+            render_jobs.append((html_file, png_file))
         except Exception as e:
             print(f"✗ 处理文件 {md_file} 时出错: {e}")
             traceback.print_exc()
 
+    if render_jobs:
+        print(f"\n正在将 {len(render_jobs)} 个 HTML 转换为图片...")
+        results = convert_html_files_to_images(render_jobs)
+        for (html_file, png_file), ok in zip(render_jobs, results):
+            if ok:
+                print(f"✓ 图片已生成: {png_file}")
+            else:
+                print(f"⚠ HTML 转图片失败，HTML 已生成: {html_file}")
+
     print("\n" + "=" * 60)
     print(f"处理完成，共处理 {len(md_files)} 个文件")
@@ -37,6 +37,7 @@ from report_generator import (
     generate_ai_analysis_report,
     generate_daily_report,
 )
+from utils.log_utils import setup_logging
 
 try:
     import gitlab  # pyright: ignore[reportMissingImports]
@@ -45,10 +46,7 @@ except ImportError:
     print("请运行: pip install python-gitlab")
     sys.exit(1)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-)
+setup_logging(logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -8,6 +8,9 @@ GitLab 客户端模块
 """
 import sys
 import os
+import re
+import time
+import hashlib
 import logging
 from datetime import datetime
 from collections import defaultdict
@@ -26,6 +29,32 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# 作者查询无结果时的回退格式："Name <email>" 一次匹配拆出名称与邮箱
+_AUTHOR_FORMAT_RE = re.compile(r'(?P<name>[^<]*)(?:<(?P<email>[^>]+)>)?')
+
+
+def _split_author(author_name):
+    """拆分 "Name <email>" 形式的作者，返回 (名称, 邮箱或 None)"""
+    match = _AUTHOR_FORMAT_RE.match(author_name)
+    return match.group('name').strip(), match.group('email')
+
+
+def _create_http_session():
+    """
+    创建供 python-gitlab 使用的 requests 会话
+
+    连接池上限不低于并发查询线程数，全量扫描与分支并发查询时
+    所有线程都能复用 keep-alive 连接，不会因池满而反复握手。
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=GitLabConfig.HTTP_POOL_MAXSIZE)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
 
 def create_gitlab_client(gitlab_url, token=None):
     """
@@ -42,7 +71,7 @@ def create_gitlab_client(gitlab_url, token=None):
         logger.warning("未提供访问令牌，可能无法访问私有仓库")
     
     try:
-        gl = gitlab.Gitlab(gitlab_url, private_token=token)
+        gl = gitlab.Gitlab(gitlab_url, private_token=token, session=_create_http_session())
         gl.auth()  # 验证连接
         logger.info(f"成功连接到 GitLab 实例: {gitlab_url}")
         return gl
@@ -151,7 +180,8 @@ def _get_priority_branches(branches):
     return priority_branches, other_branches
 
 
-def get_commits_by_author(project, author_name, since_date=None, until_date=None, branch=None):
+def get_commits_by_author(project, author_name, since_date=None, until_date=None, branch=None,
+                          branch_workers=GitLabConfig.BRANCH_QUERY_WORKERS):
     """
     获取指定提交者的所有提交
     
@@ -161,6 +191,7 @@ def get_commits_by_author(project, author_name, since_date=None, until_date=None
         since_date: 起始日期（可选，格式：YYYY-MM-DD）
         until_date: 结束日期（可选，格式：YYYY-MM-DD）
         branch: 分支名称（可选，默认查询所有分支）
+        branch_workers: 未指定分支时并发查询分支的线程数（1 为串行）
     
     Returns:
         list: 提交列表
@@ -214,11 +245,9 @@ def get_commits_by_author(project, author_name, since_date=None, until_date=None
                 if not page_commits:
                     # 如果第一页就没有结果，尝试不同的 author 格式
                     if page == 1:
-                        import re
                         # 尝试提取邮箱（如果格式是 "Name <email>"）
-                        email_match = re.search(r'<([^>]+)>', author_name)
-                        if email_match:
-                            email_only = email_match.group(1)
+                        name_only, email_only = _split_author(author_name)
+                        if email_only:
                             logger.info(f"尝试使用邮箱格式查询: {email_only}")
                             params_alt = params.copy()
                             params_alt['author'] = email_only
@@ -235,25 +264,21 @@ def get_commits_by_author(project, author_name, since_date=None, until_date=None
                                 logger.debug(f"使用邮箱格式查询失败: {e}")
                         
                         # 如果邮箱格式没找到，尝试只使用名称部分（如果格式是 "Name <email>"）
-                        if not page_commits:
-                            name_match = re.match(r'^([^<]+)', author_name)
-                            if name_match:
-                                name_only = name_match.group(1).strip()
-                                if name_only and name_only != author_name:
-                                    logger.info(f"尝试使用名称格式查询: '{name_only}'")
-                                    params_alt = params.copy()
-                                    params_alt['author'] = name_only
-                                    try:
-                                        page_commits_alt = project.commits.list(**params_alt)
-                                        if page_commits_alt:
-                                            logger.info(f"✓ 使用名称格式找到 {len(page_commits_alt)} 条提交")
-                                            page_commits = page_commits_alt
-                                            params = params_alt
-                                            # 找到提交后，继续处理，不要 break
-                                        else:
-                                            logger.info(f"✗ 使用名称格式未找到提交")
-                                    except Exception as e:
-                                        logger.debug(f"使用名称格式查询失败: {e}")
+                        if not page_commits and name_only and name_only != author_name:
+                            logger.info(f"尝试使用名称格式查询: '{name_only}'")
+                            params_alt = params.copy()
+                            params_alt['author'] = name_only
+                            try:
+                                page_commits_alt = project.commits.list(**params_alt)
+                                if page_commits_alt:
+                                    logger.info(f"✓ 使用名称格式找到 {len(page_commits_alt)} 条提交")
+                                    page_commits = page_commits_alt
+                                    params = params_alt
+                                    # 找到提交后，继续处理，不要 break
+                                else:
+                                    logger.info(f"✗ 使用名称格式未找到提交")
+                            except Exception as e:
+                                logger.debug(f"使用名称格式查询失败: {e}")
                         
                         # 如果所有格式都失败，给出提示并退出
                         if not page_commits:
@@ -315,7 +340,8 @@ def get_commits_by_author(project, author_name, since_date=None, until_date=None
         # 用于跟踪是否在优先分支中找到了提交
         found_in_priority = False
         
-        for idx, branch_obj in enumerate(ordered_branches, 1):
+        def query_branch(idx, branch_obj):
+            """查询单个分支的提交（含分页）；出错时返回空列表。"""
             try:
                 branch_params = {
                     'author': author_name,
@@ -376,10 +402,8 @@ def get_commits_by_author(project, author_name, since_date=None, until_date=None
                     if not page_commits:
                         # 如果第一页第一个分支没有结果，尝试不同的 author 格式
                         if idx == 1 and branch_page == 1:
-                            import re
-                            email_match = re.search(r'<([^>]+)>', author_name)
-                            if email_match:
-                                email_only = email_match.group(1)
+                            name_only, email_only = _split_author(author_name)
+                            if email_only:
                                 logger.info(f"尝试使用邮箱格式查询分支 '{branch_obj.name}': {email_only}")
                                 branch_params_alt = branch_params.copy()
                                 branch_params_alt['author'] = email_only
@@ -389,9 +413,7 @@ def get_commits_by_author(project, author_name, since_date=None, until_date=None
                                     page_commits = page_commits_alt
                                     branch_params = branch_params_alt
                             # 尝试只使用名称部分
-                            name_match = re.match(r'^([^<]+)', author_name)
-                            if name_match and not email_match:
-                                name_only = name_match.group(1).strip()
+                            if name_only and name_only != author_name and not email_only:
                                 logger.info(f"尝试使用名称格式查询分支 '{branch_obj.name}': {name_only}")
                                 branch_params_alt = branch_params.copy()
                                 branch_params_alt['author'] = name_only
@@ -419,20 +441,37 @@ def get_commits_by_author(project, author_name, since_date=None, until_date=None
                         break
                     
                     branch_page += 1
-                
-                if branch_commits:
-                    logger.info(f"[{idx}/{len(ordered_branches)}] 分支 '{branch_obj.name}': 找到 {len(branch_commits)} 条提交")
-                    all_commits.extend(branch_commits)
-                    # 如果在优先分支中找到提交，标记一下（但不跳过其他分支，确保不遗漏）
-                    if branch_obj in priority_branches:
-                        found_in_priority = True
-                else:
-                    # 调试：如果没找到提交，记录一下（仅在调试模式下）
-                    logger.debug(f"[{idx}/{len(ordered_branches)}] 分支 '{branch_obj.name}': 未找到提交")
+                return branch_commits
             except Exception as e:
                 # 忽略权限不足等错误
                 logger.debug(f"查询分支 '{branch_obj.name}' 时出错: {str(e)}")
-                continue
+                return []
+
+        # 第一个分支串行查询（含作者格式调试与回退），其余分支并发查询，结果按原顺序合并
+        branch_results = []
+        if ordered_branches:
+            branch_results.append(query_branch(1, ordered_branches[0]))
+        rest_branches = ordered_branches[1:]
+        if branch_workers > 1 and len(rest_branches) > 1:
+            with ThreadPoolExecutor(max_workers=min(branch_workers, len(rest_branches))) as executor:
+                branch_results.extend(executor.map(
+                    query_branch, range(2, len(ordered_branches) + 1), rest_branches,
+                ))
+        else:
+            branch_results.extend(
+                query_branch(idx, branch_obj) for idx, branch_obj in enumerate(rest_branches, 2)
+            )
+
+        for idx, (branch_obj, branch_commits) in enumerate(zip(ordered_branches, branch_results), 1):
+            if branch_commits:
+                logger.info(f"[{idx}/{len(ordered_branches)}] 分支 '{branch_obj.name}': 找到 {len(branch_commits)} 条提交")
+                all_commits.extend(branch_commits)
+                # 如果在优先分支中找到提交，标记一下（但不跳过其他分支，确保不遗漏）
+                if branch_obj in priority_branches:
+                    found_in_priority = True
+            else:
+                # 调试：如果没找到提交，记录一下（仅在调试模式下）
+                logger.debug(f"[{idx}/{len(ordered_branches)}] 分支 '{branch_obj.name}': 未找到提交")
         
         # 去重（同一个提交可能在多个分支上）
         seen_ids = set()
@@ -544,7 +583,96 @@ def get_all_projects(gl, owned=False, membership=False):
         raise
 
 
-def scan_all_projects(gl, author_name, since_date=None, until_date=None, branch=None, max_workers=10):
+def token_digest(token):
+    """访问令牌的短摘要，用作缓存键，避免在缓存键中保存明文令牌"""
+    return hashlib.blake2b((token or "").encode("utf-8"), digest_size=8).hexdigest()
+
+
+# (GitLab URL, 令牌摘要) -> (获取时间, 项目列表)；同一会话内重复扫描时复用
+_project_list_cache = {}
+
+
+def clear_project_list_cache():
+    """清空项目列表缓存（用户要求刷新项目列表时调用）"""
+    _project_list_cache.clear()
+
+
+def get_all_projects_cached(gl, gitlab_url, token=None, ttl=GitLabConfig.PROJECT_LIST_CACHE_TTL):
+    """
+    获取所有项目，按 (gitlab_url, 令牌摘要) 缓存 ttl 秒
+    """
+    key = (gitlab_url, token_digest(token))
+    now = time.monotonic()
+    cached = _project_list_cache.get(key)
+    if cached and now - cached[0] < ttl:
+        logger.info(f"使用缓存的项目列表，共 {len(cached[1])} 个项目")
+        return cached[1]
+
+    projects = get_all_projects(gl)
+    _project_list_cache[key] = (now, projects)
+    return projects
+
+
+# (GitLab 实例, 项目 ID, 提交者, 分支, 起始日期, 结束日期) -> 上次获取的提交列表；
+# 同一会话内重复扫描时增量补拉。项目 ID 只在单个实例内唯一，切换 URL / 令牌后不能复用
+_commit_list_cache = {}
+
+
+def gitlab_instance_key(gl, gitlab_url=None, token=None):
+    """
+    GitLab 实例标识 (URL, 令牌摘要)，用作增量提交缓存键的一部分
+
+    未显式传入时取客户端自身的 url / private_token。
+    """
+    if gitlab_url is None:
+        gitlab_url = getattr(gl, 'url', None)
+    if token is None:
+        token = getattr(gl, 'private_token', None)
+    url = gitlab_url.rstrip('/') if isinstance(gitlab_url, str) else ''
+    return (url, token_digest(token if isinstance(token, str) else None))
+
+
+def clear_commit_list_cache():
+    """清空增量提交缓存（下次扫描完整重新获取）"""
+    _commit_list_cache.clear()
+
+
+def get_commits_incremental(project, author_name, since_date=None, until_date=None, branch=None,
+                            instance_key=None, **kwargs):
+    """
+    带会话内增量缓存的 get_commits_by_author
+
+    同一查询再次执行时，只从已缓存提交中最新的本地日历日起重新拉取，
+    与缓存中更早的提交按 id 合并；最新那一天整天重拉，当天新增或改写的提交不会遗漏。
+    instance_key 为 gitlab_instance_key() 的结果，区分不同 GitLab 实例下 ID 相同的项目。
+    """
+    key = (instance_key, project.id, author_name, branch, since_date, until_date)
+    cached = _commit_list_cache.get(key)
+    if not cached:
+        commits = get_commits_by_author(
+            project, author_name,
+            since_date=since_date, until_date=until_date, branch=branch, **kwargs,
+        )
+        _commit_list_cache[key] = commits
+        return commits
+
+    newest_day = max(to_local_date_str(c.committed_date) for c in cached)
+    logger.debug(f"增量获取 {project.path_with_namespace}：从 {newest_day} 起重新拉取")
+    fetched = get_commits_by_author(
+        project, author_name,
+        since_date=newest_day, until_date=until_date, branch=branch, **kwargs,
+    )
+    fetched_ids = {c.id for c in fetched}
+    commits = fetched + [
+        c for c in cached
+        if c.id not in fetched_ids and to_local_date_str(c.committed_date) < newest_day
+    ]
+    _commit_list_cache[key] = commits
+    return commits
+
+
+def scan_all_projects(gl, author_name, since_date=None, until_date=None, branch=None, max_workers=10,
+                      progress_callback=None, projects=None, gitlab_url=None, token=None):
     """
     扫描所有项目，查找指定提交者的提交
     
@@ -555,6 +683,10 @@ def scan_all_projects(gl, author_name, since_date=None, until_date=None, branch=
         until_date: 结束日期（可选）
         branch: 分支名称（可选）
         max_workers: 最大并发线程数（默认：10）
+        progress_callback: 进度回调 (已完成项目数, 项目总数)，每处理完一个项目调用一次（可选）
+        projects: 预先获取的项目列表（可选，默认实时获取全部项目）
+        gitlab_url: GitLab 地址（可选，默认取 gl.url），用于区分增量提交缓存
+        token: 访问令牌（可选，默认取 gl.private_token），用于区分增量提交缓存
     
     Returns:
         dict: 按项目分组的提交字典，格式：{project_path: {'project': project, 'commits': commits}}
@@ -562,10 +694,12 @@ def scan_all_projects(gl, author_name, since_date=None, until_date=None, branch=
     logger.info(f"开始扫描所有项目，查找提交者 '{author_name}' 的提交...")
     
     # 获取所有项目
-    projects = get_all_projects(gl)
+    if projects is None:
+        projects = get_all_projects(gl)
     
     results = {}
     total_commits = 0
+    instance_key = gitlab_instance_key(gl, gitlab_url, token)
     
     # 使用线程池并行处理项目
     def process_project(project):
@@ -573,12 +707,15 @@ def scan_all_projects(gl, author_name, since_date=None, until_date=None, branch=
         project_path = project.path_with_namespace
         try:
             # 获取该项目的提交
-            commits = get_commits_by_author(
+            # 项目间已并发，项目内分支串行查询，避免线程数相乘
+            commits = get_commits_incremental(
                 project,
                 author_name,
                 since_date=since_date,
                 until_date=until_date,
-                branch=branch
+                branch=branch,
+                instance_key=instance_key,
+                branch_workers=1,
             )
             
             if commits:
@@ -623,6 +760,12 @@ def scan_all_projects(gl, author_name, since_date=None, until_date=None, branch=
                     logger.debug(f"[{completed}/{len(projects)}] {project_path}: 未找到提交")
             except Exception as e:
                 logger.warning(f"[{completed}/{len(projects)}] {project_path}: 处理失败: {str(e)}")
+
+            if progress_callback:
+                try:
+                    progress_callback(completed, len(projects))
+                except Exception:
+                    logger.debug("扫描进度回调执行失败")
     
     logger.info(f"扫描完成，共在 {len(results)} 个项目中找到 {total_commits} 条提交")
     return results
@@ -18,7 +18,7 @@ except ImportError:
 from tkinter import messagebox, filedialog
 import threading
 import queue
-import traceback
+from collections import deque
 from datetime import datetime
 
 import logging
@@ -37,7 +37,7 @@ from models import (
 
 logger = logging.getLogger(__name__)
 
-from gui.styles import UIStyles, resource_path, get_script_path, _resolve_monospace_font, _ctk_ui_font
+from gui.styles import UIStyles, resource_path, get_script_path, _resolve_monospace_font, _ctk_ui_font, _flat_line
 from gui.service_bridge import ServiceBridgeMixin
 
 from gui.layout_mixin import LayoutMixin
@@ -69,17 +69,33 @@ class Git2LogsGUI(
             self._pending_ai_data = None
             self._log_count = 0
             self._log_queue = queue.Queue()
+            self._gui_log_handler = None  # 常驻 root logger 的 GUI 日志 handler（首次生成时创建）
             self._is_running = False  # 跟踪生成任务运行状态
             self._ai_is_running = False  # 跟踪AI分析任务运行状态
+            self._scan_progress = (0, 0)  # 全量扫描最新进度 (已完成, 总数)
+            self._scan_progress_scheduled = False
             self._work_hours_data = None  # 缓存工时数据，供Excel导出使用
             self._service = Git2LogsService()
+            # 调试日志（配置回显、日期解析细节）默认关闭，设置 GIT2LOGS_DEBUG=1 开启
+            self._debug_enabled = os.environ.get("GIT2LOGS_DEBUG") == "1"
             self._project_checkboxes: dict = {}  # 项目名 -> BooleanVar
+            self._last_ai_service = None  # 模型下拉列表当前对应的 AI 厂商
+            self._prewarmed_ai_services = set()  # 已在后台预加载 SDK 的 AI 厂商
+            self._project_cb_pool: list = []  # 可复用的 (CTkCheckBox, BooleanVar)
+            self._project_empty_label = None  # 无项目时的提示标签（复用）
             self._validation_labels: dict = {}  # 字段名 -> 校验提示 CTkLabel
             self._log_collapsed = False
             self._log_filter_level = "全部"
-            self._log_pending = []
+            # 待写日志有界缓冲：突发日志填满时立即刷新到面板，不丢弃条目
+            self._log_pending = deque(maxlen=GUIConfig.LOG_LINE_LIMIT)
             self._log_flush_scheduled = False
+            # 已写入面板的日志条目（含被裁剪的旧条目），供“加载历史日志”重新载入
+            self._log_history = deque(maxlen=GUIConfig.LOG_HISTORY_LIMIT)
             self._log_omitted_total = 0
+            self._log_history_expanded = False  # 已载入历史日志：裁剪上限放宽到 LOG_HISTORY_LIMIT，直到清空
+            self._log_at_bottom = True  # 日志视图是否停在底部（决定写入后是否自动滚动）
+            self._ts_cache_sec = 0  # 日志时间戳缓存对应的整秒
+            self._ts_cache_str = ""
             self._current_theme = "dark"
             # 主题切换时需同步的控件（由各 Tab 构建时登记）
             self._theme_panels_main: list = []
@@ -120,14 +136,17 @@ class Git2LogsGUI(
             main_container = ctk.CTkFrame(root, fg_color=self.bg_main, corner_radius=0)
             main_container.pack(fill="both", expand=True, padx=0, pady=0)
             self._main_container = main_container
-            
-            # 立即更新，显示框架
-            root.update_idletasks()
-            root.update()
 
             # 存储标签页引用
             self.tab_frames = {}
             self.current_tab = None
+            # 标签页按需构建：首次切换到该页（或空闲时）才创建控件
+            self._tab_builders = {
+                "GitLab配置": self._create_tab1_gitlab_config,
+                "日期和输出": self._create_tab2_date_output,
+                "AI分析": self._create_tab3_ai_analysis,
+                "Excel导出": self._create_tab4_excel_export,
+            }
             self._sidebar_btns = {}
 
             # ── 底部固定操作按钮容器 ───────────────────────
@@ -150,7 +169,7 @@ class Git2LogsGUI(
             )
             self._sidebar_frame.pack(side="left", fill="both", expand=True)
             self._sidebar_frame.pack_propagate(False)
-            self._sidebar_border = ctk.CTkFrame(sidebar_wrapper, fg_color=self.styles.colors['border'], width=1, corner_radius=0)
+            self._sidebar_border = _flat_line(sidebar_wrapper, self.styles.colors['border'], width=1)
             self._sidebar_border.pack(side="right", fill="y")
             self._sidebar_wrapper = sidebar_wrapper
 
@@ -185,23 +204,12 @@ class Git2LogsGUI(
                                                  anchor="w")
             self._topbar_subtitle.pack(anchor="w")
 
-            topbar_sep = ctk.CTkFrame(right_panel, fg_color=self.styles.colors['border'], height=1, corner_radius=0)
+            topbar_sep = _flat_line(right_panel, self.styles.colors['border'], height=1)
             topbar_sep.pack(fill="x", side="top")
             self._topbar_sep = topbar_sep
 
-            # 滚动内容容器
-            self.scroll_container = ctk.CTkScrollableFrame(right_panel,
-                                                           fg_color=self.styles.colors['bg_main'],
-                                                           corner_radius=0)
-            self.scroll_container.pack(fill="both", expand=True, padx=0, pady=0)
-
-            self.content_container = self.scroll_container
-
-            try:
-                self.scroll_container.configure(scrollbar_button_color=self.styles.colors['bg_main'],
-                                                scrollbar_button_hover_color=self.styles.colors['bg_main'])
-            except Exception:
-                logger.debug("配置滚动容器滚动条颜色失败")
+            # 滚动内容容器（原生 Canvas + 内层 Frame，仅滚轮滚动）
+            self.content_container = self._create_scroll_area(right_panel)
 
             # 日志区域（底部）
             self._create_log_area(right_panel)
@@ -209,16 +217,11 @@ class Git2LogsGUI(
             # 延迟并批量创建标签页内容（消除渲染毛刺）
             def delayed_init():
                 try:
-                    # 分步构建 UI 组件，但不执行强制 update
-                    self._create_tab1_gitlab_config()
-                    self._create_tab2_date_output()
-                    self._create_tab3_ai_analysis()
-                    self._create_tab4_excel_export()
+                    # 首屏只构建默认标签页，其余标签页在空闲时逐个构建
                     self._create_bottom_actions()
-                    # 侧边栏（Tab内容建立后创建，确保 tab_frames 存在）
                     self._create_sidebar(self._sidebar_frame)
 
-                    # 默认显示第一个标签页
+                    # 默认显示第一个标签页（首次切换时构建）
                     self._switch_tab("GitLab配置")
 
                     # 关键一次性静默同步
@@ -235,7 +238,9 @@ class Git2LogsGUI(
                     self.log("欢迎使用 MIZUKI-GITLAB工具箱！", "info")
                     self.log("请填写参数后点击'▶ 生成日志'按钮。", "info")
                     self.root.after(GUIConfig.WRAPLENGTH_SYNC_DELAY_MS, self._sync_responsive_wraplengths)
+                    self.root.after_idle(self._build_pending_tabs)
                 except Exception as e:
+                    import traceback
                     self.log(f"初始化错误: {str(e)}", "error")
                     self.log(traceback.format_exc(), "error")
             
@@ -243,8 +248,10 @@ class Git2LogsGUI(
             root.after(GUIConfig.INIT_DELAY_MS, delayed_init)
             
         except Exception as e:
+            # 仅失败分支才导入 traceback 并格式化堆栈；控制台输出交给 logging
+            import traceback
+            logger.exception("界面初始化失败")
             error_msg = f"界面初始化失败: {str(e)}\n\n{traceback.format_exc()}"
-            print(error_msg)
             try:
                 messagebox.showerror("初始化错误", error_msg)
             except Exception:
@@ -5,11 +5,12 @@ import json
 import logging
 import os
 import queue
+import re
 import sys
 import threading
+import time
 import traceback
-from datetime import datetime
-from tkinter import filedialog, messagebox
+from tkinter import TclError, filedialog, messagebox
 
 try:
     import customtkinter as ctk
@@ -26,17 +27,65 @@ from models import (
     ReportGenerationError,
     ReportParams,
 )
+from report_generator import parse_report_meta
 from service import Git2LogsService
+from utils.date_utils import report_date_prefix
 from gui.styles import (
     UIStyles,
     _ctk_ui_font,
     get_script_path,
     resource_path,
     _resolve_monospace_font,
+    _frozen_layout,
+    _set_combo_values,
 )
 
 logger = logging.getLogger(__name__)
 
+# 日志类型 -> (行内前缀, 着色标签)
+_LOG_PREFIX_MAP = {
+    "error": ("[ERROR]", "error"),
+    "success": ("[SUCCESS]", "success"),
+    "warning": ("[WARNING]", "warning"),
+    "info": ("[INFO]", "info"),
+}
+
+# AI 连接测试错误文本 -> 提示（按顺序匹配，先命中者优先）
+_AI_TEST_ERROR_PATTERNS = (
+    (re.compile(r"401|unauthorized|invalid", re.I), "API密钥无效"),
+    (re.compile(r"connection|network|timeout", re.I), "网络连接失败"),
+    (re.compile(r"splitlines"), "连接失败: 可能是网络拦截或代理问题"),
+)
+
+
+def _exception_status_code(exc):
+    """从 SDK 异常上取 HTTP 状态码（status_code / code / status，仅接受整数）；取不到返回 None。"""
+    for attr in ("status_code", "code", "status"):
+        value = getattr(exc, attr, None)
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+    return None
+
+
+def _coalesce_log_entries(entries):
+    """将同一批次内连续重复的日志合并为一条，末尾标注重复次数（如 “(×20)”）。"""
+    merged = []
+    run_body = None
+    run_count = 0
+    for entry in entries:
+        log_message, timestamp, prefix, color_tag = entry
+        body = log_message[len(timestamp):]
+        if body == run_body:
+            run_count += 1
+            first_ts = merged[-1][1]
+            merged[-1] = (f"{first_ts}{body[:-1]} (×{run_count})\n", first_ts, prefix, color_tag)
+            continue
+        run_body = body
+        run_count = 1
+        merged.append(entry)
+    return merged
+
+
 class HandlersMixin:
     def _toggle_theme(self):
         """切换深浅主题"""
@@ -241,35 +290,65 @@ class HandlersMixin:
         "Excel导出": ("Excel 导出", "生成工时报表"),
     }
 
+    def _ensure_tab(self, tab_name):
+        """标签页尚未构建时立即构建（构建后默认隐藏）。"""
+        if tab_name in self.tab_frames:
+            return
+        builder = self._tab_builders.get(tab_name)
+        if builder is not None:
+            with _frozen_layout(self.content_container):
+                builder()
+
+    def _ensure_all_tabs(self):
+        """确保所有标签页已构建，供需要读取各页 Tk 变量的操作调用。"""
+        for tab_name in self._tab_builders:
+            self._ensure_tab(tab_name)
+
+    def _build_pending_tabs(self):
+        """空闲时每次构建一个未创建的标签页，避免一次性阻塞事件循环。"""
+        for tab_name in self._tab_builders:
+            if tab_name not in self.tab_frames:
+                try:
+                    self._ensure_tab(tab_name)
+                except Exception:
+                    logger.debug(f"后台构建标签页 {tab_name} 失败")
+                    return
+                self.root.after_idle(self._build_pending_tabs)
+                return
+
     def _switch_tab(self, tab_name):
         """切换标签页"""
         try:
-            for name, frame in self.tab_frames.items():
-                frame.pack_forget()
-
-            if tab_name in self.tab_frames:
-                self.tab_frames[tab_name].pack(fill="x", expand=False, padx=20, pady=20)
-                self.current_tab = tab_name
-
-            # 更新 topbar 标题
-            if hasattr(self, '_topbar_title'):
-                meta = self._TOPBAR_META.get(tab_name, (tab_name, ""))
-                self._topbar_title.configure(text=meta[0])
-                self._topbar_subtitle.configure(text=meta[1])
-
-            # 更新侧边栏导航项选中态
-            if hasattr(self, '_sidebar_btns'):
-                self._apply_sidebar_pill_style()
+            self._ensure_tab(tab_name)
+            previous_tab = self.current_tab
+            # 同页重入时页面已在显示，不再重复 pack 触发几何计算；
+            # 换页期间冻结滚动容器几何传播，隐藏旧页与显示新页只触发一次重新测量
+            if previous_tab != tab_name and tab_name in self.tab_frames:
+                with _frozen_layout(self.content_container):
+                    # 只隐藏当前显示的页，避免对所有页逐个 pack_forget
+                    if previous_tab in self.tab_frames:
+                        self.tab_frames[previous_tab].pack_forget()
+                    self.tab_frames[tab_name].pack(fill="x", expand=False, padx=20, pady=20)
+                    self.current_tab = tab_name
+
+            # 同页重入（如主题切换）时标题不变，导航项已由 _refresh_chrome_for_theme 统一刷新
+            if previous_tab != tab_name:
+                # 更新 topbar 标题
+                if hasattr(self, '_topbar_title'):
+                    meta = self._TOPBAR_META.get(tab_name, (tab_name, ""))
+                    self._topbar_title.configure(text=meta[0])
+                    self._topbar_subtitle.configure(text=meta[1])
+
+                # 更新侧边栏导航项选中态：换页只刷新新旧两项，首次显示刷新全部
+                if hasattr(self, '_sidebar_btns'):
+                    if previous_tab:
+                        self._apply_sidebar_pill_style(tab_names=(previous_tab, tab_name))
+                    else:
+                        self._apply_sidebar_pill_style()
             
-            # 立即滚动到顶部（兼容不同版本的 CTkScrollableFrame）
+            # 立即滚动到顶部
             if hasattr(self, 'scroll_container'):
-                try:
-                    if hasattr(self.scroll_container, '_parent_canvas'):
-                        self.scroll_container._parent_canvas.yview_moveto(0)
-                    elif hasattr(self.scroll_container, '_canvas'):
-                        self.scroll_container._canvas.yview_moveto(0)
-                except Exception:
-                    logger.debug("滚动容器滚动到顶部失败")
+                self.scroll_container.yview_moveto(0)
 
             # 切换到 Excel 导出页时刷新状态
             if tab_name == "Excel导出":
@@ -281,21 +360,32 @@ class HandlersMixin:
     def _update_ai_models(self, *args):
         """更新AI模型列表"""
         try:
-            from ai_providers.catalog import (
-                get_provider_default_model,
-                get_provider_models,
-            )
+            from ai_providers.catalog import get_provider_catalog
 
             service = self.ai_service.get()
-            models = get_provider_models(service)
-            default_model = get_provider_default_model(service)
+            # 厂商未变化时不重建下拉列表
+            if service == self._last_ai_service:
+                return
+            self._last_ai_service = service
+            self._prewarm_ai_service(service)
+
+            default_model, models = get_provider_catalog(service)
             if self.ai_model.get() not in models:
                 self.ai_model.set(default_model)
 
-            self.ai_model_combo.configure(values=models)
+            # 选项与当前相同（如未知厂商回退到 openai）时不重建下拉菜单
+            _set_combo_values(self.ai_model_combo, models)
         except Exception:
             logger.debug("更新AI模型下拉列表失败")
     
+    def _prewarm_ai_service(self, service):
+        """后台线程预先导入所选 AI 服务的 SDK，避免首次测试/分析时同步导入"""
+        if service in self._prewarmed_ai_services:
+            return
+        self._prewarmed_ai_services.add(service)
+        from ai_analysis import prewarm_ai_service
+        threading.Thread(target=prewarm_ai_service, args=(service,), daemon=True).start()
+
     def toggle_token_visibility(self, entry):
         """切换令牌显示/隐藏"""
         try:
@@ -304,7 +394,7 @@ class HandlersMixin:
             else:
                 entry.configure(show='*')
             entry.focus_set()
-        except Exception:
+        except TclError:
             logger.debug("切换令牌可见性失败")
     
     def toggle_key_visibility(self, entry):
@@ -315,17 +405,21 @@ class HandlersMixin:
             else:
                 entry.configure(show='*')
             entry.focus_set()
-        except Exception:
+        except TclError:
             logger.debug("切换API Key可见性失败")
     
     def toggle_ai_config(self):
         """切换AI配置区域的显示/隐藏"""
         try:
             if self.ai_enabled.get():
-                self.ai_config_frame.grid()
-            else:
+                self._prewarm_ai_service(self.ai_service.get())
+                if self.ai_config_frame is None:
+                    self._build_ai_config_frame()
+                else:
+                    self.ai_config_frame.grid()
+            elif self.ai_config_frame is not None:
                 self.ai_config_frame.grid_remove()
-        except Exception:
+        except TclError:
             logger.debug("切换AI配置区域显示失败")
     
     def toggle_date_inputs(self):
@@ -337,7 +431,7 @@ class HandlersMixin:
             else:
                 self.since_entry.configure(state="normal")
                 self.until_entry.configure(state="normal")
-        except Exception:
+        except TclError:
             logger.debug("切换日期输入框状态失败")
     
     def on_output_format_changed(self, *args):
@@ -349,7 +443,7 @@ class HandlersMixin:
                 self.output_hint.configure(text="提示: 批量生成时，所有文件将保存到选择的目录")
             else:
                 self.output_hint.configure(text="提示: 生成的文件将保存到选择的目录")
-        except Exception:
+        except TclError:
             logger.debug("更新输出格式提示失败")
     
     def browse_output_file(self):
@@ -377,9 +471,7 @@ class HandlersMixin:
             if batch:
                 for message, log_type in batch:
                     self._enqueue_log_entry(message, log_type)
-                if not self._log_flush_scheduled:
-                    self._log_flush_scheduled = True
-                    self.root.after(GUIConfig.LOG_FLUSH_DELAY_MS, self._flush_logs)
+                self._schedule_log_flush()
         except Exception:
             logger.debug("轮询日志队列失败")
         finally:
@@ -387,18 +479,34 @@ class HandlersMixin:
 
     def log(self, message, log_type="info"):
         """添加日志消息。后台线程通过 queue 传递，主线程直接入待写列表。"""
-        try:
-            if threading.current_thread() is not threading.main_thread():
-                self._log_queue.put((message, log_type))
-                return
+        if threading.current_thread() is not threading.main_thread():
+            self._log_queue.put((message, log_type))
+            return
+
+        # 格式化与入缓冲均为纯 Python，仅调度刷新涉及 Tk
+        self._enqueue_log_entry(message, log_type)
+        self._schedule_log_flush()
+
+    def log_block(self, lines, log_type="info"):
+        """将多行文本作为一条日志写入（只带一个时间戳与前缀）。"""
+        self.log("\n".join(lines), log_type)
 
-            self._enqueue_log_entry(message, log_type)
+    def log_traceback(self):
+        """在 except 块内调用：调试模式下把当前异常堆栈写入日志面板，否则只交给 logging.debug。"""
+        if self._debug_enabled:
+            self.log(traceback.format_exc(), "error")
+        else:
+            logger.debug("异常堆栈", exc_info=True)
 
-            if not self._log_flush_scheduled:
-                self._log_flush_scheduled = True
+    def _schedule_log_flush(self):
+        """合并刷新：同一时间窗内只挂一个 _flush_logs 回调。"""
+        if not self._log_flush_scheduled:
+            try:
                 self.root.after(GUIConfig.LOG_FLUSH_DELAY_MS, self._flush_logs)
-        except Exception:
-            logger.debug("写入GUI日志失败")
+            except TclError:
+                logger.debug("调度日志刷新失败")
+                return
+            self._log_flush_scheduled = True
 
     def _enqueue_log_entry(self, message, log_type):
         """将一条日志格式化后加入待写列表（仅主线程调用）。"""
@@ -408,17 +516,22 @@ class HandlersMixin:
         if filter_level == "仅错误" and log_type != "error":
             return
 
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-
-        _PREFIX_MAP = {
-            "error": ("[ERROR]", "error"),
-            "success": ("[SUCCESS]", "success"),
-            "warning": ("[WARNING]", "warning"),
-            "info": ("[INFO]", "info"),
-        }
-        prefix, color_tag = _PREFIX_MAP.get(log_type, ("", "info"))
+        # 时间戳按秒缓存：同一秒内的日志复用格式化结果
+        sec = int(time.time())
+        if sec != self._ts_cache_sec:
+            self._ts_cache_sec = sec
+            self._ts_cache_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sec))
+        timestamp = self._ts_cache_str
+        prefix, color_tag = _LOG_PREFIX_MAP.get(log_type, ("", "info"))
         log_message = f"{timestamp} - {prefix} {message}\n"
 
+        if len(self._log_pending) == self._log_pending.maxlen:
+            # 缓冲已满：立即写入面板（进入历史、参与省略计数），不静默丢弃最旧条目
+            self._flush_logs()
+            if len(self._log_pending) == self._log_pending.maxlen:
+                # 日志面板尚未创建：最旧条目转入历史，仍可“加载历史日志”找回
+                self._log_history.append(self._log_pending.popleft())
+                self._log_omitted_total += 1
         self._log_pending.append((log_message, timestamp, prefix, color_tag))
 
     def _flush_logs(self):
@@ -430,53 +543,72 @@ class HandlersMixin:
             if not hasattr(self, "log_text"):
                 return
 
-            pending = self._log_pending[:]
+            pending = _coalesce_log_entries(self._log_pending)
             self._log_pending.clear()
 
-            should_scroll = True
-            try:
-                last_line_num = int(self.log_text.index("end-1c").split('.')[0])
-                visible_end_num = int(
-                    self.log_text.index("@0,{}".format(self.log_text.winfo_height())).split('.')[0]
-                )
-                if visible_end_num < last_line_num - 3:
-                    should_scroll = False
-            except Exception:
-                pass
+            # 写入前视图已贴底才自动滚动（由 _on_log_yscroll 维护，无需查询 Tk）
+            should_scroll = self._log_at_bottom
+
+            self._log_history.extend(pending)
+            # 按实际写入行数计数，多行消息也能正确换算裁剪位置
+            self._log_count += self._insert_log_entries(pending)
 
-            combined_text = "".join(msg for msg, _, _, _ in pending)
-            base_line = int(self.log_text.index("end-1c").split('.')[0])
-            self.log_text.insert("end", combined_text)
-
-            for i, (log_message, timestamp, prefix, color_tag) in enumerate(pending):
-                line_num = str(base_line + i)
-                self.log_text.tag_add("timestamp", f"{line_num}.0", f"{line_num}.{len(timestamp)}")
-
-                if prefix:
-                    prefix_start_idx = len(timestamp) + 3
-                    self.log_text.tag_add(
-                        color_tag,
-                        f"{line_num}.{prefix_start_idx}",
-                        f"{line_num}.{prefix_start_idx + len(prefix)}",
-                    )
-                self._log_count += 1
-
-            if self._log_count > GUIConfig.LOG_LINE_LIMIT:
-                lines_to_delete = GUIConfig.LOG_TRUNCATE_DELETE
-                self.log_text.delete("1.0", f"{lines_to_delete + 1}.0")
-                self._log_count -= lines_to_delete
+            # 超限时一次裁到 (上限 - 裁剪量)，留出滞回区间，稳态日志下不会每批都裁剪；
+            # 载入历史后按历史上限裁剪，新日志不会把刚载入的历史裁掉
+            line_limit = (GUIConfig.LOG_HISTORY_LIMIT if self._log_history_expanded
+                          else GUIConfig.LOG_LINE_LIMIT)
+            if self._log_count > line_limit:
+                lines_to_delete = self._log_count - (line_limit - GUIConfig.LOG_TRUNCATE_DELETE)
                 self._log_omitted_total += lines_to_delete
 
+                # replace 一步完成删除旧行与插入分隔行，只触发一次文本重排
                 separator = f"─── 已省略 {self._log_omitted_total} 条日志 ───\n"
-                self.log_text.insert("1.0", separator)
+                self.log_text.replace("1.0", f"{lines_to_delete + 1}.0", separator)
                 self.log_text.tag_add("truncated", "1.0", "1.end")
-                self._log_count += 1
+                self._log_count -= lines_to_delete - 1
 
             if should_scroll:
                 self.log_text.see("end")
         except Exception:
             logger.debug("批量写入GUI日志失败")
     
+    def _insert_log_entries(self, entries):
+        """一次 insert 写入多条日志并批量打标签，返回写入的行数。"""
+        combined_text = "".join(msg for msg, _, _, _ in entries)
+        base_line = int(self.log_text.index("end-1c").split('.')[0])
+        self.log_text.insert("end", combined_text)
+
+        # 按标签汇总区间，每个标签只调用一次 tag_add（多行消息按换行数累计行号）
+        tag_ranges = {"timestamp": []}
+        line_num = base_line
+        for log_message, timestamp, prefix, color_tag in entries:
+            tag_ranges["timestamp"] += (f"{line_num}.0", f"{line_num}.{len(timestamp)}")
+            if prefix:
+                prefix_start_idx = len(timestamp) + 3
+                tag_ranges.setdefault(color_tag, []).extend((
+                    f"{line_num}.{prefix_start_idx}",
+                    f"{line_num}.{prefix_start_idx + len(prefix)}",
+                ))
+            line_num += log_message.count("\n")
+        for tag, ranges in tag_ranges.items():
+            if ranges:
+                self.log_text.tag_add(tag, *ranges)
+        return line_num - base_line
+
+    def _load_log_history(self):
+        """将内存中的历史日志重新载入面板；清空日志前按历史上限（而非面板上限）裁剪。"""
+        try:
+            self._flush_logs()
+            if not self._log_history:
+                return
+            self.log_text.delete("1.0", "end")
+            self._log_count = self._insert_log_entries(self._log_history)
+            self._log_omitted_total = 0
+            self._log_history_expanded = True
+            self.log_text.see("end")
+        except TclError:
+            logger.debug("载入历史日志失败")
+
     def clear_logs(self):
         """清空日志"""
         try:
@@ -487,7 +619,9 @@ class HandlersMixin:
             self.log_text.delete(1.0, "end")
             self._log_count = 0
             self._log_omitted_total = 0
+            self._log_history_expanded = False
             self._log_pending.clear()
+            self._log_history.clear()
             # 清空队列中残留的消息
             while not self._log_queue.empty():
                 try:
@@ -495,7 +629,7 @@ class HandlersMixin:
                 except queue.Empty:
                     break
             self.log("日志已清空", "info")
-        except Exception:
+        except TclError:
             logger.debug("清空日志文本失败")
 
         self.log("=" * 60, "info")
@@ -508,6 +642,7 @@ class HandlersMixin:
             return
 
         try:
+            self._ensure_all_tabs()
             # 设置运行状态和按钮状态
             self._is_running = True
             self._set_running_state(True)
@@ -556,6 +691,7 @@ class HandlersMixin:
             result = self._service.generate_report(
                 report_params,
                 self._service_log_callback,
+                progress_callback=self._on_scan_progress,
             )
             self._apply_generate_report_result(result, params, report_params)
 
@@ -567,12 +703,26 @@ class HandlersMixin:
             self.root.after(0, lambda: messagebox.showerror("错误", f"生成失败: {e}"))
         except Exception as e:
             self.log(f"生成失败: {str(e)}", "error")
-            self.log(traceback.format_exc(), "error")
+            self.log_traceback()
             self.root.after(0, lambda: messagebox.showerror("错误", f"生成失败: {str(e)}"))
         finally:
             self._detach_gui_log_handler(gui_handler)
             self._reset_button_state()
 
+    def _on_scan_progress(self, completed, total):
+        """全量扫描进度回调（后台线程）：只记录最新进度，合并为一次主线程刷新。"""
+        self._scan_progress = (completed, total)
+        if not self._scan_progress_scheduled:
+            self._scan_progress_scheduled = True
+            self.root.after(GUIConfig.LOG_FLUSH_DELAY_MS, self._apply_scan_progress)
+
+    def _apply_scan_progress(self):
+        """在状态栏显示最新扫描进度（主线程）。"""
+        self._scan_progress_scheduled = False
+        if self._is_running:
+            completed, total = self._scan_progress
+            self._update_status(f"正在扫描项目 {completed}/{total}…", "running")
+
     def _reset_button_state(self, button_name="generate_btn"):
         """安全地重置按钮状态（线程安全）
 
@@ -617,6 +767,7 @@ class HandlersMixin:
                 self.log("AI分析正在运行中，请等待完成...", "warning")
                 return
 
+            self._ensure_all_tabs()
             if not self.ai_enabled.get() or not self.ai_api_key.get().strip():
                 messagebox.showwarning("提示", "请先启用AI分析并配置API Key")
                 return
@@ -663,31 +814,19 @@ class HandlersMixin:
     
     def _analyze_report_file_direct(self, report_file, ai_params: AIParams):
         """直接基于报告文件内容进行AI分析"""
-        import re
-
         try:
+            # AI 只使用报告前 MAX_REPORT_LENGTH 个字符，多读 1 个字符以保留截断提示
             with open(report_file, 'r', encoding='utf-8') as f:
-                report_content = f.read()
+                report_content = f.read(AIConfig.MAX_REPORT_LENGTH + 1)
 
-            self.log(f"报告文件读取成功，文件大小: {len(report_content)} 字符", "success")
+            self.log(f"报告文件读取成功，文件大小: {os.path.getsize(report_file)} 字节", "success")
 
             if not ai_params.api_key:
                 self.log("错误: 请先配置AI服务并输入API Key", "error")
                 self.root.after(0, lambda: messagebox.showerror("错误", "请先配置AI服务并输入API Key"))
                 return
 
-            author_match = re.search(r'\*\*提交者\*\*: (.+)', report_content)
-            author = author_match.group(1).strip() if author_match else "未知作者"
-
-            date_range_match = re.search(r'\*\*统计时间范围\*\*: (.+?) 至 (.+?)(?:\n|$)', report_content)
-            if date_range_match:
-                since_date = date_range_match.group(1).strip()
-                until_date = date_range_match.group(2).strip()
-            else:
-                since_match = re.search(r'\*\*起始日期\*\*: (.+?)(?:\n|$)', report_content)
-                until_match = re.search(r'\*\*结束日期\*\*: (.+?)(?:\n|$)', report_content)
-                since_date = since_match.group(1).strip() if since_match else None
-                until_date = until_match.group(1).strip() if until_match else None
+            author, since_date, until_date = parse_report_meta(report_content)
 
             self.log("", "info")
             self.log("=" * 60, "info")
@@ -697,26 +836,20 @@ class HandlersMixin:
             if since_date and until_date:
                 self.log(f"日期范围: {since_date} 至 {until_date}", "info")
 
-            result = self._service.analyze_ai_from_file(
+            report_dir = os.path.dirname(report_file)
+            date_prefix = report_date_prefix(since_date, until_date)
+            ai_report_file = os.path.join(report_dir, f"{date_prefix}_ai_analysis.md")
+
+            # 报告逐段流式写入文件，不在内存中拼接完整字符串
+            self._service.analyze_ai_from_file(
                 report_content,
                 ai_params,
                 log_callback=self._service_log_callback,
+                output_file=ai_report_file,
             )
-            ai_report_content = result['report_content']
-
-            report_dir = os.path.dirname(report_file)
-            date_prefix = (
-                since_date
-                if since_date and until_date and since_date == until_date
-                else datetime.now().strftime('%Y-%m-%d')
-            )
-            ai_report_file = os.path.join(report_dir, f"{date_prefix}_ai_analysis.md")
-
-            with open(ai_report_file, 'w', encoding='utf-8') as f:
-                f.write(ai_report_content)
 
             self.log(f"AI分析报告已保存: {ai_report_file}", "success")
-            self.log(f"文件大小: {len(ai_report_content)} 字符", "info")
+            self.log(f"文件大小: {os.path.getsize(ai_report_file)} 字节", "info")
             self.log("提示: 文件名包含 '_ai_analysis' 表示这是AI分析报告", "info")
             self.log("=" * 60, "info")
             self.log("AI分析完成！", "success")
@@ -743,7 +876,7 @@ class HandlersMixin:
             self.root.after(0, lambda: messagebox.showerror("错误", error_msg))
         except Exception as e:
             self.log(f"AI分析失败: {str(e)}", "error")
-            self.log(traceback.format_exc(), "error")
+            self.log_traceback()
             self._show_toast("AI 分析失败", "error")
             self.root.after(0, lambda: messagebox.showerror("错误", f"AI分析失败: {str(e)}"))
         finally:
@@ -780,28 +913,22 @@ class HandlersMixin:
         """在后台线程中执行AI分析"""
         try:
             pending = self._pending_ai_data
-            result = self._service.analyze_ai(
-                pending['all_results'],
-                pending['author'],
-                ai_params,
-                since_date=pending.get('since_date'),
-                until_date=pending.get('until_date'),
-                log_callback=self._service_log_callback,
-            )
-            ai_report_content = result['report_content']
-
             since_date = pending.get('since_date')
             until_date = pending.get('until_date')
             output_dir = pending.get('output_dir', os.getcwd())
-            date_prefix = (
-                since_date
-                if since_date and until_date and since_date == until_date
-                else datetime.now().strftime('%Y-%m-%d')
-            )
+            date_prefix = report_date_prefix(since_date, until_date)
             ai_report_file = os.path.join(output_dir, f"{date_prefix}_ai_analysis.md")
 
-            with open(ai_report_file, 'w', encoding='utf-8') as f:
-                f.write(ai_report_content)
+            # 报告逐段流式写入文件，不在内存中拼接完整字符串
+            self._service.analyze_ai(
+                pending['all_results'],
+                pending['author'],
+                ai_params,
+                since_date=since_date,
+                until_date=until_date,
+                log_callback=self._service_log_callback,
+                output_file=ai_report_file,
+            )
 
             self.log(f"AI分析报告已保存: {ai_report_file}", "success")
             self.log("=" * 60, "info")
@@ -814,7 +941,7 @@ class HandlersMixin:
             self.root.after(0, lambda: messagebox.showerror("错误", str(e)))
         except Exception as e:
             self.log(f"AI分析失败: {str(e)}", "error")
-            self.log(traceback.format_exc(), "error")
+            self.log_traceback()
             self._show_toast("AI 分析失败", "error")
             self.root.after(0, lambda: messagebox.showerror("错误", f"AI分析失败: {str(e)}"))
         finally:
@@ -825,12 +952,13 @@ class HandlersMixin:
     def test_ai_connection(self):
         """测试AI连接"""
         try:
-            if not self.ai_api_key.get().strip():
+            # 主线程一次性读取 StringVar，工作线程只使用快照
+            ai_params = self._build_ai_params()
+            if not ai_params.api_key:
                 self.test_status_label.configure(text="请先输入API Key", text_color=self.error_color)
                 return
-            
+
             self.test_status_label.configure(text="测试中...", text_color=self.accent_color)
-            ai_params = self._build_ai_params()
             thread = threading.Thread(
                 target=self._test_ai_connection_thread,
                 args=(ai_params,),
@@ -840,6 +968,29 @@ class HandlersMixin:
         except Exception as e:
             self.test_status_label.configure(text=f"测试失败: {str(e)}", text_color=self.error_color)
     
+    @staticmethod
+    def _ai_test_error_hint(exc: Exception):
+        """仅按 HTTP 状态码 / 异常类型给出提示；无法确定时返回 None（调用方显示原始信息）。"""
+        status = _exception_status_code(exc)
+        if status in (401, 403):
+            return "API密钥无效"
+        if status is not None and status >= 500:
+            return f"AI服务暂时不可用 (HTTP {status})"
+        if isinstance(exc, (ConnectionError, TimeoutError)):
+            return "网络连接失败"
+        return None
+
+    @classmethod
+    def _classify_ai_test_error(cls, exc: Exception, error_msg: str) -> str:
+        """未经 service 包装的异常：先按状态码/异常类型判断，再回退到文本匹配。"""
+        hint = cls._ai_test_error_hint(exc)
+        if hint:
+            return hint
+        for pattern, message in _AI_TEST_ERROR_PATTERNS:
+            if pattern.search(error_msg):
+                return message
+        return f"连接失败: {error_msg[:60]}"
+
     def _test_ai_connection_thread(self, ai_params: AIParams):
         """在后台线程中测试AI连接"""
         try:
@@ -853,24 +1004,18 @@ class HandlersMixin:
             ))
 
         except AIAnalysisError as e:
-            error_msg = str(e) or "连接失败"
-            self.root.after(0, lambda: self.test_status_label.configure(
-                text=error_msg[:80], text_color=self.error_color,
+            # service 把底层异常包装为 AIAnalysisError：原始异常（__cause__）的状态码/类型
+            # 能确定原因时给出提示，否则照常显示服务商返回的原始信息
+            logger.debug("AI连接测试失败: %s", e, exc_info=True)
+            display_msg = self._ai_test_error_hint(e.__cause__ or e) or str(e) or "连接失败"
+            self.root.after(0, lambda m=display_msg: self.test_status_label.configure(
+                text=m[:80], text_color=self.error_color,
             ))
         except Exception as e:
             error_msg = str(e) or "未知错误 (可能是库内部类型错误)"
-            print(f"AI连接测试异常: {error_msg}")
-            traceback.print_exc()
+            logger.debug("AI连接测试异常: %s", error_msg, exc_info=True)
             
-            # 对用户显示友好的错误提示
-            if "401" in error_msg or "unauthorized" in error_msg.lower() or "invalid" in error_msg.lower():
-                display_msg = "API密钥无效"
-            elif "connection" in error_msg.lower() or "network" in error_msg.lower() or "timeout" in error_msg.lower():
-                display_msg = "网络连接失败"
-            elif "splitlines" in error_msg:
-                display_msg = "连接失败: 可能是网络拦截或代理问题"
-            else:
-                display_msg = f"连接失败: {error_msg[:60]}"
+            display_msg = self._classify_ai_test_error(e, error_msg)
             
             self.root.after(0, lambda m=display_msg: self.test_status_label.configure(
                 text=m, text_color=self.error_color))
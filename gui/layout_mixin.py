@@ -7,9 +7,10 @@ import os
 import queue
 import sys
 import threading
+import tkinter as tk
 import traceback
 from datetime import datetime
-from tkinter import filedialog, messagebox
+from tkinter import filedialog, messagebox, scrolledtext
 
 try:
     import customtkinter as ctk
@@ -30,6 +31,7 @@ from service import Git2LogsService
 from gui.styles import (
     UIStyles,
     _ctk_ui_font,
+    _flat_line,
     get_script_path,
     resource_path,
     _resolve_monospace_font,
@@ -38,30 +40,42 @@ from gui.styles import (
 logger = logging.getLogger(__name__)
 
 class LayoutMixin:
-    def _apply_sidebar_pill_style(self, tab_name=None):
-        """侧栏导航项：选中态有 border + muted 背景（CodexPlusPlus .nav-item.active 风格）。"""
+    def _sidebar_pill_styles(self):
+        """按当前主题预先构建 (选中, 未选中) 两套导航项样式：(pill 参数, 图标颜色)。"""
+        c = self.styles.colors
+        active = (
+            {"fg_color": c["bg_surface"], "border_color": c["border"], "border_width": 1},
+            c["text_primary"],
+        )
+        inactive = (
+            {"fg_color": c["sidebar_bg"], "border_color": c["sidebar_bg"], "border_width": 1},
+            c["text_secondary"],
+        )
+        return active, inactive
+
+    def _apply_sidebar_pill_style(self, tab_name=None, tab_names=None):
+        """侧栏导航项：选中态有 border + muted 背景（CodexPlusPlus .nav-item.active 风格）。
+
+        tab_name / tab_names 指定只刷新部分导航项，默认刷新全部。
+        """
         pills = getattr(self, "_sidebar_pill_by_tab", None) or {}
         if not pills:
             return
-        c = self.styles.colors
         ct = getattr(self, "current_tab", None)
-        names = [tab_name] if tab_name is not None and tab_name in pills else list(pills.keys())
-        for name in names:
+        if tab_names is None:
+            tab_names = [tab_name] if tab_name is not None else pills.keys()
+        active, inactive = self._sidebar_pill_styles()
+        for name in tab_names:
             pill = pills.get(name)
             if not pill:
                 continue
-            sel = name == ct
+            pill_kwargs, icon_col = active if name == ct else inactive
             try:
-                pill.configure(
-                    fg_color=c["bg_surface"] if sel else c["sidebar_bg"],
-                    border_color=c["border"] if sel else c["sidebar_bg"],
-                    border_width=1,
-                )
+                pill.configure(**pill_kwargs)
             except Exception:
                 logger.debug("配置侧栏导航项样式失败")
             tpl = self._sidebar_btns.get(name)
             if tpl and len(tpl) >= 3:
-                icon_col = c["text_primary"] if sel else c["text_secondary"]
                 try:
                     tpl[1].configure(text_color=icon_col)
                 except Exception:
@@ -130,8 +144,8 @@ class LayoutMixin:
         self._sidebar_brand_sub.pack(anchor="w")
 
         # 品牌区底部分隔线
-        ctk.CTkFrame(parent, fg_color=self.styles.colors['border'], height=1, corner_radius=0).pack(
-            fill="x", padx=10, pady=(0, 12))
+        self._sidebar_brand_sep = _flat_line(parent, self.styles.colors['border'], height=1)
+        self._sidebar_brand_sep.pack(fill="x", padx=10, pady=(0, 12))
 
         # 导航项列表
         for tab_name, glyph, label in nav_items:
@@ -172,6 +186,67 @@ class LayoutMixin:
 
             self._sidebar_btns[tab_name] = (nav_btn, icon_lbl, text_lbl, glyph)
 
+    def _create_scroll_area(self, parent):
+        """创建内容滚动区：原生 Canvas + 内层 Frame，只绑定滚轮（原滚动条与背景同色，本就不可见）。
+
+        Returns:
+            内层 Frame，各标签页框架以它为父控件。
+        """
+        bg = self.styles.colors['bg_main']
+        if sys.platform.startswith("win"):
+            increment = GUIConfig.SCROLL_INCREMENT_WIN
+        elif sys.platform == "darwin":
+            increment = GUIConfig.SCROLL_INCREMENT_MAC
+        else:
+            increment = GUIConfig.SCROLL_INCREMENT_X11
+        canvas = tk.Canvas(parent, bg=bg, highlightthickness=0, bd=0,
+                           yscrollincrement=increment)
+        canvas.pack(fill="both", expand=True, padx=0, pady=0)
+        inner = tk.Frame(canvas, bg=bg, highlightthickness=0, bd=0)
+        window_id = canvas.create_window((0, 0), window=inner, anchor="nw")
+
+        # 内容尺寸变化时更新滚动范围；画布宽度变化时内层同宽，保证 fill="x" 生效
+        inner.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+        canvas.bind("<Configure>", lambda e: canvas.itemconfigure(window_id, width=e.width))
+        if sys.platform.startswith("linux"):
+            sequences = ("<Button-4>", "<Button-5>")
+        else:
+            sequences = ("<MouseWheel>",)
+        for sequence in sequences:
+            canvas.bind_all(sequence, self._on_content_mousewheel, add="+")
+
+        self.scroll_container = canvas
+        return inner
+
+    def _is_content_scroll_target(self, widget):
+        """沿父控件链向上查找：先到达内容画布才滚动；途经嵌套的可滚动控件（如输出格式列表）时交给它自己处理。"""
+        canvas = self.scroll_container
+        while widget is not None:
+            if widget is canvas:
+                return True
+            if isinstance(widget, (ctk.CTkScrollableFrame, ctk.CTkTextbox, ctk.CTkScrollbar,
+                                   ctk.CTkSlider, tk.Text)):
+                return False
+            # 部分 Tk 内部控件（如下拉弹层）的 event.widget 是路径字符串，没有 master
+            widget = getattr(widget, "master", None)
+        return False
+
+    def _on_content_mousewheel(self, event):
+        """指针位于内容区内时滚动画布；内容未超出可视区域时不滚动。步长按平台与 CTkScrollableFrame 一致。"""
+        canvas = self.scroll_container
+        if not self._is_content_scroll_target(event.widget):
+            return
+        if canvas.yview() == (0.0, 1.0):
+            return
+        if sys.platform.startswith("win"):
+            step = -int(event.delta / 6)
+        elif sys.platform == "darwin":
+            step = -event.delta
+        else:
+            step = -1 if event.num == 4 else 1
+        if step:
+            canvas.yview_scroll(step, "units")
+
     def _create_log_area(self, parent):
         """创建日志显示区域（放在最上方）"""
         log_container = ctk.CTkFrame(parent, fg_color=self.styles.colors['bg_main'], corner_radius=0)
@@ -229,6 +304,22 @@ class LayoutMixin:
             command=self._toggle_log_collapsed,
         )
         self._log_toggle_btn.pack(side="right")
+
+        self._log_history_btn = ctk.CTkButton(
+            tf_right,
+            text="加载历史日志",
+            width=96,
+            height=28,
+            font=self.styles.fonts['caption'](),
+            corner_radius=self.styles.radius['sm'],
+            fg_color=self.styles.colors['bg_card'],
+            text_color=self.styles.colors['text_secondary'],
+            hover_color=self.styles.colors['hover'],
+            border_width=1,
+            border_color=self.styles.colors['border'],
+            command=self._load_log_history,
+        )
+        self._log_history_btn.pack(side="right", padx=(0, 8))
         
         log_card = ctk.CTkFrame(log_container,
                               fg_color=self.styles.colors['bg_card'],
@@ -240,7 +331,6 @@ class LayoutMixin:
         text_container.pack(fill="x", padx=10, pady=10)
         self._log_text_container = text_container
         
-        from tkinter import scrolledtext
         mono = _resolve_monospace_font(self.root, 10)
         self.log_text = scrolledtext.ScrolledText(text_container,
                                              height=6,
@@ -257,6 +347,8 @@ class LayoutMixin:
                                              padx=12,
                                              pady=12)
         self.log_text.pack(fill="both", expand=False)
+        # 接管滚动回调：更新滚动条的同时记录视图是否贴底，写日志时无需再查询视图
+        self.log_text.configure(yscrollcommand=self._on_log_yscroll)
         
         self.log_text.tag_config("error", foreground=self.styles.colors['error'])
         self.log_text.tag_config("success", foreground=self.styles.colors['success'])
@@ -264,6 +356,11 @@ class LayoutMixin:
         self.log_text.tag_config("info", foreground=self.styles.colors['text_primary'])
         self.log_text.tag_config("timestamp", foreground=self.styles.colors['text_secondary'])
 
+    def _on_log_yscroll(self, first, last):
+        """日志视图滚动回调：同步滚动条并记录视图是否贴底。"""
+        self.log_text.vbar.set(first, last)
+        self._log_at_bottom = float(last) >= 0.999
+
     def _toggle_log_collapsed(self):
         """折叠/展开执行日志区域（仅影响布局，不改变业务逻辑）。"""
         if not hasattr(self, "_log_card") or not hasattr(self, "_log_toggle_btn"):
@@ -317,14 +414,15 @@ class LayoutMixin:
         if hasattr(self, "_right_panel"):
             self._right_panel.configure(fg_color=c['bg_main'])
         if hasattr(self, "scroll_container"):
-            self.scroll_container.configure(fg_color=c['bg_main'])
-            try:
-                self.scroll_container.configure(
-                    scrollbar_button_color=c['bg_main'],
-                    scrollbar_button_hover_color=c['bg_main'],
-                )
-            except Exception:
-                logger.debug("主题更新: 配置滚动条颜色失败")
+            self.scroll_container.configure(bg=c['bg_main'])
+            self.content_container.configure(bg=c['bg_main'])
+            # 原生 Frame 不会向 CTk 子控件传播背景色，手动同步各标签页框架
+            for child in self.content_container.winfo_children():
+                if isinstance(child, ctk.CTkBaseClass):
+                    try:
+                        child.configure(bg_color=c['bg_main'])
+                    except Exception:
+                        logger.debug("主题更新: 配置标签页背景失败")
 
         if hasattr(self, "_topbar_frame"):
             self._topbar_frame.configure(fg_color=c['bg_card'])
@@ -333,14 +431,16 @@ class LayoutMixin:
         if hasattr(self, "_topbar_subtitle"):
             self._topbar_subtitle.configure(text_color=c['text_secondary'])
         if hasattr(self, "_topbar_sep"):
-            self._topbar_sep.configure(fg_color=c['border'])
+            self._topbar_sep.configure(bg=c['border'])
         try:
             if hasattr(self, "_sidebar_wrapper"):
                 self._sidebar_wrapper.configure(fg_color=sidebar_bg)
             if hasattr(self, "_sidebar_frame"):
                 self._sidebar_frame.configure(fg_color=sidebar_bg)
             if hasattr(self, "_sidebar_border"):
-                self._sidebar_border.configure(fg_color=c['border'])
+                self._sidebar_border.configure(bg=c['border'])
+            if hasattr(self, "_sidebar_brand_sep"):
+                self._sidebar_brand_sep.configure(bg=c['border'])
             if hasattr(self, "_sidebar_brand_mark"):
                 self._sidebar_brand_mark.configure(fg_color=c['text_primary'])
             if hasattr(self, "_sidebar_brand_mark_lbl"):
@@ -363,13 +463,14 @@ class LayoutMixin:
             self._log_card.configure(fg_color=c['bg_card'])
         if hasattr(self, "_log_text_container"):
             self._log_text_container.configure(fg_color=c['bg_main'])
-        if hasattr(self, "_log_toggle_btn"):
-            self._log_toggle_btn.configure(
-                fg_color=c['bg_card'],
-                text_color=c['text_secondary'],
-                hover_color=c['hover'],
-                border_color=c['border'],
-            )
+        for btn_attr in ("_log_toggle_btn", "_log_history_btn"):
+            if hasattr(self, btn_attr):
+                getattr(self, btn_attr).configure(
+                    fg_color=c['bg_card'],
+                    text_color=c['text_secondary'],
+                    hover_color=c['hover'],
+                    border_color=c['border'],
+                )
         if hasattr(self, "_log_filter_btn"):
             self._log_filter_btn.configure(
                 fg_color=c['bg_card'],
@@ -539,7 +640,7 @@ class LayoutMixin:
                 logger.debug("主题更新: 配置格式选项滚动区域样式失败")
         if hasattr(self, "_bottom_separator"):
             try:
-                self._bottom_separator.configure(fg_color=c['border'])
+                self._bottom_separator.configure(bg=c['border'])
             except Exception:
                 logger.debug("主题更新: 配置底部分隔线颜色失败")
         if hasattr(self, "_button_container_ref"):
@@ -1,19 +1,53 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """Git2LogsService 与 GUI 之间的参数构建与结果处理（Mixin，逻辑不变）。"""
-import json
 import logging
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 
 from tkinter import messagebox
 
 from config import ReportConfig
 from models import ReportParams, AIParams, ExcelParams
+from utils.date_utils import date_format_error
 
 logger = logging.getLogger(__name__)
 
 
+class _GUILogHandler(logging.Handler):
+    """将日志记录转发到 GUI 日志面板（模块级定义，避免每次生成任务重建类对象）。"""
+
+    def __init__(self, gui_log_func):
+        super().__init__()
+        self.gui_log_func = gui_log_func
+
+    def emit(self, record):
+        try:
+            msg = self.format(record)
+            log_type = (
+                "error" if record.levelno >= logging.ERROR
+                else "warning" if record.levelno >= logging.WARNING
+                else "info"
+            )
+            self.gui_log_func(msg, log_type)
+        except Exception:
+            logger.debug("GUILogHandler发送日志到GUI失败")
+
+
+_GUI_LOG_FORMATTER = logging.Formatter('%(levelname)s - %(message)s')
+# 高于 CRITICAL，空闲时 handler 不转发任何记录
+_GUI_LOG_DISABLED = logging.CRITICAL + 1
+
+_NO_COMMITS_SUGGESTIONS = (
+    "排查建议：",
+    "- 查看上面的调试信息，确认 GitLab 中实际提交的作者格式",
+    "- 尝试只使用邮箱或只使用名称作为提交者",
+    "- 如果指定了日期，尝试不指定日期范围（取消'今天'勾选，不填日期）",
+    "- 尝试指定具体分支名称",
+    "- 检查该日期范围内是否确实有提交（可以在 GitLab 网页上查看）",
+)
+
+
 class ServiceBridgeMixin:
     """将 Git2LogsService 接入 GUI 的辅助方法集合。"""
 
@@ -22,46 +56,24 @@ class ServiceBridgeMixin:
         self.log(message, level)
 
     def _attach_gui_log_handler(self):
-        """将 root logger 重定向到 GUI 日志面板。"""
-        class GUILogHandler(logging.Handler):
-            def __init__(self, gui_log_func):
-                super().__init__()
-                self.gui_log_func = gui_log_func
-
-            def emit(self, record):
-                try:
-                    msg = self.format(record)
-                    log_type = (
-                        "error" if record.levelno >= logging.ERROR
-                        else "warning" if record.levelno >= logging.WARNING
-                        else "info"
-                    )
-                    self.gui_log_func(msg, log_type)
-                except Exception:
-                    logger.debug("GUILogHandler发送日志到GUI失败")
-
-        gui_handler = GUILogHandler(self.log)
+        """将 root logger 重定向到 GUI 日志面板。
+
+        handler 首次调用时创建并常驻 root logger，之后仅切换级别。
+        """
+        gui_handler = self._gui_log_handler
+        if gui_handler is None:
+            gui_handler = _GUILogHandler(self.log)
+            gui_handler.setFormatter(_GUI_LOG_FORMATTER)
+            logging.getLogger().addHandler(gui_handler)
+            self._gui_log_handler = gui_handler
         gui_handler.setLevel(logging.INFO)
-        gui_handler.setFormatter(logging.Formatter('%(levelname)s - %(message)s'))
-        root_logger = logging.getLogger()
-        try:
-            if hasattr(self, "_gui_log_handler") and self._gui_log_handler in root_logger.handlers:
-                root_logger.removeHandler(self._gui_log_handler)
-        except Exception:
-            logger.debug("移除旧的GUI日志处理器失败")
-        root_logger.addHandler(gui_handler)
-        self._gui_log_handler = gui_handler
-        root_logger.setLevel(logging.INFO)
+        logging.getLogger().setLevel(logging.INFO)
         return gui_handler
 
     def _detach_gui_log_handler(self, gui_handler):
-        """移除本次任务挂载的 GUI 日志 handler。"""
-        try:
-            root_logger = logging.getLogger()
-            if gui_handler is not None and gui_handler in root_logger.handlers:
-                root_logger.removeHandler(gui_handler)
-        except Exception:
-            logger.debug("清理GUI日志处理器失败")
+        """任务结束后静默常驻 handler（不从 root logger 移除）。"""
+        if gui_handler is not None:
+            gui_handler.setLevel(_GUI_LOG_DISABLED)
 
     def _resolve_dates_from_cached(self, params: dict):
         """
@@ -71,16 +83,14 @@ class ServiceBridgeMixin:
         since_date = None
         until_date = None
         use_today_value = params['use_today']
-        self.log(f"调试: '今天'复选框状态: {use_today_value}", "info")
+        if self._debug_enabled:
+            self.log(f"调试: '今天'复选框状态: {use_today_value}", "info")
 
         if use_today_value:
-            today_local = datetime.now()
-            since_date = today_local.strftime('%Y-%m-%d')
-            until_date = today_local.strftime('%Y-%m-%d')
+            today_local_str = datetime.now().strftime('%Y-%m-%d')
+            since_date = until_date = today_local_str
             self.log(f"使用今天的日期: {since_date}", "info")
-            from datetime import timezone
             today_utc = datetime.now(timezone.utc).strftime('%Y-%m-%d')
-            today_local_str = today_local.strftime('%Y-%m-%d')
             if today_local_str != today_utc:
                 self.log(
                     f"提示: 本地日期为 {today_local_str}，UTC 日期为 {today_utc}，"
@@ -91,10 +101,11 @@ class ServiceBridgeMixin:
 
         since_date_str = params['since_date']
         until_date_str = params['until_date']
-        self.log(
-            f"调试: 从输入框获取的日期 - 起始: '{since_date_str}', 结束: '{until_date_str}'",
-            "info",
-        )
+        if self._debug_enabled:
+            self.log(
+                f"调试: 从输入框获取的日期 - 起始: '{since_date_str}', 结束: '{until_date_str}'",
+                "info",
+            )
 
         if since_date_str and not until_date_str:
             until_date_str = since_date_str
@@ -111,26 +122,25 @@ class ServiceBridgeMixin:
         if not since_date and not until_date:
             self.log("提示: 未指定日期范围，将查询所有提交记录", "info")
         elif since_date and until_date:
-            try:
-                datetime.strptime(since_date, '%Y-%m-%d')
-                datetime.strptime(until_date, '%Y-%m-%d')
-                self.log(f"调试: 日期格式验证通过 - 起始: {since_date}, 结束: {until_date}", "info")
-                if since_date == until_date:
-                    self.log(f"使用指定的日期: {since_date}", "info")
-                else:
-                    self.log(f"使用日期范围: {since_date} 至 {until_date}", "info")
-            except ValueError as e:
-                self.log(f"错误: 日期格式无效 - {str(e)}", "error")
+            error = date_format_error(since_date) or date_format_error(until_date)
+            if error:
+                self.log(f"错误: 日期格式无效 - {error}", "error")
                 self.log(f"  起始日期: '{since_date}', 结束日期: '{until_date}'", "error")
                 self.log("  日期格式应为 YYYY-MM-DD，例如: 2026-01-21", "error")
                 self.root.after(
                     0,
                     lambda: messagebox.showerror(
                         "错误",
-                        f"日期格式无效: {str(e)}\n\n日期格式应为 YYYY-MM-DD，例如: 2026-01-21",
+                        f"日期格式无效: {error}\n\n日期格式应为 YYYY-MM-DD，例如: 2026-01-21",
                     ),
                 )
                 return None
+            if self._debug_enabled:
+                self.log(f"调试: 日期格式验证通过 - 起始: {since_date}, 结束: {until_date}", "info")
+            if since_date == until_date:
+                self.log(f"使用指定的日期: {since_date}", "info")
+            else:
+                self.log(f"使用日期范围: {since_date} 至 {until_date}", "info")
 
         return since_date, until_date
 
@@ -146,11 +156,14 @@ class ServiceBridgeMixin:
         repo = params['repo']
         branch = params['branch']
 
-        self.log("配置参数:", "info")
-        self.log(f"  GitLab URL: {gitlab_url}", "info")
-        self.log(f"  提交者: {author}", "info")
-        self.log(f"  仓库: {repo if repo else '(扫描所有项目)'}", "info")
-        self.log(f"  分支: {branch if branch else '(所有分支)'}", "info")
+        if self._debug_enabled:
+            self.log_block([
+                "配置参数:",
+                f"  GitLab URL: {gitlab_url}",
+                f"  提交者: {author}",
+                f"  仓库: {repo if repo else '(扫描所有项目)'}",
+                f"  分支: {branch if branch else '(所有分支)'}",
+            ], "info")
 
         if not gitlab_url or not token or not author:
             self.log("错误: 请填写GitLab URL、访问令牌和提交者", "error")
@@ -229,29 +242,21 @@ class ServiceBridgeMixin:
         if not (params['scan_all'] or not params['repo']):
             return
         author = params['author']
-        self.log("", "warning")
-        self.log("未找到提交记录的可能原因：", "warning")
-        self.log(
+        date_range = f"{since_date} 至 {until_date}" if since_date and until_date else "未指定（查询所有）"
+        # 整段提示各合并为一条日志，写入时只占一次缓冲与标签计算
+        self.log_block([
+            "",
+            "未找到提交记录的可能原因：",
             "1. 日期范围问题：GitLab API 使用 UTC 时间，可能与本地时区不同",
-            "warning",
-        )
-        self.log(
-            "   当前查询日期: "
-            + (f"{since_date} 至 {until_date}" if since_date and until_date else "未指定（查询所有）"),
-            "warning",
-        )
-        self.log("2. 提交者名称不匹配：请确认提交者名称或邮箱与 GitLab 中的完全一致", "warning")
-        self.log(f"   当前提交者: {author}", "warning")
-        self.log("   提示: 请查看上面的'调试：查询到的提交示例'，确认实际作者格式", "warning")
-        self.log("3. 分支问题：如果指定了分支，请确认该分支存在且有提交", "warning")
-        self.log("4. 权限问题：请确认访问令牌有足够的权限", "warning")
-        self.log("", "warning")
-        self.log("排查建议：", "info")
-        self.log("- 查看上面的调试信息，确认 GitLab 中实际提交的作者格式", "info")
-        self.log("- 尝试只使用邮箱或只使用名称作为提交者", "info")
-        self.log("- 如果指定了日期，尝试不指定日期范围（取消'今天'勾选，不填日期）", "info")
-        self.log("- 尝试指定具体分支名称", "info")
-        self.log("- 检查该日期范围内是否确实有提交（可以在 GitLab 网页上查看）", "info")
+            f"   当前查询日期: {date_range}",
+            "2. 提交者名称不匹配：请确认提交者名称或邮箱与 GitLab 中的完全一致",
+            f"   当前提交者: {author}",
+            "   提示: 请查看上面的'调试：查询到的提交示例'，确认实际作者格式",
+            "3. 分支问题：如果指定了分支，请确认该分支存在且有提交",
+            "4. 权限问题：请确认访问令牌有足够的权限",
+            "",
+        ], "warning")
+        self.log_block(_NO_COMMITS_SUGGESTIONS, "info")
 
     def _apply_generate_report_result(self, result: dict, cached: dict, report_params: ReportParams):
         """根据 Git2LogsService.generate_report 返回值更新 GUI 状态。"""
@@ -297,9 +302,8 @@ class ServiceBridgeMixin:
             self.log(f"报告已保存: {output_file}", "success")
 
         if output_format == "work_hours" and output_file and work_hours_data:
+            # JSON 已由 service 写出，这里只回显路径
             json_file = output_file.replace(".md", "_data.json")
-            with open(json_file, "w", encoding="utf-8") as jf:
-                json.dump(work_hours_data, jf, ensure_ascii=False, indent=2)
             self.log(f"工时数据已保存: {json_file}", "info")
             self.log("提示: 可在「Excel导出」标签页加载此 JSON 文件", "info")
 
@@ -3,6 +3,8 @@
 """GUI 样式常量与字体/资源路径工具。"""
 import os
 import sys
+import tkinter as tk
+from contextlib import contextmanager
 
 try:
     import customtkinter as ctk
@@ -21,11 +23,57 @@ def _ui_font_family():
     return "DejaVu Sans"
 
 
+# (family, size, weight) -> CTkFont；同规格字体全局复用，避免每个控件重复创建 Tk 字体
+_FONT_CACHE = {}
+
+
+def _cached_font(family, size: int, weight: str):
+    key = (family, size, weight)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        kwargs = {"size": size, "weight": weight}
+        if family:
+            kwargs["family"] = family
+        font = _FONT_CACHE[key] = ctk.CTkFont(**kwargs)
+    return font
+
+
 def _ctk_ui_font(size: int, weight: str = "normal"):
-    fam = _ui_font_family()
-    if weight in ("bold", "semibold"):
-        return ctk.CTkFont(family=fam, size=size, weight="bold")
-    return ctk.CTkFont(family=fam, size=size)
+    weight = "bold" if weight in ("bold", "semibold") else "normal"
+    return _cached_font(_ui_font_family(), size, weight)
+
+
+def _ctk_font(size: int, weight: str = "normal"):
+    """CTk 默认字体族的缓存字体（替代内联 ctk.CTkFont(size=..., weight=...)）。"""
+    return _cached_font(None, size, weight)
+
+
+def _flat_line(parent, color, **size):
+    """纯色分隔线：原生 tk.Frame，无 CTk 画布与主题回调（主题切换时用 bg= 更新）。"""
+    return tk.Frame(parent, bg=color, highlightthickness=0, bd=0, **size)
+
+
+def _set_combo_values(combo, values):
+    """设置下拉选项；与上次设置的值相等时跳过（CTkComboBox 每次 configure(values=) 都会重建下拉菜单）。"""
+    values = tuple(values)
+    if getattr(combo, "_cached_values", None) == values:
+        return
+    combo.configure(values=list(values))
+    combo._cached_values = values
+
+
+@contextmanager
+def _frozen_layout(widget):
+    """批量 pack/pack_forget 子控件期间冻结几何传播，退出时恢复，由 Tk 空闲回调统一重新测量一次。
+
+    直接调用 tk.Misc.pack_propagate：CTk 容器可能覆写几何方法并转发给外层框架。
+    """
+    previous = tk.Misc.pack_propagate(widget)
+    tk.Misc.pack_propagate(widget, False)
+    try:
+        yield
+    finally:
+        tk.Misc.pack_propagate(widget, previous)
 
 
 class UIStyles:
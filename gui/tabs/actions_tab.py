@@ -30,6 +30,7 @@ from service import Git2LogsService
 from gui.styles import (
     UIStyles,
     _ctk_ui_font,
+    _flat_line,
     get_script_path,
     resource_path,
     _resolve_monospace_font,
@@ -41,7 +42,7 @@ class ActionsTabMixin:
     def _create_bottom_actions(self):
         """创建底部固定操作按钮区域（固定在窗口底部，不随内容滚动）"""
         # 顶部分隔线
-        separator = ctk.CTkFrame(self.bottom_actions_frame, fg_color=self.styles.colors['border'], height=1, corner_radius=0)
+        separator = _flat_line(self.bottom_actions_frame, self.styles.colors['border'], height=1)
         separator.pack(fill="x", padx=0, pady=0)
         self._bottom_separator = separator
 
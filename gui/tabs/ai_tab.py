@@ -9,6 +9,7 @@ import sys
 import threading
 import traceback
 from datetime import datetime
+from functools import partial
 from tkinter import filedialog, messagebox
 
 try:
@@ -16,6 +17,7 @@ try:
 except ImportError:
     ctk = None
 
+from ai_providers.catalog import get_provider_catalog
 from config import AIConfig, GUIConfig, ReportConfig
 from models import (
     AIAnalysisError,
@@ -30,6 +32,7 @@ from service import Git2LogsService
 from gui.styles import (
     UIStyles,
     _ctk_ui_font,
+    _ctk_font,
     get_script_path,
     resource_path,
     _resolve_monospace_font,
@@ -40,9 +43,8 @@ logger = logging.getLogger(__name__)
 class AiTabMixin:
     def _create_tab3_ai_analysis(self):
         """创建标签页3: AI分析"""
-        # 优化：透明背景且取消圆角
+        # 优化：透明背景且取消圆角；构建时不 pack，首次显示由 _switch_tab 负责
         tab3 = ctk.CTkFrame(self.content_container, fg_color="transparent", corner_radius=0)
-        tab3.pack(fill="both", expand=True, padx=20, pady=20)
         
         content = ctk.CTkFrame(tab3, fg_color="transparent")
         content.pack(fill="both", expand=True, padx=30, pady=10)
@@ -55,7 +57,7 @@ class AiTabMixin:
         ai_enable_check = ctk.CTkCheckBox(content,
                                          text="启用AI分析",
                                          variable=self.ai_enabled,
-                                         font=ctk.CTkFont(size=14, weight="bold"),
+                                         font=_ctk_font(14, "bold"),
                                          text_color=self.text_primary,
                                          fg_color=self.accent_color,
                                          corner_radius=4,
@@ -64,21 +66,36 @@ class AiTabMixin:
         self._track_check_or_radio(ai_enable_check)
         row += 1
         
-        # AI配置区域（默认隐藏）
+        # AI配置区域（默认隐藏）：变量先建好供生成/缓存流程读取，控件在首次展开时构建
+        self.ai_service = ctk.StringVar(value="openai")
+        default_model, _ = get_provider_catalog(self.ai_service.get())
+        self.ai_model = ctk.StringVar(value=default_model)
+        self.ai_api_key = ctk.StringVar()
+        self.ai_config_frame = None
+        self._ai_config_parent = content
+        self._ai_config_row = row
+        
+        # 底部留白：行最小高度代替空白占位标签
+        content.grid_rowconfigure(row + 1, minsize=50)
+        
+        self.tab_frames["AI分析"] = tab3
+    
+    def _build_ai_config_frame(self):
+        """构建AI配置区域（首次启用AI分析时由 toggle_ai_config 调用）"""
         self.ai_config_frame = ctk.CTkFrame(
-            content,
+            self._ai_config_parent,
             fg_color=self.bg_card,
             corner_radius=12,
             border_width=1,
             border_color=self.border_color,
         )
-        self.ai_config_frame.grid(row=row, column=0, columnspan=2, sticky="ew", pady=(0, 0))
+        self.ai_config_frame.grid(row=self._ai_config_row, column=0, columnspan=2, sticky="ew", pady=(0, 0))
         self.ai_config_frame.columnconfigure(1, weight=1)
         self._track_panel_card(self.ai_config_frame)
         
         ai_title = ctk.CTkLabel(self.ai_config_frame,
                               text="AI配置",
-                              font=ctk.CTkFont(size=15, weight="bold"),
+                              font=_ctk_font(15, "bold"),
                               text_color=self.text_primary,
                               anchor="w")
         ai_title.grid(row=0, column=0, columnspan=2, sticky="w", padx=20, pady=(20, 20))
@@ -89,17 +106,16 @@ class AiTabMixin:
         # AI服务选择
         service_label = ctk.CTkLabel(self.ai_config_frame,
                                     text="AI服务",
-                                    font=ctk.CTkFont(size=14, weight="bold"),
+                                    font=_ctk_font(14, "bold"),
                                     text_color=self.text_primary,
                                     anchor="w")
         service_label.grid(row=config_row, column=0, sticky="w", padx=20, pady=(0, 8))
         self._track_label_primary(service_label)
         
-        self.ai_service = ctk.StringVar(value="openai")
         ai_service_combo = ctk.CTkComboBox(self.ai_config_frame,
                                           values=["openai", "anthropic", "gemini", "doubao", "deepseek"],
                                           variable=self.ai_service,
-                                          font=ctk.CTkFont(size=13),
+                                          font=_ctk_font(13),
                                           height=34,
                                           corner_radius=6,
                                           border_width=1,
@@ -119,24 +135,18 @@ class AiTabMixin:
         # 模型选择
         model_label = ctk.CTkLabel(self.ai_config_frame,
                                  text="模型",
-                                 font=ctk.CTkFont(size=14, weight="bold"),
+                                 font=_ctk_font(14, "bold"),
                                  text_color=self.text_primary,
                                  anchor="w")
         model_label.grid(row=config_row, column=0, sticky="w", padx=20, pady=(0, 8))
         self._track_label_primary(model_label)
         
-        self.ai_model = ctk.StringVar(value="gpt-5.6-luna")
+        _, models = get_provider_catalog(self.ai_service.get())
+        self._last_ai_service = self.ai_service.get()
         self.ai_model_combo = ctk.CTkComboBox(self.ai_config_frame,
-                                             values=[
-                                                 "gpt-5.6-luna",
-                                                 "gpt-5.6-terra",
-                                                 "gpt-5.6-sol",
-                                                 "gpt-5.4-mini",
-                                                 "gpt-4.1-mini",
-                                                 "gpt-4o-mini",
-                                             ],
+                                             values=list(models),
                                              variable=self.ai_model,
-                                             font=ctk.CTkFont(size=13),
+                                             font=_ctk_font(13),
                                              height=34,
                                              corner_radius=6,
                                              border_width=1,
@@ -149,19 +159,19 @@ class AiTabMixin:
                                              dropdown_text_color=self.text_primary,
                                              dropdown_hover_color=self.styles.colors['hover'])
         self.ai_model_combo.grid(row=config_row, column=1, sticky="ew", padx=(0, 20), pady=(0, 24))
+        self.ai_model_combo._cached_values = models
         self._track_combo(self.ai_model_combo)
         config_row += 1
         
         # API Key
         key_label = ctk.CTkLabel(self.ai_config_frame,
                                text="API Key",
-                               font=ctk.CTkFont(size=14, weight="bold"),
+                               font=_ctk_font(14, "bold"),
                                text_color=self.text_primary,
                                anchor="w")
         key_label.grid(row=config_row, column=0, sticky="w", padx=20, pady=(0, 8))
         self._track_label_primary(key_label)
         
-        self.ai_api_key = ctk.StringVar()
         key_frame = ctk.CTkFrame(self.ai_config_frame, fg_color="transparent")
         key_frame.grid(row=config_row, column=1, sticky="ew", padx=(0, 20), pady=(0, 24))
         key_frame.columnconfigure(0, weight=1)
@@ -169,7 +179,7 @@ class AiTabMixin:
         ai_key_entry = ctk.CTkEntry(key_frame,
                                    textvariable=self.ai_api_key,
                                    show="*",
-                                   font=ctk.CTkFont(size=13),
+                                   font=_ctk_font(13),
                                    height=34,
                                    corner_radius=6,
                                    border_width=1,
@@ -183,14 +193,14 @@ class AiTabMixin:
                                     text="显示",
                                     width=80,
                                     height=34,
-                                    font=ctk.CTkFont(size=13),
+                                    font=_ctk_font(13),
                                     corner_radius=6,
                                     fg_color=self.bg_card,
                                     text_color=self.text_primary,
                                     hover_color=self.styles.colors['hover'],
                                     border_width=1,
                                     border_color=self.border_color,
-                                    command=lambda: self.toggle_key_visibility(ai_key_entry))
+                                    command=partial(self.toggle_key_visibility, ai_key_entry))
         key_show_btn.grid(row=0, column=1)
         self._track_outline_button(key_show_btn)
         config_row += 1
@@ -203,7 +213,7 @@ class AiTabMixin:
                                text="测试连接",
                                width=140,
                                height=34,
-                               font=ctk.CTkFont(size=13),
+                               font=_ctk_font(13),
                                corner_radius=6,
                                fg_color=self.bg_card,
                                text_color=self.text_primary,
@@ -214,19 +224,30 @@ class AiTabMixin:
         test_btn.pack(side="left", padx=(0, 12))
         self._track_outline_button(test_btn)
         
+        clear_cache_btn = ctk.CTkButton(test_btn_frame,
+                                      text="清除缓存",
+                                      width=120,
+                                      height=34,
+                                      font=_ctk_font(13),
+                                      corner_radius=6,
+                                      fg_color=self.bg_card,
+                                      text_color=self.text_primary,
+                                      hover_color=self.styles.colors['hover'],
+                                      border_width=1,
+                                      border_color=self.border_color,
+                                      command=self._clear_caches)
+        clear_cache_btn.pack(side="left", padx=(0, 12))
+        self._track_outline_button(clear_cache_btn)
+        
         self.test_status_label = ctk.CTkLabel(test_btn_frame,
                                             text="",
-                                            font=ctk.CTkFont(size=12),
+                                            font=_ctk_font(12),
                                             text_color=self.text_secondary,
                                             anchor="w")
         self.test_status_label.pack(side="left")
-        
-        # 添加底部占位符
-        ctk.CTkLabel(content, text="", height=50).grid(row=row+1, column=0)
-        
-        # 初始隐藏AI配置
-        self.ai_config_frame.grid_remove()
-        
-        self.tab_frames["AI分析"] = tab3
-        tab3.pack_forget()
 
+    def _clear_caches(self):
+        """清除 AI 分析结果与图片渲染缓存，下次分析/生成图片将重新调用 AI、重新渲染"""
+        self._service.clear_ai_cache()
+        self._service.clear_image_cache()
+        self.log("已清除AI分析缓存与图片渲染缓存，下次将重新调用AI服务并重新渲染图片", "info")
@@ -30,6 +30,7 @@ from service import Git2LogsService
 from gui.styles import (
     UIStyles,
     _ctk_ui_font,
+    _ctk_font,
     get_script_path,
     resource_path,
     _resolve_monospace_font,
@@ -40,9 +41,8 @@ logger = logging.getLogger(__name__)
 class DateOutputTabMixin:
     def _create_tab2_date_output(self):
         """创建标签页2: 日期和输出"""
-        # 优化：透明背景且取消圆角
+        # 优化：透明背景且取消圆角；构建时不 pack，首次显示由 _switch_tab 负责
         tab2 = ctk.CTkFrame(self.content_container, fg_color="transparent", corner_radius=0)
-        tab2.pack(fill="both", expand=True, padx=20, pady=20)
         
         content = ctk.CTkFrame(tab2, fg_color="transparent")
         content.pack(fill="both", expand=True, padx=30, pady=10)
@@ -75,7 +75,7 @@ class DateOutputTabMixin:
         today_check = ctk.CTkCheckBox(date_card,
                                     text="今天",
                                     variable=self.use_today,
-                                    font=ctk.CTkFont(size=13),
+                                    font=_ctk_font(13),
                                     text_color=self.text_primary,
                                     fg_color=self.accent_color,
                                     corner_radius=4,
@@ -89,49 +89,37 @@ class DateOutputTabMixin:
         date_input_frame.columnconfigure(0, weight=1, uniform="date_inputs")
         date_input_frame.columnconfigure(1, weight=1, uniform="date_inputs")
         
-        since_label = ctk.CTkLabel(date_input_frame,
-                                 text="起始日期",
-                                 font=ctk.CTkFont(size=11),
-                                 text_color=self.text_secondary,
-                                 anchor="w")
-        since_label.grid(row=0, column=0, padx=(0, 8), sticky="w")
-        self._track_label_secondary(since_label)
-        self.since_date = ctk.StringVar()
-        self.since_entry = ctk.CTkEntry(date_input_frame,
-                                      textvariable=self.since_date,
-                                      font=ctk.CTkFont(size=12),
-                                      height=36,
-                                      corner_radius=6,
-                                      border_width=1,
-                                      border_color=self.border_color,
-                                      fg_color=self.bg_card,
-                                      text_color=self.text_primary)
-        self.since_entry.grid(row=1, column=0, padx=(0, 10), pady=(6, 0), sticky="ew")
-        self._track_entry(self.since_entry, 'card')
-        
-        until_label = ctk.CTkLabel(date_input_frame,
-                                 text="结束日期",
-                                 font=ctk.CTkFont(size=11),
-                                 text_color=self.text_secondary,
-                                 anchor="w")
-        until_label.grid(row=0, column=1, padx=(0, 8), sticky="w")
-        self._track_label_secondary(until_label)
-        self.until_date = ctk.StringVar()
-        self.until_entry = ctk.CTkEntry(date_input_frame,
-                                      textvariable=self.until_date,
-                                      font=ctk.CTkFont(size=12),
-                                      height=36,
-                                      corner_radius=6,
-                                      border_width=1,
-                                      border_color=self.border_color,
-                                      fg_color=self.bg_card,
-                                      text_color=self.text_primary)
-        self.until_entry.grid(row=1, column=1, pady=(6, 0), sticky="ew")
-        self._track_entry(self.until_entry, 'card')
+        # (列, 标题, 变量属性名, 输入框属性名, 输入框右侧间距)
+        date_fields = (
+            (0, "起始日期", "since_date", "since_entry", (0, 10)),
+            (1, "结束日期", "until_date", "until_entry", 0),
+        )
+        for col, text, var_attr, entry_attr, entry_padx in date_fields:
+            date_label = ctk.CTkLabel(date_input_frame,
+                                    text=text,
+                                    font=_ctk_font(11),
+                                    text_color=self.text_secondary,
+                                    anchor="w")
+            date_label.grid(row=0, column=col, padx=(0, 8), sticky="w")
+            self._track_label_secondary(date_label)
+            variable = ctk.StringVar()
+            setattr(self, var_attr, variable)
+            entry = ctk.CTkEntry(date_input_frame,
+                                 textvariable=variable,
+                                 font=_ctk_font(12),
+                                 height=36,
+                                 corner_radius=6,
+                                 border_width=1,
+                                 border_color=self.border_color,
+                                 fg_color=self.bg_card,
+                                 text_color=self.text_primary)
+            entry.grid(row=1, column=col, padx=entry_padx, pady=(6, 0), sticky="ew")
+            setattr(self, entry_attr, entry)
+            self._track_entry(entry, 'card')
         
         date_hint = ctk.CTkLabel(date_card,
                                text="提示: 日期格式为 YYYY-MM-DD，例如: 2025-12-12",
-                               font=ctk.CTkFont(size=11),
+                               font=_ctk_font(11),
                                text_color=self.text_secondary,
                                anchor="w")
         date_hint.grid(row=2, column=0, columnspan=2, sticky="w", padx=20, pady=(16, 20))
@@ -177,31 +165,25 @@ class DateOutputTabMixin:
             fg_color=self.styles.colors["bg_surface"],
             height=220,
             corner_radius=6,
+            scrollbar_fg_color=self.styles.colors["bg_card"],
+            scrollbar_button_color=self.styles.colors["bg_surface"],
+            scrollbar_button_hover_color=self.styles.colors["hover"],
         )
         fmt_scroll.grid(row=1, column=0, sticky="nsew", padx=20, pady=(0, 16))
         self._format_options_scroll = fmt_scroll
-        try:
-            fmt_scroll.configure(
-                scrollbar_fg_color=self.styles.colors["bg_card"],
-                scrollbar_button_color=self.styles.colors["bg_surface"],
-                scrollbar_button_hover_color=self.styles.colors["hover"],
-            )
-        except Exception:
-            logger.debug("配置格式选项滚动条样式失败")
         
+        # 各单选项样式一致，循环外构建一次
+        rb_style = dict(
+            variable=self.output_format,
+            font=self.styles.fonts["body"](),
+            text_color=self.text_primary,
+            fg_color=self.accent_color,
+            hover_color=self.styles.colors["accent_hover"],
+            bg_color=self.styles.colors["bg_surface"],
+            corner_radius=4,
+        )
         for text, value in format_options:
-            rb = ctk.CTkRadioButton(
-                fmt_scroll,
-                text=text,
-                variable=self.output_format,
-                value=value,
-                font=self.styles.fonts["body"](),
-                text_color=self.text_primary,
-                fg_color=self.accent_color,
-                hover_color=self.styles.colors["accent_hover"],
-                bg_color=self.styles.colors["bg_surface"],
-                corner_radius=4,
-            )
+            rb = ctk.CTkRadioButton(fmt_scroll, text=text, value=value, **rb_style)
             rb.pack(anchor="w", padx=10, pady=5)
             self._track_format_radio(rb)
         
@@ -227,10 +209,10 @@ class DateOutputTabMixin:
         output_title.grid(row=0, column=0, sticky="w", padx=20, pady=(20, 16))
         self._track_label_primary(output_title)
         
-        output_label_text = "输出目录" if self.output_format.get() == "all" else "输出文件"
+        # 默认格式为 daily_report，初始文案固定；之后由 on_output_format_changed 随 trace 更新
         self.output_label = ctk.CTkLabel(output_card,
-                                      text=output_label_text,
-                                      font=ctk.CTkFont(size=14, weight="bold"),
+                                      text="输出文件",
+                                      font=_ctk_font(14, "bold"),
                                       text_color=self.text_primary,
                                       anchor="w")
         self.output_label.grid(row=1, column=0, sticky="w", padx=20, pady=(0, 8))
@@ -243,7 +225,7 @@ class DateOutputTabMixin:
         
         output_entry = ctk.CTkEntry(output_frame,
                                   textvariable=self.output_file,
-                                  font=ctk.CTkFont(size=13),
+                                  font=_ctk_font(13),
                                   height=34,
                                   corner_radius=6,
                                   border_width=1,
@@ -257,7 +239,7 @@ class DateOutputTabMixin:
                                  text="浏览",
                                  width=100,
                                  height=34,
-                                 font=ctk.CTkFont(size=13),
+                                 font=_ctk_font(13),
                                  corner_radius=6,
                                  fg_color=self.bg_card,
                                  text_color=self.text_primary,
@@ -270,25 +252,19 @@ class DateOutputTabMixin:
         
         self.output_hint = ctk.CTkLabel(output_card,
                                        text="提示: 批量生成时请选择目录",
-                                       font=ctk.CTkFont(size=11),
+                                       font=_ctk_font(11),
                                        text_color=self.text_secondary,
                                        anchor="w")
         self.output_hint.grid(row=3, column=0, sticky="w", padx=20, pady=(0, 20))
         self._track_label_secondary(self.output_hint)
         
-        # 绑定输出格式变化事件
-        def setup_output_format_trace():
-            try:
-                self.output_format.trace_add('write', self.on_output_format_changed)
-            except Exception:
-                logger.debug("绑定输出格式变化追踪失败")
-        self.root.after(100, setup_output_format_trace)
+        # 绑定输出格式变化事件（输出标签与提示已创建，可直接挂载）
+        self.output_format.trace_add('write', self.on_output_format_changed)
         
         content.columnconfigure(0, weight=1)
         
-        # 添加底部占位符
-        ctk.CTkLabel(content, text="", height=50).grid(row=row+1, column=0)
+        # 底部留白：行最小高度代替空白占位标签
+        content.grid_rowconfigure(row + 1, minsize=50)
         
         self.tab_frames["日期和输出"] = tab2
-        tab2.pack_forget()
     
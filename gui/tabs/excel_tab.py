@@ -7,8 +7,8 @@ import os
 import queue
 import sys
 import threading
-import traceback
 from datetime import datetime
+from functools import partial
 from tkinter import filedialog, messagebox
 
 try:
@@ -30,6 +30,7 @@ from service import Git2LogsService
 from gui.styles import (
     UIStyles,
     _ctk_ui_font,
+    _ctk_font,
     get_script_path,
     resource_path,
     _resolve_monospace_font,
@@ -40,8 +41,8 @@ logger = logging.getLogger(__name__)
 class ExcelTabMixin:
     def _create_tab4_excel_export(self):
         """创建标签页4: Excel导出"""
+        # 构建时不 pack，首次显示由 _switch_tab 负责
         tab4 = ctk.CTkFrame(self.content_container, fg_color="transparent", corner_radius=0)
-        tab4.pack(fill="both", expand=True, padx=20, pady=20)
 
         content = ctk.CTkFrame(tab4, fg_color="transparent")
         content.pack(fill="both", expand=True, padx=30, pady=10)
@@ -63,7 +64,7 @@ class ExcelTabMixin:
 
         excel_status_hdr = ctk.CTkLabel(status_card,
                      text="工时数据来源",
-                     font=ctk.CTkFont(size=15, weight="bold"),
+                     font=_ctk_font(15, "bold"),
                      text_color=self.text_primary,
                      anchor="w")
         excel_status_hdr.grid(row=0, column=0, columnspan=2, sticky="w", padx=20, pady=(20, 8))
@@ -72,7 +73,7 @@ class ExcelTabMixin:
         self._excel_status_label = ctk.CTkLabel(
             status_card,
             text="尚无工时数据。请先生成「工时分配报告」，或点击右侧按钮加载 JSON 文件。",
-            font=ctk.CTkFont(size=13),
+            font=_ctk_font(13),
             text_color=self.text_secondary,
             anchor="w",
             wraplength=400,
@@ -84,7 +85,7 @@ class ExcelTabMixin:
                       text="从文件加载",
                       width=120,
                       height=36,
-                      font=ctk.CTkFont(size=13),
+                      font=_ctk_font(13),
                       corner_radius=6,
                       fg_color=self.bg_card,
                       text_color=self.text_primary,
@@ -112,7 +113,7 @@ class ExcelTabMixin:
 
         tmpl_hdr = ctk.CTkLabel(tmpl_card,
                      text="Excel 模板文件",
-                     font=ctk.CTkFont(size=15, weight="bold"),
+                     font=_ctk_font(15, "bold"),
                      text_color=self.text_primary,
                      anchor="w")
         tmpl_hdr.grid(row=0, column=0, sticky="w", padx=20, pady=(20, 8))
@@ -125,7 +126,7 @@ class ExcelTabMixin:
         self._excel_template_var = ctk.StringVar()
         self._excel_template_entry = ctk.CTkEntry(tmpl_row_frame,
                      textvariable=self._excel_template_var,
-                     font=ctk.CTkFont(size=13),
+                     font=_ctk_font(13),
                      height=34,
                      corner_radius=6,
                      border_width=1,
@@ -140,7 +141,7 @@ class ExcelTabMixin:
                       text="浏览",
                       width=100,
                       height=34,
-                      font=ctk.CTkFont(size=13),
+                      font=_ctk_font(13),
                       corner_radius=6,
                       fg_color=self.bg_card,
                       text_color=self.text_primary,
@@ -153,7 +154,7 @@ class ExcelTabMixin:
 
         tmpl_hint_lbl = ctk.CTkLabel(tmpl_card,
                      text="提示: 模板须含表头行（含「任务名称」「预计工时」等列）及一行示例数据",
-                     font=ctk.CTkFont(size=11),
+                     font=_ctk_font(11),
                      text_color=self.text_secondary,
                      anchor="w")
         tmpl_hint_lbl.grid(row=2, column=0, sticky="w", padx=20, pady=(0, 20))
@@ -180,7 +181,7 @@ class ExcelTabMixin:
 
         proj_hdr = ctk.CTkLabel(proj_title_frame,
                      text="选择要导出的项目",
-                     font=ctk.CTkFont(size=15, weight="bold"),
+                     font=_ctk_font(15, "bold"),
                      text_color=self.text_primary,
                      anchor="w")
         proj_hdr.grid(row=0, column=0, sticky="w")
@@ -193,14 +194,14 @@ class ExcelTabMixin:
                       text="全选",
                       width=60,
                       height=28,
-                      font=ctk.CTkFont(size=12),
+                      font=_ctk_font(12),
                       corner_radius=6,
                       fg_color=self.bg_card,
                       text_color=self.text_primary,
                       hover_color=self.styles.colors['hover'],
                       border_width=1,
                       border_color=self.border_color,
-                      command=lambda: self._select_all_projects(True),
+                      command=partial(self._select_all_projects, True),
                       )
         sel_all_btn.pack(side="left", padx=(0, 6))
         self._track_outline_button(sel_all_btn)
@@ -209,14 +210,14 @@ class ExcelTabMixin:
                       text="全不选",
                       width=60,
                       height=28,
-                      font=ctk.CTkFont(size=12),
+                      font=_ctk_font(12),
                       corner_radius=6,
                       fg_color=self.bg_card,
                       text_color=self.text_primary,
                       hover_color=self.styles.colors['hover'],
                       border_width=1,
                       border_color=self.border_color,
-                      command=lambda: self._select_all_projects(False),
+                      command=partial(self._select_all_projects, False),
                       )
         sel_none_btn.pack(side="left")
         self._track_outline_button(sel_none_btn)
@@ -226,12 +227,13 @@ class ExcelTabMixin:
         self._project_checkbox_frame.grid(row=1, column=0, sticky="ew", padx=20, pady=(0, 20))
         self._project_checkbox_frame.columnconfigure(0, weight=1)
 
-        # 初始占位提示
-        ctk.CTkLabel(self._project_checkbox_frame,
-                     text="（暂无项目数据，请先生成工时报告或加载 JSON 文件）",
-                     font=ctk.CTkFont(size=12),
-                     text_color=self.text_secondary,
-                     anchor="w").pack(anchor="w", pady=4)
+        # 初始占位提示（记入 _project_empty_label，刷新项目列表时复用并随主题重新着色）
+        self._project_empty_label = ctk.CTkLabel(self._project_checkbox_frame,
+                                                 text="（暂无项目数据，请先生成工时报告或加载 JSON 文件）",
+                                                 font=_ctk_font(12),
+                                                 text_color=self.text_secondary,
+                                                 anchor="w")
+        self._project_empty_label.pack(anchor="w", pady=4)
 
         row += 1
 
@@ -249,7 +251,7 @@ class ExcelTabMixin:
 
         out_hdr = ctk.CTkLabel(out_card,
                      text="输出 Excel 文件",
-                     font=ctk.CTkFont(size=15, weight="bold"),
+                     font=_ctk_font(15, "bold"),
                      text_color=self.text_primary,
                      anchor="w")
         out_hdr.grid(row=0, column=0, sticky="w", padx=20, pady=(20, 8))
@@ -262,7 +264,7 @@ class ExcelTabMixin:
         self._excel_output_var = ctk.StringVar()
         self._excel_output_entry = ctk.CTkEntry(out_row_frame,
                      textvariable=self._excel_output_var,
-                     font=ctk.CTkFont(size=13),
+                     font=_ctk_font(13),
                      height=34,
                      corner_radius=6,
                      border_width=1,
@@ -277,7 +279,7 @@ class ExcelTabMixin:
                       text="浏览",
                       width=100,
                       height=34,
-                      font=ctk.CTkFont(size=13),
+                      font=_ctk_font(13),
                       corner_radius=6,
                       fg_color=self.bg_card,
                       text_color=self.text_primary,
@@ -294,7 +296,7 @@ class ExcelTabMixin:
         self._excel_rule_label = ctk.CTkLabel(
             content,
             text="工时规则：单条任务 ≥2h（不足自动汇总），单条任务 ≤8h（超额截断）；同一天小任务（<2h）会压缩为“任务汇总”条目，且导出工时为整数",
-            font=ctk.CTkFont(size=11),
+            font=_ctk_font(11),
             text_color=self.text_secondary,
             anchor="w",
             wraplength=500,
@@ -309,7 +311,7 @@ class ExcelTabMixin:
         self._excel_export_btn = ctk.CTkButton(
             content,
             text="导出到 Excel",
-            font=ctk.CTkFont(size=15, weight="bold"),
+            font=_ctk_font(15, "bold"),
             height=48,
             corner_radius=10,
             fg_color=self.accent_color,
@@ -319,11 +321,10 @@ class ExcelTabMixin:
         )
         self._excel_export_btn.grid(row=row, column=0, sticky="ew", pady=(0, 30))
 
-        # 底部占位
-        ctk.CTkLabel(content, text="", height=50).grid(row=row + 1, column=0)
+        # 底部留白：行最小高度代替空白占位标签
+        content.grid_rowconfigure(row + 1, minsize=50)
 
         self.tab_frames["Excel导出"] = tab4
-        tab4.pack_forget()
 
     # ── Excel 导出相关方法 ─────────────────────────────────────────────────
 
@@ -348,43 +349,53 @@ class ExcelTabMixin:
         self._rebuild_project_checkboxes()
 
     def _rebuild_project_checkboxes(self) -> None:
-        """根据当前工时数据重新生成项目复选框列表。"""
+        """根据当前工时数据刷新项目复选框列表（复用已创建的控件，只改文字、勾选状态与主题色）。"""
         if not hasattr(self, "_project_checkbox_frame"):
             return
-        # 清空旧内容
+        # 隐藏旧内容，控件留在池中供下次复用
         for w in self._project_checkbox_frame.winfo_children():
-            w.destroy() 
+            w.pack_forget()
         self._project_checkboxes.clear()
 
-        if not self._work_hours_data:
-            ctk.CTkLabel(self._project_checkbox_frame,
-                         text="（暂无项目数据，请先生成工时报告或加载 JSON 文件）",
-                         font=ctk.CTkFont(size=12),
-                         text_color=self.text_secondary,
-                         anchor="w").pack(anchor="w", pady=4)
-            return
+        projects = []
+        if self._work_hours_data:
+            from excel_exporter import list_projects
+            projects = list_projects(self._work_hours_data)
 
-        from excel_exporter import list_projects
-        projects = list_projects(self._work_hours_data)
         if not projects:
-            ctk.CTkLabel(self._project_checkbox_frame,
-                         text="（未找到任何项目）",
-                         font=ctk.CTkFont(size=12),
-                         text_color=self.text_secondary,
-                         anchor="w").pack(anchor="w", pady=4)
+            if self._project_empty_label is None:
+                self._project_empty_label = ctk.CTkLabel(self._project_checkbox_frame,
+                                                         text="",
+                                                         font=_ctk_font(12),
+                                                         text_color=self.text_secondary,
+                                                         anchor="w")
+            # 复用的控件保留创建时的颜色，按当前主题重新着色
+            self._project_empty_label.configure(
+                text="（未找到任何项目）" if self._work_hours_data
+                else "（暂无项目数据，请先生成工时报告或加载 JSON 文件）",
+                text_color=self.text_secondary,
+            )
+            self._project_empty_label.pack(anchor="w", pady=4)
             return
 
-        for proj in projects:
-            var = ctk.BooleanVar(value=True)
-            cb = ctk.CTkCheckBox(
-                self._project_checkbox_frame,
-                text=proj,
-                variable=var,
-                font=ctk.CTkFont(size=13),
-                text_color=self.text_primary,
-                fg_color=self.accent_color,
-                corner_radius=4,
-            )
+        pool = self._project_cb_pool
+        for i, proj in enumerate(projects):
+            if i < len(pool):
+                cb, var = pool[i]
+                var.set(True)
+                cb.configure(text=proj, text_color=self.text_primary, fg_color=self.accent_color)
+            else:
+                var = ctk.BooleanVar(value=True)
+                cb = ctk.CTkCheckBox(
+                    self._project_checkbox_frame,
+                    text=proj,
+                    variable=var,
+                    font=_ctk_font(13),
+                    text_color=self.text_primary,
+                    fg_color=self.accent_color,
+                    corner_radius=4,
+                )
+                pool.append((cb, var))
             cb.pack(anchor="w", pady=4)
             self._project_checkboxes[proj] = var
 
@@ -491,7 +502,7 @@ class ExcelTabMixin:
             self.root.after(0, lambda: messagebox.showerror("导出失败", str(e)))
         except Exception as e:
             self.log(f"导出异常: {e}", "error")
-            self.log(traceback.format_exc(), "error")
+            self.log_traceback()
             self._show_toast("Excel 导出异常", "error")
             self.root.after(0, lambda: messagebox.showerror("导出异常", str(e)))
         finally:
@@ -9,6 +9,7 @@ import sys
 import threading
 import traceback
 from datetime import datetime
+from functools import partial
 from tkinter import filedialog, messagebox
 
 try:
@@ -30,6 +31,7 @@ from service import Git2LogsService
 from gui.styles import (
     UIStyles,
     _ctk_ui_font,
+    _ctk_font,
     get_script_path,
     resource_path,
     _resolve_monospace_font,
@@ -41,8 +43,8 @@ class GitlabTabMixin:
     def _create_tab1_gitlab_config(self):
         """创建标签页1: GitLab配置"""
         # 主容器
+        # 构建时不 pack，首次显示由 _switch_tab 负责
         tab1 = ctk.CTkFrame(self.content_container, fg_color="transparent", corner_radius=0)
-        tab1.pack(fill="both", expand=True, padx=self.styles.spacing['md'], pady=self.styles.spacing['md'])
 
         # 滚动容器内的内容框架
         content = ctk.CTkFrame(tab1, fg_color="transparent")
@@ -50,176 +52,84 @@ class GitlabTabMixin:
         content.columnconfigure(0, weight=1)
         
         row = 0
-        
-        # GitLab URL
-        url_label = ctk.CTkLabel(content, text="GitLab URL",
-                                font=ctk.CTkFont(size=14, weight="bold"),
-                                text_color=self.text_primary,
-                                anchor="w")
-        url_label.grid(row=row, column=0, columnspan=2, sticky="w", pady=(0, 8))
-        self._track_label_primary(url_label)
-        row += 1
-        
-        self.gitlab_url = ctk.StringVar()
-        gitlab_entry = ctk.CTkEntry(content,
-                                  textvariable=self.gitlab_url,
-                                  placeholder_text="https://gitlab.com 或 http://gitlab.yourcompany.com",
-                                  font=ctk.CTkFont(size=13),
-                                  height=34,
-                                  corner_radius=6,
-                                  border_width=1,
-                                  border_color=self.border_color,
-                                  fg_color=self.bg_main,
-                                  text_color=self.text_primary)
-        gitlab_entry.grid(row=row, column=0, columnspan=2, sticky="ew", pady=(0, 8))
-        self._track_entry(gitlab_entry, 'main')
-        row += 1
-        self._validation_labels['gitlab_url'] = ctk.CTkLabel(
-            content, text="", font=self.styles.fonts['caption'](),
-            text_color=self.styles.colors['text_secondary'], anchor="w")
-        self._validation_labels['gitlab_url'].grid(row=row, column=0, columnspan=2, sticky="w", pady=(0, 16))
-        row += 1
-        
-        # 仓库地址
-        repo_label = ctk.CTkLabel(content, text="仓库地址",
-                                 font=ctk.CTkFont(size=14, weight="bold"),
-                                 text_color=self.text_primary,
-                                 anchor="w")
-        repo_label.grid(row=row, column=0, columnspan=2, sticky="w", pady=(0, 8))
-        self._track_label_primary(repo_label)
-        row += 1
-        
-        self.repo = ctk.StringVar()
-        repo_entry = ctk.CTkEntry(content,
-                                 textvariable=self.repo,
-                                 font=ctk.CTkFont(size=13),
-                                 height=34,
-                                 corner_radius=6,
-                                 border_width=1,
-                                 border_color=self.border_color,
-                                 fg_color=self.bg_main,
-                                 text_color=self.text_primary)
-        repo_entry.grid(row=row, column=0, columnspan=2, sticky="ew", pady=(0, 8))
-        self._track_entry(repo_entry, 'main')
-        row += 1
-        self._validation_labels['repo'] = ctk.CTkLabel(
-            content, text="", font=self.styles.fonts['caption'](),
-            text_color=self.styles.colors['text_secondary'], anchor="w")
-        self._validation_labels['repo'].grid(row=row, column=0, columnspan=2, sticky="w", pady=(0, 16))
-        row += 1
-        
+
+        # (标签, 变量属性名, 默认值, 校验键, 额外 CTkEntry 参数)
+        leading_fields = (
+            ("GitLab URL", "gitlab_url", "", "gitlab_url",
+             {"placeholder_text": "https://gitlab.com 或 http://gitlab.yourcompany.com"}),
+            ("仓库地址", "repo", "", "repo", {}),
+        )
+        trailing_fields = (
+            ("分支", "branch", "", None, {}),
+            ("提交者", "author", "MIZUKI", "author", {}),
+        )
+
+        for label, attr, default, validation_key, overrides in leading_fields:
+            row = self._add_labeled_entry(content, row, label, attr, default,
+                                          validation_key, **overrides)
+
         # 扫描所有项目选项
         self.scan_all = ctk.BooleanVar(value=False)
-        scan_check = ctk.CTkCheckBox(content,
+        scan_frame = ctk.CTkFrame(content, fg_color="transparent")
+        scan_frame.grid(row=row, column=0, columnspan=2, sticky="ew", pady=(0, 24))
+        scan_check = ctk.CTkCheckBox(scan_frame,
                                     text="自动扫描所有项目（不填仓库地址时启用）",
                                     variable=self.scan_all,
-                                    font=ctk.CTkFont(size=13),
+                                    font=_ctk_font(13),
                                     text_color=self.text_primary,
                                     fg_color=self.accent_color,
                                     corner_radius=4)
-        scan_check.grid(row=row, column=0, columnspan=2, sticky="w", pady=(0, 24))
+        scan_check.pack(side="left")
         self._track_check_or_radio(scan_check)
-        row += 1
-        
-        # 分支
-        branch_label = ctk.CTkLabel(content, text="分支",
-                                  font=ctk.CTkFont(size=14, weight="bold"),
-                                  text_color=self.text_primary,
-                                  anchor="w")
-        branch_label.grid(row=row, column=0, columnspan=2, sticky="w", pady=(0, 8))
-        self._track_label_primary(branch_label)
-        row += 1
-        
-        self.branch = ctk.StringVar()
-        branch_entry = ctk.CTkEntry(content,
-                                   textvariable=self.branch,
-                                   font=ctk.CTkFont(size=13),
-                                   height=34,
+
+        # 项目列表与扫描结果在会话内缓存，新建项目或改写历史后可手动刷新
+        refresh_btn = ctk.CTkButton(scan_frame,
+                                   text="刷新项目列表",
+                                   width=110,
+                                   height=30,
+                                   font=_ctk_font(12),
                                    corner_radius=6,
-                                   border_width=1,
-                                   border_color=self.border_color,
-                                   fg_color=self.bg_main,
-                                   text_color=self.text_primary)
-        branch_entry.grid(row=row, column=0, columnspan=2, sticky="ew", pady=(0, 24))
-        self._track_entry(branch_entry, 'main')
-        row += 1
-        
-        # 提交者
-        author_label = ctk.CTkLabel(content, text="提交者",
-                                   font=ctk.CTkFont(size=14, weight="bold"),
+                                   fg_color=self.bg_card,
                                    text_color=self.text_primary,
-                                   anchor="w")
-        author_label.grid(row=row, column=0, columnspan=2, sticky="w", pady=(0, 8))
-        self._track_label_primary(author_label)
-        row += 1
-        
-        self.author = ctk.StringVar(value="MIZUKI")
-        author_entry = ctk.CTkEntry(content,
-                                   textvariable=self.author,
-                                   font=ctk.CTkFont(size=13),
-                                   height=34,
-                                   corner_radius=6,
+                                   hover_color=self.styles.colors['hover'],
                                    border_width=1,
                                    border_color=self.border_color,
-                                   fg_color=self.bg_main,
-                                   text_color=self.text_primary)
-        author_entry.grid(row=row, column=0, columnspan=2, sticky="ew", pady=(0, 8))
-        self._track_entry(author_entry, 'main')
+                                   command=self._refresh_project_list)
+        refresh_btn.pack(side="right")
+        self._track_outline_button(refresh_btn)
         row += 1
-        self._validation_labels['author'] = ctk.CTkLabel(
-            content, text="", font=self.styles.fonts['caption'](),
-            text_color=self.styles.colors['text_secondary'], anchor="w")
-        self._validation_labels['author'].grid(row=row, column=0, columnspan=2, sticky="w", pady=(0, 16))
-        row += 1
-        
-        # 访问令牌
-        token_label = ctk.CTkLabel(content, text="访问令牌",
-                                 font=ctk.CTkFont(size=14, weight="bold"),
-                                 text_color=self.text_primary,
-                                 anchor="w")
-        token_label.grid(row=row, column=0, columnspan=2, sticky="w", pady=(0, 8))
-        self._track_label_primary(token_label)
-        row += 1
-        
+
+        for label, attr, default, validation_key, overrides in trailing_fields:
+            row = self._add_labeled_entry(content, row, label, attr, default,
+                                          validation_key, **overrides)
+
+        # 访问令牌（输入框与“显示”按钮同行）
+        row = self._add_form_label(content, row, "访问令牌")
         self.token = ctk.StringVar()
         token_frame = ctk.CTkFrame(content, fg_color="transparent")
         token_frame.grid(row=row, column=0, columnspan=2, sticky="ew", pady=(0, 8))
         token_frame.columnconfigure(0, weight=1)
-        
-        token_entry = ctk.CTkEntry(token_frame,
-                                  textvariable=self.token,
-                                  show="*",
-                                  font=ctk.CTkFont(size=13),
-                                  height=34,
-                                  corner_radius=6,
-                                  border_width=1,
-                                  border_color=self.border_color,
-                                  fg_color=self.bg_main,
-                                  text_color=self.text_primary)
+
+        token_entry = self._make_form_entry(token_frame, self.token, show="*")
         token_entry.grid(row=0, column=0, sticky="ew", padx=(0, 8))
-        self._track_entry(token_entry, 'main')
-        
+
         show_btn = ctk.CTkButton(token_frame,
                                 text="显示",
                                 width=80,
                                 height=34,
-                                font=ctk.CTkFont(size=13),
+                                font=_ctk_font(13),
                                 corner_radius=6,
                                 fg_color=self.bg_card,
                                 text_color=self.text_primary,
                                 hover_color=self.styles.colors['hover'],
                                 border_width=1,
                                 border_color=self.border_color,
-                                command=lambda: self.toggle_token_visibility(token_entry))
+                                command=partial(self.toggle_token_visibility, token_entry))
         show_btn.grid(row=0, column=1)
         self._track_outline_button(show_btn)
         row += 1
-        self._validation_labels['token'] = ctk.CTkLabel(
-            content, text="", font=self.styles.fonts['caption'](),
-            text_color=self.styles.colors['text_secondary'], anchor="w")
-        self._validation_labels['token'].grid(row=row, column=0, columnspan=2, sticky="w", pady=(0, 16))
-        row += 1
-        
+        row = self._add_validation_label(content, row, 'token')
+
         # 使用提示卡片
         hint_frame = ctk.CTkFrame(content,
                                  fg_color=self.bg_main,
@@ -231,7 +141,7 @@ class GitlabTabMixin:
         
         hint_title = ctk.CTkLabel(hint_frame,
                                 text="使用提示",
-                                font=ctk.CTkFont(size=13, weight="bold"),
+                                font=_ctk_font(13, "bold"),
                                 text_color=self.text_primary,
                                 anchor="w")
         hint_title.pack(anchor="w", padx=16, pady=(16, 8))
@@ -240,18 +150,66 @@ class GitlabTabMixin:
         hint_text = "• GitLab URL 是您的GitLab实例地址\n• 仓库地址留空时，勾选'自动扫描所有项目'可扫描所有项目\n• 访问令牌用于身份验证，可在GitLab设置中生成"
         hint_label = ctk.CTkLabel(hint_frame,
                                  text=hint_text,
-                                 font=ctk.CTkFont(size=12),
+                                 font=_ctk_font(12),
                                  text_color=self.text_secondary,
                                  justify="left",
                                  anchor="w")
         hint_label.pack(anchor="w", padx=16, pady=(0, 16))
         self._track_label_secondary(hint_label)
         
-        # 添加底部占位符
-        ctk.CTkLabel(content, text="", height=50).grid(row=row + 1, column=0)
+        # 底部留白：行最小高度代替空白占位标签
+        content.grid_rowconfigure(row + 1, minsize=50)
         
         self.tab_frames["GitLab配置"] = tab1
-        tab1.pack_forget()  # 初始隐藏
+
+    def _add_form_label(self, parent, row, text):
+        """表单字段标题，返回下一行号。"""
+        label = ctk.CTkLabel(parent, text=text,
+                             font=_ctk_font(14, "bold"),
+                             text_color=self.text_primary,
+                             anchor="w")
+        label.grid(row=row, column=0, columnspan=2, sticky="w", pady=(0, 8))
+        self._track_label_primary(label)
+        return row + 1
+
+    def _make_form_entry(self, parent, variable, **overrides):
+        """创建统一样式的表单输入框并登记主题刷新。"""
+        entry = ctk.CTkEntry(parent,
+                             textvariable=variable,
+                             font=_ctk_font(13),
+                             height=34,
+                             corner_radius=6,
+                             border_width=1,
+                             border_color=self.border_color,
+                             fg_color=self.bg_main,
+                             text_color=self.text_primary,
+                             **overrides)
+        self._track_entry(entry, 'main')
+        return entry
+
+    def _add_validation_label(self, parent, row, key):
+        """字段下方的实时校验提示，返回下一行号。"""
+        label = ctk.CTkLabel(
+            parent, text="", font=self.styles.fonts['caption'](),
+            text_color=self.styles.colors['text_secondary'], anchor="w")
+        label.grid(row=row, column=0, columnspan=2, sticky="w", pady=(0, 16))
+        self._validation_labels[key] = label
+        return row + 1
+
+    def _add_labeled_entry(self, parent, row, label, attr, default="",
+                           validation_key=None, **overrides):
+        """标题 + 输入框（+ 校验提示）一行，变量存为 self.<attr>，返回下一行号。"""
+        row = self._add_form_label(parent, row, label)
+        variable = ctk.StringVar(value=default)
+        setattr(self, attr, variable)
+        entry = self._make_form_entry(parent, variable, **overrides)
+        # 无校验提示的字段直接留出与下一组之间的间距
+        entry.grid(row=row, column=0, columnspan=2, sticky="ew",
+                   pady=(0, 8) if validation_key else (0, 24))
+        row += 1
+        if validation_key:
+            row = self._add_validation_label(parent, row, validation_key)
+        return row
 
     def _bind_form_validation(self):
         """绑定表单验证事件"""
@@ -264,6 +222,11 @@ class GitlabTabMixin:
         # 绑定扫描选项变化
         self.scan_all.trace_add('write', lambda *args: self._on_scan_all_toggle())
 
+    def _refresh_project_list(self):
+        """清空 GitLab 相关缓存，下次生成时完整重新获取"""
+        self._service.clear_gitlab_cache()
+        self.log("已清空项目列表与提交缓存，下次生成将完整重新获取", "info")
+
     def _validate_gitlab_url(self, *args):
         """实时验证 GitLab URL 格式"""
         url = self.gitlab_url.get().strip()
@@ -3,13 +3,22 @@
 """
 统一的 HTML 转图片模块
 
-整合 Chrome headless 和 Playwright 两种渲染方案，
+整合 Playwright 和 Chrome headless 两种渲染方案，
 按优先级自动选择可用的转换引擎。
 """
+import atexit
+import hashlib
 import os
+import queue
+import shutil
 import sys
 import subprocess
+import tempfile
 import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
 from pathlib import Path
 
 from config import ImageConfig
@@ -29,6 +38,11 @@ if sys.platform == 'win32':
     ]
 
 
+def _is_jpeg(output_path: Path) -> bool:
+    """按输出文件后缀判断是否输出 JPEG（编码比 PNG 快、体积更小）"""
+    return output_path.suffix.lower() in ('.jpg', '.jpeg')
+
+
 def _find_chrome() -> str | None:
     """在常见路径中查找 Chrome/Chromium 可执行文件"""
     for path in CHROME_CANDIDATES:
@@ -79,8 +93,103 @@ def _convert_with_chrome(html_path: Path, output_path: Path, width: int) -> bool
         return False
 
 
+# Playwright 同步 API 绑定创建它的线程：所有渲染都投递到同一个常驻线程执行，
+# 浏览器只启动一次，GUI 每次生成新开的工作线程也能复用。
+_render_queue = queue.Queue()
+_render_thread = None
+_render_thread_lock = threading.Lock()
+_playwright_launch_failed = False
+
+
+def _playwright_render_loop(sync_playwright) -> None:
+    """常驻渲染线程：按需启动 Chromium，逐个处理截图任务，收到 None 时关闭退出"""
+    global _playwright_launch_failed
+    pw = browser = None
+    try:
+        while True:
+            job = _render_queue.get()
+            if job is None:
+                break
+            html_path, output_path, width, future = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                if browser is None or not browser.is_connected():
+                    try:
+                        if pw is None:
+                            pw = sync_playwright().start()
+                        browser = pw.chromium.launch(headless=True)
+                    except Exception:
+                        # 未安装浏览器等启动失败：后续直接走 Chrome，不再反复尝试
+                        _playwright_launch_failed = True
+                        raise
+                _screenshot_page(browser, html_path, output_path, width)
+                future.set_result(True)
+            except Exception as exc:
+                future.set_exception(exc)
+    finally:
+        for close in (getattr(browser, 'close', None), getattr(pw, 'stop', None)):
+            if close is not None:
+                try:
+                    close()
+                except Exception as exc:
+                    logger.debug("关闭 Playwright 失败: %s", exc)
+
+
+def _submit_playwright_render(sync_playwright, html_path: Path, output_path: Path, width: int) -> Future:
+    """把截图任务投递到常驻渲染线程（首次调用时启动该线程）"""
+    global _render_thread
+    with _render_thread_lock:
+        if _render_thread is None:
+            _render_thread = threading.Thread(
+                target=_playwright_render_loop, args=(sync_playwright,),
+                name="playwright-render", daemon=True,
+            )
+            _render_thread.start()
+    future = Future()
+    _render_queue.put((html_path, output_path, width, future))
+    return future
+
+
+def close_playwright_browser() -> None:
+    """关闭常驻的 Playwright 浏览器（进程退出时自动调用）"""
+    global _render_thread
+    with _render_thread_lock:
+        thread, _render_thread = _render_thread, None
+    if thread is not None:
+        _render_queue.put(None)
+        thread.join(timeout=10)
+
+
+atexit.register(close_playwright_browser)
+
+
+_PAGE_READY_JS = (
+    "async () => { await document.fonts.ready; "
+    "return Array.from(document.images).every(img => img.complete); }"
+)
+
+
+def _screenshot_page(browser, html_path: Path, output_path: Path, width: int) -> None:
+    # 固定 1 倍像素比：HiDPI 主机上不会渲染出 2 倍尺寸的位图
+    page = browser.new_page(viewport={"width": width, "height": 2400}, device_scale_factor=1)
+    try:
+        page.goto(f"file://{html_path}", wait_until="domcontentloaded")
+        # 字体与图片就绪即截图，不再固定等待
+        page.wait_for_function(_PAGE_READY_JS, timeout=ImageConfig.PLAYWRIGHT_READY_TIMEOUT_MS)
+        if _is_jpeg(output_path):
+            page.screenshot(path=str(output_path), full_page=True,
+                            type="jpeg", quality=ImageConfig.JPEG_QUALITY)
+        else:
+            page.screenshot(path=str(output_path), full_page=True)
+    finally:
+        page.close()
+
+
 def _convert_with_playwright(html_path: Path, output_path: Path, width: int) -> bool:
-    """使用 Playwright Chromium 截图"""
+    """使用 Playwright Chromium 截图（常驻浏览器，省去每次冷启动）"""
+    if _playwright_launch_failed:
+        return False
     try:
         from playwright.sync_api import sync_playwright
     except ImportError:
@@ -90,16 +199,7 @@ def _convert_with_playwright(html_path: Path, output_path: Path, width: int) ->
     logger.info("正在使用 Playwright 渲染: %s", html_path.name)
 
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.set_viewport_size({"width": width, "height": 2400})
-            page.goto(f"file://{html_path}")
-            page.wait_for_load_state("networkidle")
-            page.wait_for_timeout(ImageConfig.PLAYWRIGHT_WAIT_MS)
-            page.screenshot(path=str(output_path), full_page=True)
-            browser.close()
-
+        _submit_playwright_render(sync_playwright, html_path, output_path, width).result()
         logger.info("Playwright 截图成功: %s", output_path.name)
         return True
 
@@ -108,20 +208,86 @@ def _convert_with_playwright(html_path: Path, output_path: Path, width: int) ->
         return False
 
 
+def _render_cache_path(html_path: Path, output_path: Path, width: int) -> Path | None:
+    """按 HTML 内容与渲染参数（宽度、格式、质量）计算渲染缓存路径；读取失败返回 None"""
+    try:
+        digest = hashlib.sha256(html_path.read_bytes())
+    except OSError:
+        return None
+    suffix = '.jpg' if _is_jpeg(output_path) else '.png'
+    digest.update(f"|{width}|{suffix}|{ImageConfig.JPEG_QUALITY}".encode('utf-8'))
+    return Path(ImageConfig.RENDER_CACHE_DIR) / f"{digest.hexdigest()}{suffix}"
+
+
+def _cache_refresh_requested() -> bool:
+    """GIT2LOGS_CACHE_REFRESH=1 时忽略已有缓存，强制重新渲染"""
+    return os.environ.get("GIT2LOGS_CACHE_REFRESH") == "1"
+
+
+def _output_is_fresh(html_path: Path, output_path: Path, cache_path: Path) -> bool:
+    """输出图片比 HTML 新，且与当前渲染参数（宽度、格式）对应的缓存图片大小一致时视为最新
+
+    只比较 mtime 会在宽度或格式变化后误用旧图；cache_path 已按这些参数计算，
+    参数变化时对应缓存不存在或大小不同，不会跳过渲染。
+    """
+    try:
+        out_stat = output_path.stat()
+        return (out_stat.st_mtime > html_path.stat().st_mtime
+                and out_stat.st_size == cache_path.stat().st_size)
+    except OSError:
+        return False
+
+
+def _store_render_cache(output_path: Path, cache_path: Path) -> None:
+    """渲染成功后写入缓存（先复制到临时文件再替换，避免半截缓存），并清理过期缓存"""
+    tmp_path = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # 并发渲染同一内容时各自使用独立临时文件
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name + '.', suffix='.tmp')
+        os.close(fd)
+        shutil.copyfile(output_path, tmp_path)
+        os.replace(tmp_path, cache_path)
+    except OSError as exc:
+        logger.debug("写入渲染缓存失败: %s", exc)
+        if tmp_path is not None:
+            with suppress(OSError):
+                os.remove(tmp_path)
+    _prune_render_cache(cache_path.parent)
+
+
+def _prune_render_cache(cache_dir: Path, ttl: int = ImageConfig.RENDER_CACHE_TTL) -> None:
+    """删除超过 ttl 秒未被使用的渲染缓存（命中时会刷新 mtime，常用图片不会被清理）"""
+    cutoff = time.time() - ttl
+    try:
+        entries = list(os.scandir(cache_dir))
+    except OSError:
+        return
+    for entry in entries:
+        with suppress(OSError):
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+
+
+def clear_render_cache() -> None:
+    """删除全部 HTML→图片渲染缓存"""
+    shutil.rmtree(ImageConfig.RENDER_CACHE_DIR, ignore_errors=True)
+
+
 def convert_html_to_image(
     html_path: str | os.PathLike,
     output_path: str | os.PathLike,
     width: int = ImageConfig.DEFAULT_WIDTH,
 ) -> bool:
-    """将 HTML 文件转换为 PNG 图片
+    """将 HTML 文件转换为 PNG / JPEG 图片
 
     按以下优先级尝试可用的渲染引擎:
-      1. Chrome headless（速度快、无额外依赖）
-      2. Playwright Chromium（全页面截图质量更高）
+      1. Playwright Chromium（浏览器常驻复用，全页面截图质量更高）
+      2. Chrome headless（无额外依赖，每次启动进程；仅 PNG）
 
     Args:
         html_path: 输入 HTML 文件路径
-        output_path: 输出 PNG 文件路径
+        output_path: 输出图片路径，后缀为 .jpg/.jpeg 时输出 JPEG
         width: 视口宽度（像素），默认从 ImageConfig.DEFAULT_WIDTH 读取
 
     Returns:
@@ -136,21 +302,73 @@ def convert_html_to_image(
 
     out_abs.parent.mkdir(parents=True, exist_ok=True)
 
-    if _convert_with_chrome(html_abs, out_abs, width):
+    refresh = _cache_refresh_requested()
+    cache_path = _render_cache_path(html_abs, out_abs, width)
+    if cache_path is not None and not refresh and _output_is_fresh(html_abs, out_abs, cache_path):
+        with suppress(OSError):
+            os.utime(cache_path)
+        logger.info("图片比 HTML 新且渲染参数未变，跳过渲染: %s", out_abs.name)
         return True
 
-    if _convert_with_playwright(html_abs, out_abs, width):
+    if cache_path is not None and cache_path.exists() and not refresh:
+        try:
+            shutil.copyfile(cache_path, out_abs)
+            with suppress(OSError):
+                os.utime(cache_path)  # 记录最近使用时间，供过期清理判断
+            logger.info("HTML 内容未变化，复用已渲染图片: %s", out_abs.name)
+            return True
+        except OSError as exc:
+            logger.debug("复用渲染缓存失败: %s", exc)
+
+    # 常驻的 Playwright 浏览器优先，批量渲染只付一次启动开销；
+    # Chrome --screenshot 每次冷启动且只输出 PNG，作为后备
+    if _convert_with_playwright(html_abs, out_abs, width) \
+            or (not _is_jpeg(out_abs) and _convert_with_chrome(html_abs, out_abs, width)):
+        if cache_path is not None:
+            _store_render_cache(out_abs, cache_path)
         return True
 
     logger.error("所有渲染引擎均不可用，无法生成图片")
     return False
 
 
+def _render_workers() -> int:
+    """批量渲染并发数：GIT2LOGS_RENDER_WORKERS 覆盖 ImageConfig.RENDER_WORKERS"""
+    try:
+        return max(1, int(os.environ.get("GIT2LOGS_RENDER_WORKERS", ImageConfig.RENDER_WORKERS)))
+    except ValueError:
+        return ImageConfig.RENDER_WORKERS
+
+
+def convert_html_files_to_images(
+    pairs,
+    width: int = ImageConfig.DEFAULT_WIDTH,
+) -> list[bool]:
+    """批量将 HTML 转为图片
+
+    Playwright 任务本就排队复用同一个常驻浏览器；退回 Chrome 子进程时
+    多个文件并行渲染（每个 Chromium 约占 200MB，并发数默认上限 4）。
+
+    Args:
+        pairs: (html_path, output_path) 序列
+        width: 视口宽度（像素）
+
+    Returns:
+        与 pairs 顺序对应的成功标志列表
+    """
+    pairs = list(pairs)
+    workers = min(_render_workers(), len(pairs))
+    if workers <= 1:
+        return [convert_html_to_image(html, out, width) for html, out in pairs]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda pair: convert_html_to_image(pair[0], pair[1], width), pairs))
+
+
 if __name__ == '__main__':
     logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 
     if len(sys.argv) < 2:
-        print("用法: python image_converter.py <html_file> [output_file] [width]")
+        print("用法: python image_converter.py <html_file> [output_file(.png|.jpg)] [width]")
         sys.exit(1)
 
     src = sys.argv[1]
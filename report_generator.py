@@ -13,6 +13,7 @@
 import os
 import re
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from collections import defaultdict
 from pathlib import Path
@@ -25,8 +26,10 @@ from utils.date_utils import (
     get_date_range_days,
     to_local_datetime,
     to_local_date_str,
+    report_date_prefix,
 )
 from config import ReportConfig
+from utils.file_utils import atomic_write_text
 from commit_analysis import (
     analyze_commit_type, get_commit_details,
     calculate_code_statistics, get_commit_display_info,
@@ -40,6 +43,36 @@ from work_hours import (
 
 logger = logging.getLogger(__name__)
 
+# 约定式提交前缀（feat(scope): 等），清理提交主题时逐条使用
+_CONVENTIONAL_PREFIX_RE = re.compile(
+    r"^(?:feat|fix|refactor|style|perf|chore|docs|test|build|ci|revert)(?:\([^)]*\))?:\s*",
+    re.I,
+)
+# 报告头部元信息（提交者 / 时间范围），一次扫描提取；只看文件开头，不触及正文
+_REPORT_META_RE = re.compile(r'^\*\*(提交者|统计时间范围|起始日期|结束日期)\*\*:[ \t]*(.+?)[ \t]*$', re.M)
+_REPORT_META_SCAN_CHARS = 4096
+
+
+def parse_report_meta(report_content):
+    """
+    从已生成报告的头部提取作者与日期范围
+
+    Returns:
+        tuple: (author, since_date, until_date)；作者缺失时为 "未知作者"，日期缺失时为 None
+    """
+    meta = {}
+    for match in _REPORT_META_RE.finditer(report_content, 0, _REPORT_META_SCAN_CHARS):
+        meta.setdefault(match.group(1), match.group(2))
+
+    author = meta.get('提交者', "未知作者")
+    date_range = meta.get('统计时间范围')
+    if date_range and ' 至 ' in date_range:
+        since_date, until_date = (part.strip() for part in date_range.split(' 至 ', 1))
+    else:
+        since_date = meta.get('起始日期')
+        until_date = meta.get('结束日期')
+    return author, since_date, until_date
+
 
 def _append_report_header(lines, author_name, since_date=None, until_date=None):
     """向报告追加通用的头部信息（生成时间、提交者、日期范围）"""
@@ -102,12 +135,12 @@ def generate_markdown_log(grouped_commits, author_name, repo_name=None, project=
                     changed_files = details['changed_files']
                 except Exception as e:
                     logger.debug(f"获取commit详情失败: {str(e)}")
-                    short_message = commit.message.split('\n')[0] if commit.message else ''
+                    short_message = commit.message.partition('\n')[0] if commit.message else ''
                     full_message = commit.message or ''
                     stats = None
                     changed_files = []
             else:
-                short_message = commit.message.split('\n')[0] if commit.message else ''
+                short_message = commit.message.partition('\n')[0] if commit.message else ''
                 full_message = commit.message or ''
                 stats = None
                 changed_files = []
@@ -246,7 +279,7 @@ def generate_multi_project_markdown(all_results, author_name, since_date=None, u
                     changed_files = details['changed_files']
                 except Exception as e:
                     logger.debug(f"获取commit详情失败: {str(e)}")
-                    short_message = commit.message.split('\n')[0] if commit.message else ''
+                    short_message = commit.message.partition('\n')[0] if commit.message else ''
                     full_message = commit.message or ''
                     stats = None
                     changed_files = []
@@ -512,28 +545,28 @@ def generate_all_reports(all_results, author_name, output_dir, since_date=None,
     output_path.mkdir(parents=True, exist_ok=True)
     
     # 确定文件前缀
-    if since_date and until_date and since_date == until_date:
-        date_prefix = since_date
-    else:
-        date_prefix = datetime.now().strftime('%Y-%m-%d')
+    date_prefix = report_date_prefix(since_date, until_date)
     
     generated_files = {}
     
-    # 1. 生成统计报告
-    if generate_statistics:
+    # 1. 生成统计报告：与日报 → HTML → PNG 链路互不依赖，放到后台线程并行；
+    #    PNG 渲染（外部浏览器进程）期间统计报告可继续生成
+    def write_statistics():
         try:
             log("正在生成统计报告...")
             stats_content = generate_statistics_report(
                 all_results, author_name, since_date, until_date
             )
             stats_file = output_path / f"{date_prefix}_statistics.md"
-            with open(stats_file, 'w', encoding='utf-8') as f:
-                f.write(stats_content)
-            generated_files['statistics'] = str(stats_file)
+            atomic_write_text(stats_file, stats_content)
             log(f"✓ 统计报告已保存: {stats_file}")
+            return str(stats_file)
         except Exception as e:
             log(f"✗ 生成统计报告失败: {str(e)}")
-            generated_files['statistics'] = None
+            return None
+    
+    stats_executor = ThreadPoolExecutor(max_workers=1) if generate_statistics else None
+    stats_future = stats_executor.submit(write_statistics) if stats_executor else None
     
     # 2. 生成开发日报
     daily_file = None
@@ -544,8 +577,7 @@ def generate_all_reports(all_results, author_name, output_dir, since_date=None,
                 all_results, author_name, since_date, until_date
             )
             daily_file = output_path / f"{date_prefix}_daily_report.md"
-            with open(daily_file, 'w', encoding='utf-8') as f:
-                f.write(daily_content)
+            atomic_write_text(daily_file, daily_content)
             generated_files['daily_report'] = str(daily_file)
             log(f"✓ 开发日报已保存: {daily_file}")
         except Exception as e:
@@ -598,11 +630,15 @@ def generate_all_reports(all_results, author_name, output_dir, since_date=None,
             log(f"✗ 生成PNG失败: {str(e)}")
             generated_files['png'] = None
     
+    if stats_future is not None:
+        generated_files = {'statistics': stats_future.result(), **generated_files}
+        stats_executor.shutdown()
+    
     log(f"批量生成完成！共生成 {len([f for f in generated_files.values() if f])} 个文件")
     return generated_files
 
 
-def generate_ai_analysis_report(analysis_result, author_name, since_date=None, until_date=None):
+def generate_ai_analysis_report(analysis_result, author_name, since_date=None, until_date=None, out=None):
     """
     生成AI分析报告
     
@@ -611,56 +647,58 @@ def generate_ai_analysis_report(analysis_result, author_name, since_date=None, u
         author_name: 提交者姓名
         since_date: 起始日期（可选）
         until_date: 结束日期（可选）
+        out: 可写文本流（可选）；提供时逐段写入 out，不再拼接完整字符串
     
     Returns:
-        str: Markdown格式的AI分析报告
+        str: Markdown格式的AI分析报告；提供 out 时返回 None
     """
     lines = []
+    emit = out.write if out is not None else lines.append
     
     # 标题
-    lines.append(f"# {author_name} - AI智能分析报告\n")
-    lines.append(f"**生成时间**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-    lines.append(f"**提交者**: {author_name}\n")
-    lines.append(f"**分析方式**: 🤖 AI智能分析（使用AI模型进行深度分析）\n")
+    emit(f"# {author_name} - AI智能分析报告\n")
+    emit(f"**生成时间**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    emit(f"**提交者**: {author_name}\n")
+    emit(f"**分析方式**: 🤖 AI智能分析（使用AI模型进行深度分析）\n")
     
     # 从analysis_result中提取AI服务信息（如果存在）
     if 'ai_service' in analysis_result:
-        lines.append(f"**AI服务**: {analysis_result.get('ai_service', '未知')}\n")
+        emit(f"**AI服务**: {analysis_result.get('ai_service', '未知')}\n")
     if 'ai_model' in analysis_result:
-        lines.append(f"**AI模型**: {analysis_result.get('ai_model', '未知')}\n")
+        emit(f"**AI模型**: {analysis_result.get('ai_model', '未知')}\n")
     
     if since_date and until_date:
-        lines.append(f"**分析时间范围**: {since_date} 至 {until_date}\n")
+        emit(f"**分析时间范围**: {since_date} 至 {until_date}\n")
     elif since_date:
-        lines.append(f"**起始日期**: {since_date}\n")
+        emit(f"**起始日期**: {since_date}\n")
     elif until_date:
-        lines.append(f"**结束日期**: {until_date}\n")
+        emit(f"**结束日期**: {until_date}\n")
     
-    lines.append("\n---\n\n")
+    emit("\n---\n\n")
     
     # 检查是否有错误
     if 'error' in analysis_result:
-        lines.append("## ⚠️ 分析错误\n\n")
-        lines.append(f"AI分析过程中出现错误: {analysis_result['error']}\n\n")
+        emit("## ⚠️ 分析错误\n\n")
+        emit(f"AI分析过程中出现错误: {analysis_result['error']}\n\n")
         if 'raw_response' in analysis_result:
-            lines.append("### 原始响应\n\n")
-            lines.append(f"```\n{analysis_result['raw_response']}\n```\n")
-        return ''.join(lines)
+            emit("### 原始响应\n\n")
+            emit(f"```\n{analysis_result['raw_response']}\n```\n")
+        return None if out is not None else ''.join(lines)
     
     # 检查是否有原始响应但无法解析（这种情况也应该显示原始响应）
     if 'raw_response' in analysis_result and not any(
         dim in analysis_result and isinstance(analysis_result[dim], dict) 
         for dim in ['code_quality', 'work_pattern', 'tech_stack', 'problem_solving', 'innovation', 'collaboration']
     ):
-        lines.append("## ⚠️ 解析警告\n\n")
-        lines.append("AI返回的响应无法解析为结构化JSON格式，以下是原始响应：\n\n")
-        lines.append("### 原始响应\n\n")
-        lines.append(f"```\n{analysis_result['raw_response']}\n```\n\n")
-        lines.append("**提示**: 这可能是由于AI返回的格式不符合预期，或者响应中包含无法解析的内容。\n")
-        return ''.join(lines)
+        emit("## ⚠️ 解析警告\n\n")
+        emit("AI返回的响应无法解析为结构化JSON格式，以下是原始响应：\n\n")
+        emit("### 原始响应\n\n")
+        emit(f"```\n{analysis_result['raw_response']}\n```\n\n")
+        emit("**提示**: 这可能是由于AI返回的格式不符合预期，或者响应中包含无法解析的内容。\n")
+        return None if out is not None else ''.join(lines)
     
     # 执行摘要
-    lines.append("## 📋 执行摘要\n\n")
+    emit("## 📋 执行摘要\n\n")
     
     # 计算总体评分
     dimensions = ['code_quality', 'work_pattern', 'tech_stack', 'problem_solving', 'innovation', 'collaboration']
@@ -672,8 +710,8 @@ def generate_ai_analysis_report(analysis_result, author_name, since_date=None, u
     
     if scores:
         overall_score = sum(scores) / len(scores)
-        lines.append(f"**总体评分**: {overall_score:.1f} / 100\n\n")
-        lines.append("**各维度评分**:\n")
+        emit(f"**总体评分**: {overall_score:.1f} / 100\n\n")
+        emit("**各维度评分**:\n")
         for dim in dimensions:
             if dim in analysis_result and isinstance(analysis_result[dim], dict):
                 score = analysis_result[dim].get('score', 0)
@@ -685,13 +723,13 @@ def generate_ai_analysis_report(analysis_result, author_name, since_date=None, u
                     'innovation': '创新性',
                     'collaboration': '团队协作'
                 }.get(dim, dim)
-                lines.append(f"- {dim_name}: {score:.1f} / 100\n")
-        lines.append("\n")
+                emit(f"- {dim_name}: {score:.1f} / 100\n")
+        emit("\n")
     
-    lines.append("---\n\n")
+    emit("---\n\n")
     
     # 详细分析
-    lines.append("## 🔍 详细分析\n\n")
+    emit("## 🔍 详细分析\n\n")
     
     dimension_names = {
         'code_quality': '代码质量评估',
@@ -708,43 +746,43 @@ def generate_ai_analysis_report(analysis_result, author_name, since_date=None, u
             dim_name = dimension_names.get(dim, dim)
             score = dim_data.get('score', 0)
             
-            lines.append(f"### {dim_name}: {score:.1f} / 100\n\n")
+            emit(f"### {dim_name}: {score:.1f} / 100\n\n")
             
             # 详细分析
             if 'analysis' in dim_data:
-                lines.append(f"**分析**:\n{dim_data['analysis']}\n\n")
+                emit(f"**分析**:\n{dim_data['analysis']}\n\n")
             
             # 优势
             if 'strengths' in dim_data and dim_data['strengths']:
-                lines.append("**优势**:\n")
+                emit("**优势**:\n")
                 if isinstance(dim_data['strengths'], list):
                     for strength in dim_data['strengths']:
-                        lines.append(f"- {strength}\n")
+                        emit(f"- {strength}\n")
                 else:
-                    lines.append(f"- {dim_data['strengths']}\n")
-                lines.append("\n")
+                    emit(f"- {dim_data['strengths']}\n")
+                emit("\n")
             
             # 改进建议
             if 'improvements' in dim_data and dim_data['improvements']:
-                lines.append("**改进建议**:\n")
+                emit("**改进建议**:\n")
                 if isinstance(dim_data['improvements'], list):
                     for improvement in dim_data['improvements']:
-                        lines.append(f"- {improvement}\n")
+                        emit(f"- {improvement}\n")
                 else:
-                    lines.append(f"- {dim_data['improvements']}\n")
-                lines.append("\n")
+                    emit(f"- {dim_data['improvements']}\n")
+                emit("\n")
             
-            lines.append("---\n\n")
+            emit("---\n\n")
     
     # 如果有原始响应但无法解析
     if 'raw_response' in analysis_result and not any(dim in analysis_result for dim in dimensions):
-        lines.append("## 📄 原始分析结果\n\n")
-        lines.append(f"```\n{analysis_result['raw_response']}\n```\n")
+        emit("## 📄 原始分析结果\n\n")
+        emit(f"```\n{analysis_result['raw_response']}\n```\n")
     
-    lines.append("\n---\n\n")
-    lines.append("**注**: 本报告由AI自动生成，仅供参考。\n")
+    emit("\n---\n\n")
+    emit("**注**: 本报告由AI自动生成，仅供参考。\n")
     
-    return ''.join(lines)
+    return None if out is not None else ''.join(lines)
 
 
 def _normalize_report_date(date_val):
@@ -759,14 +797,8 @@ def _normalize_report_date(date_val):
 
 def _clean_commit_subject(message: str) -> str:
     """去掉 conventional commit 前缀，留下可读主题。"""
-    first = (message or "").split("\n")[0].strip()
-    cleaned = re.sub(
-        r"^(?:feat|fix|refactor|style|perf|chore|docs|test|build|ci|revert)(?:\([^)]*\))?:\s*",
-        "",
-        first,
-        count=1,
-        flags=re.I,
-    ).strip()
+    first = (message or "").partition("\n")[0].strip()
+    cleaned = _CONVENTIONAL_PREFIX_RE.sub("", first, count=1).strip()
     return cleaned or first
 
 
@@ -856,6 +888,7 @@ def generate_daily_report(all_results, author_name, since_date=None, until_date=
     # 按类型统计
     commit_types = defaultdict(int)
     commits_by_type = defaultdict(list)
+    type_emojis = {}
     
     # 按项目和时间组织提交
     project_commits = {}
@@ -878,6 +911,7 @@ def generate_daily_report(all_results, author_name, since_date=None, until_date=
 
             commit_type, emoji = analyze_commit_type(commit.message)
             commit_types[commit_type] += 1
+            type_emojis[commit_type] = emoji
             commits_by_type[commit_type].append({
                 'project': project_path,
                 'commit': commit
@@ -917,8 +951,7 @@ def generate_daily_report(all_results, author_name, since_date=None, until_date=
     
     lines.append(f"- **工作类型分布**:\n")
     for commit_type, count in sorted(commit_types.items(), key=lambda x: x[1], reverse=True):
-        type_emoji = analyze_commit_type(commits_by_type[commit_type][0]['commit'].message)[1] if commits_by_type[commit_type] else '📌'
-        lines.append(f"  - {type_emoji} {commit_type}: {count} 次\n")
+        lines.append(f"  - {type_emojis.get(commit_type, '📌')} {commit_type}: {count} 次\n")
     
     lines.append("\n---\n\n")
     
@@ -954,7 +987,7 @@ def generate_daily_report(all_results, author_name, since_date=None, until_date=
                 changed_files = details['changed_files']
             except Exception as e:
                 logger.debug(f"获取commit详情失败: {str(e)}")
-                short_message = commit.message.split('\n')[0] if commit.message else ''
+                short_message = commit.message.partition('\n')[0] if commit.message else ''
                 full_message = commit.message or ''
                 stats = None
                 changed_files = []
@@ -12,6 +12,16 @@ import subprocess
 from datetime import datetime
 from pathlib import Path
 
+from utils.file_utils import atomic_write_text
+
+# 多项目日志逐行解析用到的正则（每行都要匹配，预编译避免反复查 re 缓存）
+_COMMIT_HEADING_RE = re.compile(r'#### \d+\.')
+_PROJECT_LINE_RE = re.compile(r'### 📦 (.+?)$')
+_PROJECT_NAME_RE = re.compile(r'\*\*项目\*\*: \[([^\]]+)\]')
+_COMMIT_LINE_RE = re.compile(r'#### \d+\. \[([a-f0-9]+)\]\([^\)]+\) (.+?)$')
+_COMMIT_TIME_RE = re.compile(r'\*\*时间\*\*: (\d{2}:\d{2})')
+
+
 def parse_daily_report(file_path):
     """解析日报文件（支持日报格式和多项目日志格式）"""
     with open(file_path, 'r', encoding='utf-8') as f:
@@ -168,7 +178,7 @@ def parse_daily_report(file_path):
                         project_section = content[project_start:next_project]
                     
                     # 统计提交数
-                    commits = len(re.findall(r'#### \d+\.', project_section))
+                    commits = len(_COMMIT_HEADING_RE.findall(project_section))
                 else:
                     commits = 0
                 
@@ -197,12 +207,12 @@ def parse_daily_report(file_path):
         
         for i, line in enumerate(lines):
             # 检测项目标题
-            project_match = re.match(r'### 📦 (.+?)$', line)
+            project_match = _PROJECT_LINE_RE.match(line)
             if project_match:
                 project_path = project_match.group(1)
                 # 找到项目名称
                 for j in range(i, min(i+5, len(lines))):
-                    name_match = re.search(r'\*\*项目\*\*: \[([^\]]+)\]', lines[j])
+                    name_match = _PROJECT_NAME_RE.search(lines[j])
                     if name_match:
                         current_project = name_match.group(1)
                         break
@@ -210,7 +220,7 @@ def parse_daily_report(file_path):
                     current_project = project_path.split('/')[-1] if '/' in project_path else project_path
             
             # 检测提交记录
-            commit_match = re.match(r'#### \d+\. \[([a-f0-9]+)\]\([^\)]+\) (.+?)$', line)
+            commit_match = _COMMIT_LINE_RE.match(line)
             if commit_match:
                 commit_hash, message = commit_match.groups()
                 message = message.strip()
@@ -218,7 +228,7 @@ def parse_daily_report(file_path):
                 # 查找时间（在接下来的几行中）
                 time = None
                 for j in range(i+1, min(i+5, len(lines))):
-                    time_match = re.search(r'\*\*时间\*\*: (\d{2}:\d{2})', lines[j])
+                    time_match = _COMMIT_TIME_RE.search(lines[j])
                     if time_match:
                         time = time_match.group(1)
                         break
@@ -668,8 +678,7 @@ def generate_html_report(data, output_file):
     # 一次性 join 所有 HTML 片段
     html = ''.join(html_parts)
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html)
+    atomic_write_text(output_file, html)
 
     print(f'HTML日报已生成: {output_file}')
 
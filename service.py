@@ -11,16 +11,19 @@ import os
 import json
 import logging
 import traceback
-from datetime import datetime
 from pathlib import Path
 
 from gitlab_client import (
+    clear_commit_list_cache,
+    clear_project_list_cache,
     create_gitlab_client,
+    get_all_projects_cached,
     scan_all_projects,
     get_commits_by_author,
     group_commits_by_date,
     extract_gitlab_url,
     parse_project_identifier,
+    token_digest,
 )
 from report_generator import (
     generate_markdown_log,
@@ -30,6 +33,7 @@ from report_generator import (
     generate_all_reports,
     generate_work_hours_report,
     generate_ai_analysis_report,
+    parse_report_meta,
 )
 from work_hours import calculate_work_hours
 from commit_analysis import clear_commit_cache
@@ -43,6 +47,8 @@ from models import (
     AIAnalysisError,
 )
 from config import ReportConfig, AIConfig
+from utils.date_utils import report_date_prefix
+from utils.file_utils import atomic_output, atomic_write_text
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +56,11 @@ logger = logging.getLogger(__name__)
 class Git2LogsService:
     """业务编排服务，封装报告生成、Excel 导出、AI 分析等完整工作流。"""
 
+    def __init__(self):
+        # 同一服务实例内复用：(GitLab URL, 令牌摘要) -> 客户端；(客户端 id, 项目标识) -> 项目对象
+        self._client_cache = {}
+        self._project_cache = {}
+
     # ------------------------------------------------------------------
     # 内部辅助
     # ------------------------------------------------------------------
@@ -66,10 +77,7 @@ class Git2LogsService:
     @staticmethod
     def _resolve_output_file(output_path, report_type, since_date=None, until_date=None):
         """根据输出路径和报告类型，确定最终文件路径。"""
-        if since_date and until_date and since_date == until_date:
-            date_prefix = since_date
-        else:
-            date_prefix = datetime.now().strftime('%Y-%m-%d')
+        date_prefix = report_date_prefix(since_date, until_date)
 
         if not output_path:
             output_path = os.getcwd()
@@ -79,14 +87,39 @@ class Git2LogsService:
 
         return output_path
 
+    def clear_gitlab_cache(self):
+        """清空客户端、项目对象、项目列表与增量提交缓存，下次查询完整重新获取。"""
+        self._client_cache.clear()
+        self._project_cache.clear()
+        clear_project_list_cache()
+        clear_commit_list_cache()
+
+    def _get_client(self, gitlab_url, token):
+        """创建或复用 GitLab 客户端；URL 或令牌变化时自然失效。"""
+        key = (gitlab_url, token_digest(token))
+        gl = self._client_cache.get(key)
+        if gl is None:
+            gl = self._client_cache[key] = create_gitlab_client(gitlab_url, token)
+        return gl
+
+    def _get_project(self, gl, project_identifier):
+        """获取或复用项目对象（仅缓存成功结果）。"""
+        key = (id(gl), project_identifier)
+        project = self._project_cache.get(key)
+        if project is None:
+            project = self._project_cache[key] = gl.projects.get(project_identifier)
+        return project
+
     # ------------------------------------------------------------------
     # 核心工作流：报告生成
     # ------------------------------------------------------------------
 
-    def generate_report(self, params: ReportParams, log_callback=None) -> dict:
+    def generate_report(self, params: ReportParams, log_callback=None, progress_callback=None) -> dict:
         """
         主报告生成工作流。
 
+        progress_callback 透传给全量扫描，按 (已完成项目数, 项目总数) 报告进度。
+
         Returns:
             dict: {
                 'content': markdown 字符串（部分格式可能为 None）,
@@ -102,7 +135,9 @@ class Git2LogsService:
         """
         self._log(log_callback, "开始生成日志...", "info")
 
-        all_results = self.fetch_commits(params, log_callback=log_callback)
+        all_results = self.fetch_commits(
+            params, log_callback=log_callback, progress_callback=progress_callback,
+        )
 
         if not all_results:
             self._log(log_callback, "未找到任何提交记录", "warning")
@@ -134,6 +169,7 @@ class Git2LogsService:
         log_callback=None,
         *,
         strict_single_project: bool = False,
+        progress_callback=None,
     ) -> dict:
         """
         连接 GitLab 并拉取提交（不生成报告文件）。
@@ -144,7 +180,7 @@ class Git2LogsService:
         clear_commit_cache()
         self._log(log_callback, f"正在连接到 GitLab: {params.gitlab_url}", "info")
         try:
-            gl = create_gitlab_client(params.gitlab_url, params.token)
+            gl = self._get_client(params.gitlab_url, params.token)
         except Exception as exc:
             raise GitLabConnectionError(f"连接 GitLab 失败: {exc}") from exc
 
@@ -153,19 +189,33 @@ class Git2LogsService:
             params,
             log_callback,
             strict_single_project=strict_single_project,
+            progress_callback=progress_callback,
         )
 
-    def _fetch_commits(self, gl, params: ReportParams, log_callback=None, *, strict_single_project: bool = False):
+    def _fetch_commits(
+        self,
+        gl,
+        params: ReportParams,
+        log_callback=None,
+        *,
+        strict_single_project: bool = False,
+        progress_callback=None,
+    ):
         """根据 params 中的模式获取提交记录，返回 all_results 字典。"""
         all_results = {}
 
         if params.scan_all or not params.repo_url:
             self._log(log_callback, "正在扫描所有项目...", "info")
+            projects = get_all_projects_cached(gl, params.gitlab_url, params.token)
             all_results = scan_all_projects(
                 gl, params.author,
                 since_date=params.since_date,
                 until_date=params.until_date,
                 branch=params.branch,
+                progress_callback=progress_callback,
+                projects=projects,
+                gitlab_url=params.gitlab_url,
+                token=params.token,
             )
             self._log(
                 log_callback,
@@ -188,13 +238,13 @@ class Git2LogsService:
         extracted_url = extract_gitlab_url(repo_url)
         if extracted_url:
             self._log(log_callback, f"从仓库 URL 提取 GitLab 实例: {extracted_url}", "info")
-            gl = create_gitlab_client(extracted_url, params.token)
+            gl = self._get_client(extracted_url, params.token)
 
         project_identifier = parse_project_identifier(repo_url)
         self._log(log_callback, f"正在获取项目: {project_identifier}", "info")
 
         try:
-            project = gl.projects.get(project_identifier)
+            project = self._get_project(gl, project_identifier)
             commits = get_commits_by_author(
                 project, params.author,
                 since_date=params.since_date,
@@ -265,8 +315,7 @@ class Git2LogsService:
             result['work_hours_data'] = work_hours_data
 
             json_file = output_file.replace(".md", "_data.json")
-            with open(json_file, "w", encoding="utf-8") as jf:
-                json.dump(work_hours_data, jf, ensure_ascii=False, indent=2)
+            atomic_write_text(json_file, json.dumps(work_hours_data, ensure_ascii=False, indent=2))
             self._log(log_callback, f"工时数据已保存: {json_file}", "info")
 
         return result
@@ -382,15 +431,18 @@ class Git2LogsService:
     # ------------------------------------------------------------------
 
     def analyze_ai(self, all_results, author, ai_params: AIParams,
-                   since_date=None, until_date=None, log_callback=None) -> dict:
+                   since_date=None, until_date=None, log_callback=None,
+                   output_file=None) -> dict:
         """
         AI 分析工作流（基于提交数据）。
 
+        提供 output_file 时报告逐段流式写入该文件，report_content 为 None。
+
         Returns:
             dict: {
                 'analysis_result': AI 原始分析结果,
-                'report_content': AI 分析报告 Markdown,
-                'output_file': 保存的文件路径（如提供 output_dir 则写入）,
+                'report_content': AI 分析报告 Markdown（流式写入时为 None）,
+                'output_file': 保存的文件路径（如提供 output_file 则写入）,
             }
 
         Raises:
@@ -421,15 +473,14 @@ class Git2LogsService:
 
             self._log(log_callback, "AI 分析完成，正在生成报告...", "success")
 
-            report_content = generate_ai_analysis_report(
-                analysis_result, author,
-                since_date=since_date, until_date=until_date,
+            report_content = self._render_ai_report(
+                analysis_result, author, since_date, until_date, output_file,
             )
 
             return {
                 'analysis_result': analysis_result,
                 'report_content': report_content,
-                'output_file': None,
+                'output_file': output_file,
             }
 
         except TimeoutError as exc:
@@ -442,21 +493,27 @@ class Git2LogsService:
             raise AIAnalysisError(f"AI 分析失败: {exc}") from exc
 
     def analyze_ai_from_file(self, report_content, ai_params: AIParams,
-                             log_callback=None) -> dict:
+                             log_callback=None, output_file=None) -> dict:
         """
         基于报告文件内容进行 AI 分析（不需要 GitLab 数据）。
 
+        提供 output_file 时报告逐段流式写入该文件，report_content 为 None。
+
         Returns:
             dict: {
                 'analysis_result': AI 原始分析结果,
-                'report_content': AI 分析报告 Markdown,
+                'report_content': AI 分析报告 Markdown（流式写入时为 None）,
+                'output_file': 保存的文件路径（未提供时为 None）,
             }
 
         Raises:
             AIAnalysisError: AI 分析失败
         """
-        import re
-        from ai_analysis import analyze_report_file
+        from ai_analysis import (
+            analyze_report_file,
+            load_cached_report_analysis,
+            save_cached_report_analysis,
+        )
 
         self._log(log_callback, "开始 AI 分析（基于报告文件内容）...", "info")
         self._log(log_callback, f"AI 服务: {ai_params.service}, 模型: {ai_params.model}", "info")
@@ -466,33 +523,30 @@ class Git2LogsService:
             'api_key': ai_params.api_key,
             'model': ai_params.model,
         }
+        if ai_params.base_url:
+            ai_config['base_url'] = ai_params.base_url
 
         try:
-            analysis_result = analyze_report_file(report_content, ai_config, timeout=AIConfig.TIMEOUT)
-
-            author_match = re.search(r'\*\*提交者\*\*: (.+)', report_content)
-            author = author_match.group(1).strip() if author_match else "未知作者"
-
-            date_range_match = re.search(r'\*\*统计时间范围\*\*: (.+?) 至 (.+?)(?:\n|$)', report_content)
-            if date_range_match:
-                since_date = date_range_match.group(1).strip()
-                until_date = date_range_match.group(2).strip()
+            # 同一报告 + 同一模型在缓存有效期内直接复用上次结果
+            analysis_result = load_cached_report_analysis(report_content, ai_config)
+            if analysis_result is not None:
+                self._log(log_callback, "命中 AI 分析缓存（报告内容与模型未变化），跳过 AI 调用", "info")
             else:
-                since_match = re.search(r'\*\*起始日期\*\*: (.+?)(?:\n|$)', report_content)
-                until_match = re.search(r'\*\*结束日期\*\*: (.+?)(?:\n|$)', report_content)
-                since_date = since_match.group(1).strip() if since_match else None
-                until_date = until_match.group(1).strip() if until_match else None
+                analysis_result = analyze_report_file(report_content, ai_config, timeout=AIConfig.TIMEOUT)
+                save_cached_report_analysis(report_content, ai_config, analysis_result)
+
+            author, since_date, until_date = parse_report_meta(report_content)
 
             self._log(log_callback, "AI 分析完成，正在生成报告...", "success")
 
-            ai_report = generate_ai_analysis_report(
-                analysis_result, author,
-                since_date=since_date, until_date=until_date,
+            ai_report = self._render_ai_report(
+                analysis_result, author, since_date, until_date, output_file,
             )
 
             return {
                 'analysis_result': analysis_result,
                 'report_content': ai_report,
+                'output_file': output_file,
             }
 
         except TimeoutError as exc:
@@ -504,6 +558,18 @@ class Git2LogsService:
         except Exception as exc:
             raise AIAnalysisError(f"AI 分析失败: {exc}") from exc
 
+    @staticmethod
+    def clear_ai_cache():
+        """清除报告文件 AI 分析结果的磁盘缓存。"""
+        from ai_analysis import clear_report_analysis_cache
+        clear_report_analysis_cache()
+
+    @staticmethod
+    def clear_image_cache():
+        """清除 HTML 转图片渲染结果的磁盘缓存。"""
+        from image_converter import clear_render_cache
+        clear_render_cache()
+
     def test_ai_connection(self, ai_params: AIParams) -> bool:
         """
         测试 AI 服务连接。
@@ -592,9 +658,24 @@ class Git2LogsService:
     # 文件写入
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _render_ai_report(analysis_result, author, since_date, until_date, output_file=None):
+        """生成 AI 分析报告；指定 output_file 时直接流式写入缓冲文件句柄。"""
+        if not output_file:
+            return generate_ai_analysis_report(
+                analysis_result, author,
+                since_date=since_date, until_date=until_date,
+            )
+        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+        with atomic_output(output_file) as f:
+            generate_ai_analysis_report(
+                analysis_result, author,
+                since_date=since_date, until_date=until_date, out=f,
+            )
+        return None
+
     @staticmethod
     def _write_file(path, content):
         """确保父目录存在后写入文件。"""
         Path(path).parent.mkdir(parents=True, exist_ok=True)
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        atomic_write_text(path, content)
@@ -11,6 +11,7 @@ from ai_analysis import _SERVICE_LOADERS
 from ai_providers.catalog import (
     PROVIDER_DEFAULT_MODEL,
     PROVIDER_MODELS,
+    get_provider_catalog,
     get_provider_default_model,
     get_provider_models,
 )
@@ -32,6 +33,14 @@ class AICatalogTests(unittest.TestCase):
         self.assertEqual(get_provider_default_model("unknown"), "gpt-5.6-luna")
         self.assertTrue(len(get_provider_models("unknown")) > 0)
 
+    def test_catalog_matches_list_helpers_and_is_shared(self):
+        for service in _SERVICE_LOADERS:
+            with self.subTest(provider=service):
+                default, models = get_provider_catalog(service)
+                self.assertEqual(default, get_provider_default_model(service))
+                self.assertEqual(list(models), get_provider_models(service))
+                self.assertIs(models, get_provider_catalog(service.upper())[1])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,11 +3,21 @@
 """AI 提供商延迟加载注册测试。"""
 from __future__ import annotations
 
+import tempfile
 import unittest
+from unittest import mock
 
 from tests import _common  # noqa: F401 — 确保项目根在 sys.path
 
-from ai_analysis import AI_SERVICES, get_ai_service, _SERVICE_LOADERS
+from ai_analysis import (
+    AI_SERVICES,
+    _SERVICE_LOADERS,
+    clear_report_analysis_cache,
+    get_ai_service,
+    load_cached_report_analysis,
+    save_cached_report_analysis,
+)
+from config import AIConfig
 
 
 class AIProviderRegistryTests(unittest.TestCase):
@@ -27,5 +37,105 @@ class AIProviderRegistryTests(unittest.TestCase):
         self.assertIn("不支持的AI服务", str(ctx.exception))
 
 
+class ReportAnalysisCacheTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        patcher = mock.patch.object(AIConfig, "RESULT_CACHE_DIR", tmp.name + "/ai_cache")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_hit_requires_same_content_and_model(self):
+        config = {"service": "openai", "model": "m1", "api_key": "k"}
+        result = {"code_quality": {"score": 8, "analysis": "ok"}}
+        save_cached_report_analysis("# 报告", config, result)
+
+        self.assertEqual(load_cached_report_analysis("# 报告", config), result)
+        self.assertIsNone(load_cached_report_analysis("# 报告2", config))
+        self.assertIsNone(load_cached_report_analysis("# 报告", {**config, "model": "m2"}))
+        self.assertIsNone(load_cached_report_analysis("# 报告", config, ttl=0))
+
+        clear_report_analysis_cache()
+        self.assertIsNone(load_cached_report_analysis("# 报告", config))
+
+    def test_model_none_and_base_url_in_key(self):
+        config = {"service": "openai", "model": None, "api_key": "k"}
+        result = {"code_quality": {"score": 7, "analysis": "ok"}}
+        save_cached_report_analysis("# 报告", config, result)
+
+        self.assertEqual(load_cached_report_analysis("# 报告", config), result)
+        self.assertIsNone(load_cached_report_analysis(
+            "# 报告", {**config, "base_url": "http://llm.example.com/v1"}))
+
+    def test_service_analyze_from_file_with_model_none(self):
+        from models import AIParams
+        from service import Git2LogsService
+
+        result = {"code_quality": {"score": 7, "analysis": "ok"}}
+        params = AIParams(service="openai", api_key="k", model=None)
+        with mock.patch("ai_analysis.analyze_report_file", return_value=result) as analyze, \
+                mock.patch.object(Git2LogsService, "_render_ai_report", return_value="# AI"):
+            out = Git2LogsService().analyze_ai_from_file("# 报告", params)
+            Git2LogsService().analyze_ai_from_file("# 报告", params)
+
+        self.assertEqual(out["analysis_result"], result)
+        self.assertEqual(analyze.call_count, 1)
+
+    def test_parse_error_result_not_cached(self):
+        config = {"service": "openai", "model": "m1"}
+        save_cached_report_analysis("# 报告", config, {"raw_response": "x", "parse_error": "bad"})
+        self.assertIsNone(load_cached_report_analysis("# 报告", config))
+
+
+
+class AITestErrorClassificationTests(unittest.TestCase):
+    def setUp(self):
+        try:
+            from gui.handlers_mixin import HandlersMixin
+        except ImportError as exc:
+            self.skipTest(f"GUI 依赖不可用: {exc}")
+        self.classify = HandlersMixin._classify_ai_test_error
+        self.hint = HandlersMixin._ai_test_error_hint
+
+    @staticmethod
+    def _wrapped(cause):
+        """模拟 Git2LogsService.test_ai_connection 的异常包装，返回 __cause__"""
+        from models import AIAnalysisError
+
+        try:
+            try:
+                raise cause
+            except Exception as exc:
+                raise AIAnalysisError(f"AI 连接测试失败: {exc}") from exc
+        except AIAnalysisError as wrapped:
+            return wrapped.__cause__
+
+    def test_status_codes(self):
+        for status in (401, 403):
+            exc = self._wrapped(RuntimeError("denied"))
+            exc.status_code = status
+            self.assertEqual(self.classify(exc, str(exc)), "API密钥无效")
+        exc = self._wrapped(RuntimeError("boom"))
+        exc.status_code = 500
+        self.assertEqual(self.classify(exc, str(exc)), "AI服务暂时不可用 (HTTP 500)")
+
+    def test_non_int_code_and_permission_error_not_key_error(self):
+        exc = RuntimeError("quota exceeded")
+        exc.code = lambda: 401
+        self.assertEqual(self.classify(exc, str(exc)), "连接失败: quota exceeded")
+        exc = PermissionError("写入缓存被拒绝")
+        self.assertEqual(self.classify(exc, str(exc)), "连接失败: 写入缓存被拒绝")
+
+    def test_wrapped_error_without_status_keeps_original_message(self):
+        exc = self._wrapped(RuntimeError("Invalid value for 'model' (request 403abc)"))
+        self.assertIsNone(self.hint(exc))
+        exc.status_code = 400
+        self.assertIsNone(self.hint(exc))
+
+    def test_network_error(self):
+        exc = self._wrapped(TimeoutError("read timed out"))
+        self.assertEqual(self.classify(exc, str(exc)), "网络连接失败")
+
+
 if __name__ == "__main__":
     unittest.main()
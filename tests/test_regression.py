@@ -25,6 +25,7 @@ from report_generator import (
     generate_markdown_log,
     generate_statistics_report,
     generate_work_hours_report,
+    parse_report_meta,
 )
 from report_html import generate_html_report, parse_daily_report
 from service import Git2LogsService
@@ -194,6 +195,107 @@ class ReportHtmlTests(unittest.TestCase):
         self.assertLess(html.index("10:30"), html.index("16:45"))
 
 
+class ImageRenderCacheTests(unittest.TestCase):
+    def test_unchanged_html_reuses_rendered_image(self):
+        import image_converter
+        from config import ImageConfig
+
+        def fake_render(_html, out, _width):
+            out.write_bytes(b"PNG")
+            return True
+
+        with tempfile.TemporaryDirectory() as tmp:
+            html = Path(tmp) / "report.html"
+            html.write_text("<html>日报</html>", encoding="utf-8")
+            with mock.patch.object(ImageConfig, "RENDER_CACHE_DIR", str(Path(tmp) / "cache")), \
+                    mock.patch.dict("os.environ", {"GIT2LOGS_CACHE_REFRESH": "0"}), \
+                    mock.patch.object(image_converter, "_convert_with_playwright", return_value=False), \
+                    mock.patch.object(image_converter, "_convert_with_chrome", side_effect=fake_render) as render:
+                self.assertTrue(image_converter.convert_html_to_image(html, Path(tmp) / "a.png"))
+                self.assertTrue(image_converter.convert_html_to_image(html, Path(tmp) / "b.png"))
+                self.assertEqual(render.call_count, 1)
+                self.assertEqual((Path(tmp) / "b.png").read_bytes(), b"PNG")
+
+                html.write_text("<html>改动</html>", encoding="utf-8")
+                self.assertTrue(image_converter.convert_html_to_image(html, Path(tmp) / "c.png"))
+                self.assertEqual(render.call_count, 2)
+
+    def test_fresh_output_rerendered_when_width_changes(self):
+        import image_converter
+        from config import ImageConfig
+
+        def fake_render(_html, out, width):
+            out.write_bytes(b"PNG" * width)
+            return True
+
+        with tempfile.TemporaryDirectory() as tmp:
+            html = Path(tmp) / "report.html"
+            html.write_text("<html>日报</html>", encoding="utf-8")
+            out = Path(tmp) / "a.png"
+            with mock.patch.object(ImageConfig, "RENDER_CACHE_DIR", str(Path(tmp) / "cache")), \
+                    mock.patch.dict("os.environ", {"GIT2LOGS_CACHE_REFRESH": "0"}), \
+                    mock.patch.object(image_converter, "_convert_with_playwright", return_value=False), \
+                    mock.patch.object(image_converter, "_convert_with_chrome", side_effect=fake_render) as render:
+                self.assertTrue(image_converter.convert_html_to_image(html, out, 10))
+                self.assertTrue(image_converter.convert_html_to_image(html, out, 10))
+                self.assertEqual(render.call_count, 1)
+
+                self.assertTrue(image_converter.convert_html_to_image(html, out, 20))
+                self.assertEqual(render.call_count, 2)
+                self.assertEqual(out.read_bytes(), b"PNG" * 20)
+
+    def test_store_prunes_expired_cache_and_clear_removes_all(self):
+        import os
+        import image_converter
+        from config import ImageConfig
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_dir = Path(tmp) / "cache"
+            cache_dir.mkdir()
+            stale = cache_dir / "stale.png"
+            stale.write_bytes(b"OLD")
+            os.utime(stale, (0, 0))
+            output = Path(tmp) / "out.png"
+            output.write_bytes(b"PNG")
+
+            with mock.patch.object(ImageConfig, "RENDER_CACHE_DIR", str(cache_dir)):
+                image_converter._store_render_cache(output, cache_dir / "fresh.png")
+                self.assertFalse(stale.exists())
+                self.assertEqual((cache_dir / "fresh.png").read_bytes(), b"PNG")
+
+                image_converter.clear_render_cache()
+                self.assertFalse(cache_dir.exists())
+
+
+class ReportMetaTests(unittest.TestCase):
+    def test_parse_report_meta_prefers_range_line(self):
+        content = (
+            f"# 报告\n\n**提交者**: {AUTHOR}\n\n"
+            f"**统计时间范围**: {SINCE} 至 {UNTIL}\n\n"
+            "**起始日期**: 1999-01-01\n"
+        )
+        self.assertEqual(parse_report_meta(content), (AUTHOR, SINCE, UNTIL))
+
+    def test_parse_report_meta_ignores_body(self):
+        content = f"**起始日期**: {SINCE}\n**结束日期**: {UNTIL}\n" + "x" * 5000 + "\n**提交者**: 正文\n"
+        self.assertEqual(parse_report_meta(content), ("未知作者", SINCE, UNTIL))
+
+
+class AtomicOutputTests(unittest.TestCase):
+    def test_interleaved_writers_use_separate_temp_files(self):
+        from utils.file_utils import atomic_output
+
+        with tempfile.TemporaryDirectory() as tmp:
+            target = Path(tmp) / "report.md"
+            with atomic_output(target) as first:
+                first.write("甲")
+                with atomic_output(target) as second:
+                    second.write("乙")
+                self.assertEqual(target.read_text(encoding="utf-8"), "乙")
+            self.assertEqual(target.read_text(encoding="utf-8"), "甲")
+            self.assertEqual([p.name for p in Path(tmp).iterdir()], ["report.md"])
+
+
 class CliParserTests(unittest.TestCase):
     def test_scan_all_daily_report_format_mapping(self):
         args = build_argument_parser().parse_args([
@@ -239,6 +341,24 @@ class FetchCommitsTests(unittest.TestCase):
         entry = next(iter(result.values()))
         self.assertEqual(entry["commits"], [commit])
 
+    @mock.patch("service.create_gitlab_client")
+    @mock.patch("service.get_commits_by_author")
+    def test_fetch_commits_reuses_client_and_project(
+        self, mock_get_commits, mock_create_client,
+    ):
+        mock_gl = mock.Mock()
+        mock_create_client.return_value = mock_gl
+        mock_get_commits.return_value = [mock.Mock(message="feat: test")]
+
+        service = Git2LogsService()
+        service.fetch_commits(self._params())
+        service.fetch_commits(self._params(output_format="html"))
+        self.assertEqual(mock_create_client.call_count, 1)
+        self.assertEqual(mock_gl.projects.get.call_count, 1)
+
+        service.fetch_commits(self._params(token="other-token"))
+        self.assertEqual(mock_create_client.call_count, 2)
+
     @mock.patch("service.create_gitlab_client")
     def test_fetch_commits_strict_raises_on_project_error(self, mock_create_client):
         mock_gl = mock.Mock()
@@ -250,6 +370,98 @@ class FetchCommitsTests(unittest.TestCase):
                 self._params(), strict_single_project=True,
             )
 
+    @mock.patch("gitlab_client.get_commits_by_author")
+    @mock.patch("gitlab_client.get_all_projects")
+    def test_scan_all_projects_reports_progress(self, mock_projects, mock_get_commits):
+        from gitlab_client import scan_all_projects
+
+        projects = [mock.Mock(path_with_namespace=f"group/p{i}") for i in range(3)]
+        mock_projects.return_value = projects
+        mock_get_commits.return_value = []
+        progress = []
+
+        scan_all_projects(
+            mock.Mock(), AUTHOR, max_workers=2,
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+        self.assertEqual(progress, [(1, 3), (2, 3), (3, 3)])
+
+    def test_branch_commits_merged_in_branch_order(self):
+        from gitlab_client import get_commits_by_author
+
+        branches = [mock.Mock() for _ in range(4)]
+        for idx, branch in enumerate(branches):
+            branch.name = f"feature-{idx}"
+        project = mock.Mock()
+        project.branches.list.return_value = branches
+
+        def list_commits(**params):
+            if "author" not in params or params["page"] > 1:
+                return []
+            return [mock.Mock(id=params["ref_name"], author_name=AUTHOR, author_email="")]
+
+        project.commits.list.side_effect = list_commits
+        commits = get_commits_by_author(project, AUTHOR, branch_workers=3)
+        self.assertEqual([c.id for c in commits], [b.name for b in branches])
+
+    @mock.patch("gitlab_client.get_commits_by_author")
+    def test_incremental_commits_refetch_from_newest_day(self, mock_get_commits):
+        from gitlab_client import clear_commit_list_cache, get_commits_incremental
+
+        self.addCleanup(clear_commit_list_cache)
+        project = mock.Mock(id=1)
+        date_range = {"since_date": "2026-01-19", "until_date": "2026-01-21"}
+        old = mock.Mock(id="a", committed_date="2026-01-20T02:00:00Z")
+        newest = mock.Mock(id="b", committed_date="2026-01-21T02:00:00Z")
+        added = mock.Mock(id="c", committed_date="2026-01-21T05:00:00Z")
+        mock_get_commits.return_value = [newest, old]
+        get_commits_incremental(project, AUTHOR, **date_range)
+
+        mock_get_commits.return_value = [added, newest]
+        commits = get_commits_incremental(project, AUTHOR, **date_range)
+        self.assertEqual(mock_get_commits.call_args.kwargs["since_date"], "2026-01-21")
+        self.assertEqual([c.id for c in commits], ["c", "b", "a"])
+
+    @mock.patch("gitlab_client.get_commits_by_author")
+    def test_incremental_commits_not_shared_across_instances(self, mock_get_commits):
+        from gitlab_client import clear_commit_list_cache, scan_all_projects
+
+        self.addCleanup(clear_commit_list_cache)
+        project = mock.Mock(id=1, path_with_namespace="group/p")
+        commit_a = mock.Mock(id="a", committed_date="2026-01-20T02:00:00Z")
+        commit_b = mock.Mock(id="b", committed_date="2026-01-19T02:00:00Z")
+
+        mock_get_commits.return_value = [commit_a]
+        scan_all_projects(mock.Mock(), AUTHOR, projects=[project],
+                          gitlab_url="http://gitlab-a.example.com", token="t")
+        mock_get_commits.return_value = [commit_b]
+        results = scan_all_projects(mock.Mock(), AUTHOR, projects=[project],
+                                    gitlab_url="http://gitlab-b.example.com", token="t")
+
+        self.assertIsNone(mock_get_commits.call_args.kwargs["since_date"])
+        self.assertEqual([c.id for c in results["group/p"]["commits"]], ["b"])
+
+    @mock.patch("gitlab_client.get_all_projects")
+    def test_project_list_cached_per_url_and_token(self, mock_projects):
+        from gitlab_client import clear_project_list_cache, get_all_projects_cached
+
+        mock_projects.return_value = [mock.Mock()]
+        clear_project_list_cache()
+        self.addCleanup(clear_project_list_cache)
+
+        gl = mock.Mock()
+        url = "http://gitlab.example.com"
+        first = get_all_projects_cached(gl, url, "token")
+        self.assertIs(get_all_projects_cached(gl, url, "token"), first)
+        self.assertEqual(mock_projects.call_count, 1)
+
+        get_all_projects_cached(gl, url, "other-token")
+        self.assertEqual(mock_projects.call_count, 2)
+
+        clear_project_list_cache()
+        get_all_projects_cached(gl, url, "token")
+        self.assertEqual(mock_projects.call_count, 3)
+
 
 class CommitAnalysisTests(unittest.TestCase):
     def test_is_merge_commit(self):
@@ -270,6 +482,23 @@ class CommitAnalysisTests(unittest.TestCase):
         self.assertEqual(analyze_commit_type("feat:修复新增时 id 传参"), ("Bug修复", "🐛"))
         self.assertEqual(analyze_commit_type("feat(auth): 增加登录校验"), ("功能开发", "✨"))
 
+    def test_details_and_stats_share_one_commit_fetch(self):
+        from commit_analysis import clear_commit_cache, get_commit_details, get_commit_stats
+
+        all_results = build_sample_all_results()
+        result = next(iter(all_results.values()))
+        project, commit = result['project'], result['commits'][0]
+        detailed = mock.Mock(stats={'additions': 3, 'deletions': 1, 'total': 4})
+        detailed.diff.return_value = []
+        project.commits = mock.Mock()
+        project.commits.get.return_value = detailed
+
+        clear_commit_cache()
+        self.addCleanup(clear_commit_cache)
+        self.assertEqual(get_commit_details(project, commit)['stats']['additions'], 3)
+        self.assertEqual(get_commit_stats(project, commit)['total'], 4)
+        project.commits.get.assert_called_once_with(commit.id)
+
     def test_format_date_chinese_strips_whitespace(self):
         from utils.date_utils import format_date_chinese
 
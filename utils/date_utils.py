@@ -7,13 +7,24 @@
 """
 
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Union, Optional
 import re
+import sys
 from zoneinfo import ZoneInfo
 
 REPORT_TZ = ZoneInfo("Asia/Shanghai")
 
+# Python 3.11+ 的 fromisoformat 原生支持 Z 后缀，无需先替换为 +00:00
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
 
+# 解析结果（datetime 不可变）按输入字符串缓存：同一批提交会被多种报告反复解析
+_PARSE_CACHE_SIZE = 8192
+
+_YMD_PREFIX_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
 def parse_iso_date(date_string: str) -> datetime:
     """
     解析 ISO 格式日期字符串（处理 Z 时区后缀）
@@ -31,11 +42,14 @@ def parse_iso_date(date_string: str) -> datetime:
         >>> parse_iso_date("2025-01-12T10:30:00Z")
         datetime.datetime(2025, 1, 12, 10, 30, tzinfo=datetime.timezone.utc)
     """
+    if _FROMISOFORMAT_ACCEPTS_Z:
+        return datetime.fromisoformat(date_string)
     # 将 Z 时区后缀替换为 +00:00 格式
     normalized = date_string.replace('Z', '+00:00')
     return datetime.fromisoformat(normalized)
 
 
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
 def parse_simple_date(date_string: str) -> datetime:
     """
     解析简单的 YYYY-MM-DD 格式日期字符串
@@ -56,6 +70,24 @@ def parse_simple_date(date_string: str) -> datetime:
     return datetime.strptime(date_string, '%Y-%m-%d')
 
 
+@lru_cache(maxsize=64)
+def date_format_error(date_string: str) -> Optional[str]:
+    """
+    校验 YYYY-MM-DD 格式，返回错误描述；合法时返回 None
+
+    结果按输入缓存，重复提交同一日期时不再重复 strptime。
+
+    Examples:
+        >>> date_format_error("2025-01-12") is None
+        True
+    """
+    try:
+        parse_simple_date(date_string)
+    except ValueError as e:
+        return str(e)
+    return None
+
+
 def safe_parse_commit_date(commit_date: Union[str, datetime]) -> datetime:
     """
     安全解析 commit 日期，支持多种格式
@@ -85,10 +117,21 @@ def safe_parse_commit_date(commit_date: Union[str, datetime]) -> datetime:
         return commit_date
 
     if isinstance(commit_date, str):
-        commit_date = commit_date.strip()
-        if not commit_date:
-            raise ValueError(f"无法解析日期格式: {commit_date}")
+        return _safe_parse_date_str(commit_date)
+    return _safe_parse_date_value(commit_date)
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _safe_parse_date_str(commit_date: str) -> datetime:
+    """safe_parse_commit_date 的字符串分支（按原始字符串缓存）"""
+    commit_date = commit_date.strip()
+    if not commit_date:
+        raise ValueError(f"无法解析日期格式: {commit_date}")
+    return _safe_parse_date_value(commit_date)
 
+
+def _safe_parse_date_value(commit_date) -> datetime:
+    """依次尝试 ISO 与 YYYY-MM-DD 格式"""
     # 尝试 ISO 格式
     try:
         return parse_iso_date(commit_date)
@@ -113,9 +156,14 @@ def format_date_chinese(date: Union[datetime, str]) -> str:
     """
     if isinstance(date, datetime):
         return f"{date.year}年{date.month:02d}月{date.day:02d}日"
+    return _format_str_chinese(date or "")
+
 
-    s = (date or "").strip()
-    m = re.match(r"(\d{4})-(\d{2})-(\d{2})", s)
+@lru_cache(maxsize=1024)
+def _format_str_chinese(date: str) -> str:
+    """format_date_chinese 的字符串分支：报告按天分组时同一日期反复格式化，按输入缓存"""
+    s = date.strip()
+    m = _YMD_PREFIX_RE.match(s)
     if m:
         y, mo, d = m.groups()
         return f"{y}年{mo}月{d}日"
@@ -142,16 +190,15 @@ def format_date_range(since_date: Optional[str], until_date: Optional[str]) -> s
         >>> format_date_range("2025-01-01", "2025-01-31")
         '2025年01月01日 至 2025年01月31日'
         >>> format_date_range(None, "2025-01-31")
-        '至 2025年01月31日'
+        '2025年01月31日'
     """
-    parts = []
-    if since_date:
-        parts.append(format_date_chinese(since_date))
+    if since_date and until_date:
+        return f"{format_date_chinese(since_date)} 至 {format_date_chinese(until_date)}"
     if until_date:
-        if parts:
-            parts.append('至')
-        parts.append(format_date_chinese(until_date))
-    return ' '.join(parts) if parts else '全部时间'
+        return format_date_chinese(until_date)
+    if since_date:
+        return format_date_chinese(since_date)
+    return '全部时间'
 
 
 def get_date_range_days(since_date: str, until_date: str) -> int:
@@ -174,6 +221,14 @@ def get_date_range_days(since_date: str, until_date: str) -> int:
     return (end - start).days + 1
 
 
+def report_date_prefix(since_date: Optional[str] = None,
+                       until_date: Optional[str] = None) -> str:
+    """报告文件名日期前缀：单日查询用该日期，否则用当天日期（YYYY-MM-DD）。"""
+    if since_date and since_date == until_date:
+        return since_date
+    return datetime.now().strftime('%Y-%m-%d')
+
+
 def ensure_aware_utc(dt: Union[datetime, str]) -> datetime:
     """将提交时间规范为带时区的 UTC datetime。"""
     if isinstance(dt, str):
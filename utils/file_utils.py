@@ -0,0 +1,52 @@
+"""文件写入工具模块
+
+报告文件先写入同目录临时文件，完成后 os.replace 覆盖目标，
+写入中途失败不会留下半截报告。
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager, suppress
+
+# 进程 umask 只能通过设置再恢复读取，且该操作非线程安全，故在导入时读取一次
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@contextmanager
+def atomic_output(path, encoding: str = 'utf-8', buffering: int = 1 << 20):
+    """
+    以原子替换方式写文本文件，返回可多次 write 的文件句柄
+
+    Args:
+        path: 目标文件路径
+        encoding: 文本编码（默认 utf-8）
+        buffering: 写缓冲大小（默认 1 MiB，流式生成大报告时减少系统调用）
+
+    Raises:
+        OSError: 写入或替换失败（临时文件会被清理）
+    """
+    path = os.fspath(path)
+    # 每次写入使用独立临时文件，并发写同一目标时不会互相覆盖或删除对方的临时文件
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path) or '.',
+        prefix=os.path.basename(path) + '.',
+        suffix='.tmp',
+    )
+    try:
+        # mkstemp 创建的文件权限为 0600，按 umask 恢复为普通新建文件的权限
+        with suppress(OSError):
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
+        with os.fdopen(fd, 'w', encoding=encoding, buffering=buffering) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def atomic_write_text(path, text: str, encoding: str = 'utf-8') -> None:
+    """一次性写入文本，原子替换目标文件。"""
+    with atomic_output(path, encoding=encoding) as f:
+        f.write(text)
@@ -0,0 +1,42 @@
+"""日志配置工具模块
+
+命令行入口的 root logger 只挂一个 QueueHandler，记录入队后由后台
+QueueListener 线程写到控制台，分页拉取提交时日志输出不再阻塞主流程
+（Windows cmd 等慢终端上尤为明显）。
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+DEFAULT_LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+_listener: QueueListener | None = None
+
+
+def setup_logging(level: int = logging.INFO, fmt: str = DEFAULT_LOG_FORMAT) -> None:
+    """
+    配置 root logger：QueueHandler 入队 + 后台线程输出到 stderr
+
+    与 logging.basicConfig 一致，root logger 已有 handler 时不做任何修改；
+    进程退出时 atexit 停止监听线程并输出剩余记录。
+
+    Args:
+        level: root logger 级别
+        fmt: 控制台输出格式
+    """
+    global _listener
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter(fmt))
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, console, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
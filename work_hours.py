@@ -18,71 +18,67 @@ from utils.date_utils import to_local_date_str
 logger = logging.getLogger(__name__)
 
 
+_TASK_TYPE_DIFFICULTY: dict[str, float] = {
+    "Bug修复": 1.6,
+    "功能开发": 1.3,
+    "代码重构": 1.7,
+    "代码维护": 1.0,
+    "样式调整": 0.7,
+    "性能优化": 1.4,
+    "测试相关": 1.1,
+    "文档更新": 0.6,
+    "其他": 1.0,
+}
+# 规则上倾向：包含“联调/性能/优化/迁移/适配/权限/流程/富文本/图片”等更复杂内容时，提高倍率
+# （关键词均已小写，模块加载时定型，每条提交不再重建列表、逐个 lower）
+_DIFFICULTY_POSITIVE_KEYWORDS = (
+    "联调",
+    "性能",
+    "优化",
+    "重构",
+    "迁移",
+    "适配",
+    "兼容",
+    "回滚",
+    "revert",
+    "权限",
+    "安全",
+    "并发",
+    "事务",
+    "流程",
+    "审批",
+    "校验",
+    "富文本",
+    "富text",
+    "图片",
+    "日志",
+    "监控",
+    "埋点",
+    "多端",
+    "端适配",
+)
+# 规则上倾向：纯同步/忽略类提交难度较低
+_DIFFICULTY_NEGATIVE_KEYWORDS = (
+    "merge branch",
+    "同步",
+    "忽略",
+    "chore",
+    "cursor",
+    "insights",
+)
+
+
 def _get_task_difficulty_multiplier(task_type: str, task_name: str) -> float:
     """
     基于任务类型 + 关键词的难易度倍率（纯规则，避免依赖外部 AI）。
     返回值范围：0.5 ~ 2.0
     """
-    base_map: dict[str, float] = {
-        "Bug修复": 1.6,
-        "功能开发": 1.3,
-        "代码重构": 1.7,
-        "代码维护": 1.0,
-        "样式调整": 0.7,
-        "性能优化": 1.4,
-        "测试相关": 1.1,
-        "文档更新": 0.6,
-        "其他": 1.0,
-    }
-    base = base_map.get(task_type, 1.0)
+    base = _TASK_TYPE_DIFFICULTY.get(task_type, 1.0)
 
+    # 每个关键词独立计数（“适配”与“端适配”可同时命中），不能合并为一次正则查找
     name = (task_name or "").lower()
-    # 规则上倾向：包含“联调/性能/优化/迁移/适配/权限/流程/富文本/图片”等更复杂内容时，提高倍率
-    positive_keywords = [
-        "联调",
-        "性能",
-        "优化",
-        "重构",
-        "迁移",
-        "适配",
-        "兼容",
-        "回滚",
-        "revert",
-        "权限",
-        "安全",
-        "并发",
-        "事务",
-        "流程",
-        "审批",
-        "校验",
-        "富文本",
-        "富text",
-        "图片",
-        "日志",
-        "监控",
-        "埋点",
-        "多端",
-        "端适配",
-    ]
-    # 规则上倾向：纯同步/忽略类提交难度较低
-    negative_keywords = [
-        "merge branch",
-        "同步",
-        "忽略",
-        "chore",
-        "cursor",
-        "insights",
-    ]
-
-    bonus_hits = 0
-    for kw in positive_keywords:
-        if kw.lower() in name:
-            bonus_hits += 1
-
-    negative_hits = 0
-    for kw in negative_keywords:
-        if kw.lower() in name:
-            negative_hits += 1
+    bonus_hits = sum(kw in name for kw in _DIFFICULTY_POSITIVE_KEYWORDS)
+    negative_hits = sum(kw in name for kw in _DIFFICULTY_NEGATIVE_KEYWORDS)
 
     # 将“多关键词命中”转为倍率；同时对负面关键词做衰减。
     bonus = bonus_hits * 0.12
@@ -271,7 +267,7 @@ def calculate_work_hours(all_results, since_date=None, until_date=None,
                 commit_branch = '多分支'
 
             # 识别提交类型和任务名称（用于难易度规则）
-            first_line = commit_message.split('\n')[0] if commit_message else ""
+            first_line = commit_message.partition('\n')[0] if commit_message else ""
             task_type, _ = analyze_commit_type(commit_message)
             task_name = first_line
             multiplier = _get_task_difficulty_multiplier(task_type, task_name)